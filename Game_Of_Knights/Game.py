@@ -1,5 +1,7 @@
-from easyAI import AI_Player, Negamax, Human_Player
+from easyAI import AI_Player, Negamax
 from Knights import Knights
+from pondering import PonderingHuman, PonderingNegamax
+from symmetry import SymmetricTT
 
 
 def start_game(choice):
@@ -18,12 +20,13 @@ def start_game(choice):
     board_size = choose_board_size()
 
     if choice == "2":
-        ai_algo = Negamax(11)
+        ai_algo = Negamax(11, tt=SymmetricTT())
         game = Knights([AI_Player(ai_algo), AI_Player(ai_algo)], board_size)
         game.play()
     elif choice == "3":
-        ai_algo = Negamax(11)
-        game = Knights([Human_Player(), AI_Player(ai_algo)], board_size)
+        # The AI searches the human's possible replies while the human is thinking
+        ai_algo = PonderingNegamax(11, tt=SymmetricTT())
+        game = Knights([PonderingHuman(ai_algo), AI_Player(ai_algo)], board_size)
         game.play()
     else:
         print("Wrong choice!")
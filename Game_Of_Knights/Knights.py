@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 from easyAI import TwoPlayerGame
 
@@ -5,7 +7,7 @@ DIRECTIONS = list(map(np.array, [[1, 2], [-1, 2], [1, -2], [-1, -2],
                                  [2, 1], [2, -1], [-2, 1], [-2, -1]]))
 
 pos2string = lambda ab: "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[ab[0]] + str(ab[1] + 1)
-string2pos = lambda s: np.array(["ABCDEFGHIJKLMNOPQRSTUVWXYZ".index(s[0]), int(s[1]) - 1])
+string2pos = lambda s: np.array(["ABCDEFGHIJKLMNOPQRSTUVWXYZ".index(s[0]), int(s[1:]) - 1])
 
 
 class Knights(TwoPlayerGame):
@@ -69,6 +71,25 @@ class Knights(TwoPlayerGame):
         self.board[pi, pj] = self.current_player  # Ustawia gracza na nowej pozycji na planszy
         self.last_player = self.nplayer  # Zapisz, który gracz wykonał ostatni ruch
 
+    def copy(self):
+        """
+
+        Creates a copy of the game for the search. Only the board and the players' positions are copied;
+        the players' AI algorithms (and their transposition tables) are shared instead of deep-copied.
+
+        Returns:
+            Knights: A copy of the game
+        """
+        new = copy.copy(self)
+        new.board = self.board.copy()
+        new.players = [copy.copy(player) for player in self.players]
+        for player in new.players:
+            player.pos = player.pos.copy()
+        return new
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
     def ttentry(self):
         """
 
@@ -139,6 +160,7 @@ class Knights(TwoPlayerGame):
         """
 
         Score the game state for AI. A loss for the current player results in a negative score.
+        The score is computed in O(1) (at most 8 knight moves are checked), so caching it would not pay off.
 
         Returns:
             int: A negative score if the current player loses, otherwise 0.
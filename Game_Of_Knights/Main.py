@@ -1,5 +1,4 @@
-from Menu import show_menu, show_rules, choose_board_size
-from Game import start_game
+from Menu import show_menu, show_rules
 
 
 def main():
@@ -18,6 +17,8 @@ def main():
         if choice == "1":
             show_rules()
         elif choice == "2" or choice == "3":
+            # easyAI is imported only when a game is actually started
+            from Game import start_game
             start_game(choice)
         else:
             print("Nieprawidłowy wybór, spróbuj ponownie.")
@@ -0,0 +1,143 @@
+"""
+Pondering for Player vs AI games.
+
+While the human is thinking about a move, the AI searches the human's possible replies in a background
+thread: first the predicted reply (the move the AI's own search expected), then the remaining replies,
+each with iterative deepening. The results go to a transposition table shared with the AI's own search.
+When the human's move arrives, the background search is stopped and the AI's Negamax finds the position
+(and its subtree) already in the table, so the visible response time drops close to zero.
+"""
+
+import threading
+import time
+
+from easyAI import Human_Player, Negamax
+
+from symmetry import SymmetricTT
+
+
+class SearchStopped(Exception):
+    """Raised inside the background search when pondering has to stop."""
+
+
+class PonderingNegamax:
+    """
+    Negamax algorithm that keeps searching in a background thread during the opponent's turn.
+    """
+
+    def __init__(self, depth, tt=None):
+        """
+
+        Args:
+            depth (int): Search depth of the AI's moves
+            tt (SymmetricTT): Transposition table shared by the AI's search and the pondering
+        """
+        self.depth = depth
+        self.tt = tt if tt is not None else SymmetricTT()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_response_time = None
+
+    def __call__(self, game):
+        """
+
+        Stops pondering and returns the AI's best move.
+
+        Args:
+            game (Knights): Game with the AI to move
+
+        Returns:
+            str: The chosen move
+        """
+        self.stop()
+        start = time.perf_counter()
+        move = Negamax(self.depth, tt=self.tt)(game)
+        self.last_response_time = time.perf_counter() - start
+        return move
+
+    def start(self, game):
+        """
+
+        Starts pondering on the opponent's turn.
+
+        Args:
+            game (Knights): Game with the opponent to move
+        """
+        self.stop()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._ponder, args=(game.copy(),), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the background search and waits for the thread to finish."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _scoring(self, game):
+        """
+        Scoring of the background search: raises SearchStopped once the stop event is set, so the search
+        is interrupted at its next leaf without modifying the game.
+        """
+        if self.stop_event.is_set():
+            raise SearchStopped
+        return game.scoring()
+
+    def _ponder(self, game):
+        """Background search: iterative deepening, predicted reply first, then the remaining replies."""
+        replies = game.possible_moves()
+        entry = self.tt.lookup(game)
+        if entry is not None and entry["move"] in replies:
+            replies.remove(entry["move"])
+            replies.insert(0, entry["move"])
+
+        positions = []
+        for move in replies:
+            child = game.copy()
+            child.make_move(move)
+            child.switch_player()
+            if not child.is_over():
+                positions.append(child)
+
+        try:
+            # The predicted reply is searched to full depth first, the remaining replies afterwards
+            for group in (positions[:1], positions[1:]):
+                for depth in range(1, self.depth + 1):
+                    for position in group:
+                        Negamax(depth, scoring=self._scoring, tt=self.tt)(position)
+        except SearchStopped:
+            pass
+
+
+class PonderingHuman(Human_Player):
+    """
+    Human player that lets the AI ponder while waiting for the move typed in the console.
+    """
+
+    def __init__(self, ai_algo, name="Human"):
+        """
+
+        Args:
+            ai_algo (PonderingNegamax): Algorithm of the AI opponent
+            name (str): Name of the player
+        """
+        super().__init__(name)
+        self.ai_algo = ai_algo
+
+    def ask_move(self, game):
+        """
+
+        Starts pondering, asks for the move and stops pondering once it is entered.
+
+        Args:
+            game (Knights): Game with the human to move
+
+        Returns:
+            str: The human's move
+        """
+        self.ai_algo.start(game)
+        try:
+            return super().ask_move(game)
+        finally:
+            self.ai_algo.stop()
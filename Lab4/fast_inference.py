@@ -0,0 +1,293 @@
+"""
+Low-latency inference path for the Lab4 classifiers.
+
+A trained DecisionTreeClassifier is compiled into flat NumPy arrays (feature, threshold, children, leaf
+class) that are traversed level by level without per-node branching, and a trained SVC is reduced to its
+support vectors, dual coefficients and precomputed kernel data. Both accept raw float vectors and batches
+of them, so no pandas DataFrame has to be built for a single sample.
+
+Authors: Henryk Mudlaff and Benedykt Borowski
+"""
+
+import time
+
+import numpy as np
+
+
+class CompiledDecisionTree:
+    """
+    Decision tree flattened into NumPy arrays.
+
+    Leaves point to themselves and have an infinite threshold, so every sample can be pushed down the tree
+    exactly max_depth times with np.where, without checking which samples already reached a leaf.
+    """
+
+    def __init__(self, classifier):
+        """
+        Compile a trained Decision Tree Classifier
+
+        Parameters:
+        classifier (DecisionTreeClassifier): Trained classifier
+        """
+        tree = classifier.tree_
+        node_ids = np.arange(tree.node_count)
+        is_leaf = tree.children_left == -1
+
+        self.feature = np.where(is_leaf, 0, tree.feature).astype(np.intp)
+        self.threshold = np.where(is_leaf, np.inf, tree.threshold).astype(np.float64)
+        self.left = np.where(is_leaf, node_ids, tree.children_left).astype(np.intp)
+        self.right = np.where(is_leaf, node_ids, tree.children_right).astype(np.intp)
+        self.leaf_class = np.asarray(classifier.classes_)[tree.value[:, 0, :].argmax(axis=1)]
+        self.max_depth = int(tree.max_depth)
+
+        # Python lists are faster than NumPy indexing for a single sample
+        self._feature = self.feature.tolist()
+        self._threshold = self.threshold.tolist()
+        self._left = self.left.tolist()
+        self._right = self.right.tolist()
+        self._leaf = is_leaf.tolist()
+
+    def predict(self, X):
+        """
+        Predict classes for a batch of samples
+
+        Parameters:
+        X (np.array): 2D array of shape (n_samples, n_features)
+
+        Returns:
+        np.array: Predicted class labels
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        rows = np.arange(X.shape[0])
+        node = np.zeros(X.shape[0], dtype=np.intp)
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.leaf_class[node]
+
+    def predict_one(self, sample):
+        """
+        Predict the class of a single sample
+
+        Parameters:
+        sample (list or np.array): Sample feature values
+
+        Returns:
+        Predicted class label
+        """
+        node = 0
+        while not self._leaf[node]:
+            if sample[self._feature[node]] <= self._threshold[node]:
+                node = self._left[node]
+            else:
+                node = self._right[node]
+        return self.leaf_class[node]
+
+
+class CompiledSVC:
+    """
+    SVC reduced to support vectors, dual coefficients and precomputed kernel data.
+
+    Binary models use the sign of the decision function, multiclass models use the same one-vs-one voting
+    as libsvm (ties go to the class with the lower index).
+    """
+
+    def __init__(self, classifier):
+        """
+        Compile a trained SVM Classifier
+
+        Parameters:
+        classifier (SVC): Trained classifier with a linear, poly, rbf or sigmoid kernel
+        """
+        if classifier.kernel not in ("linear", "poly", "rbf", "sigmoid"):
+            raise ValueError(f"Unsupported kernel: {classifier.kernel}")
+        self.kernel = classifier.kernel
+        self.gamma = float(getattr(classifier, "_gamma", classifier.gamma))
+        self.coef0 = float(classifier.coef0)
+        self.degree = int(classifier.degree)
+        self.classes = np.asarray(classifier.classes_)
+
+        self.support_vectors = np.ascontiguousarray(classifier.support_vectors_, dtype=np.float64)
+        self.sv_norms = np.einsum("ij,ij->i", self.support_vectors, self.support_vectors)
+        self.dual_coef = np.asarray(classifier.dual_coef_, dtype=np.float64)
+        self.intercept = np.asarray(classifier.intercept_, dtype=np.float64)
+
+        # Support vector ranges of every class (libsvm groups them by class)
+        n_support = np.asarray(classifier.n_support_)
+        self.sv_start = np.concatenate([[0], np.cumsum(n_support)])
+
+        # Precomputed one-vs-one pairs: weights over all support vectors for every pair of classes
+        n_classes = len(self.classes)
+        pairs, weights = [], []
+        for i in range(n_classes):
+            for j in range(i + 1, n_classes):
+                weight = np.zeros(len(self.support_vectors))
+                si = slice(self.sv_start[i], self.sv_start[i + 1])
+                sj = slice(self.sv_start[j], self.sv_start[j + 1])
+                weight[si] = self.dual_coef[j - 1, si]
+                weight[sj] = self.dual_coef[i, sj]
+                pairs.append((i, j))
+                weights.append(weight)
+        self.pairs = np.array(pairs, dtype=np.intp).reshape(-1, 2)
+        self.pair_weights = np.array(weights).reshape(len(pairs), -1)
+
+    def kernel_matrix(self, X):
+        """
+        Compute the kernel between samples and support vectors
+
+        Parameters:
+        X (np.array): 2D array of shape (n_samples, n_features)
+
+        Returns:
+        np.array: Kernel matrix of shape (n_samples, n_support_vectors)
+        """
+        dot = X @ self.support_vectors.T
+        if self.kernel == "linear":
+            return dot
+        if self.kernel == "poly":
+            return (self.gamma * dot + self.coef0) ** self.degree
+        if self.kernel == "sigmoid":
+            return np.tanh(self.gamma * dot + self.coef0)
+        sq_dist = np.einsum("ij,ij->i", X, X)[:, np.newaxis] - 2.0 * dot + self.sv_norms
+        return np.exp(-self.gamma * np.maximum(sq_dist, 0.0))
+
+    def decision_function(self, X):
+        """
+        Compute one-vs-one decision values
+
+        Parameters:
+        X (np.array): 2D array of shape (n_samples, n_features)
+
+        Returns:
+        np.array: Decision values of shape (n_samples, n_pairs)
+        """
+        if len(self.classes) == 2:
+            return (self.kernel_matrix(X) @ self.dual_coef[0] + self.intercept[0])[:, np.newaxis]
+        return self.kernel_matrix(X) @ self.pair_weights.T + self.intercept
+
+    def predict(self, X):
+        """
+        Predict classes for a batch of samples
+
+        Parameters:
+        X (np.array): 2D array of shape (n_samples, n_features)
+
+        Returns:
+        np.array: Predicted class labels
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        decision = self.decision_function(X)
+        if len(self.classes) == 2:
+            return self.classes[(decision[:, 0] > 0).astype(np.intp)]
+
+        winners = np.where(decision > 0, self.pairs[:, 0], self.pairs[:, 1])
+        votes = np.zeros((X.shape[0], len(self.classes)), dtype=np.intp)
+        for column in range(winners.shape[1]):
+            votes[np.arange(X.shape[0]), winners[:, column]] += 1
+        return self.classes[votes.argmax(axis=1)]
+
+    def predict_one(self, sample):
+        """
+        Predict the class of a single sample
+
+        Parameters:
+        sample (list or np.array): Sample feature values
+
+        Returns:
+        Predicted class label
+        """
+        return self.predict(np.asarray(sample, dtype=np.float64)[np.newaxis, :])[0]
+
+
+def compile_classifier(classifier):
+    """
+    Compile a trained classifier for fast inference
+
+    Parameters:
+    classifier: Trained DecisionTreeClassifier or SVC
+
+    Returns:
+    CompiledDecisionTree or CompiledSVC: Compiled classifier
+    """
+    from sklearn import svm
+    from sklearn.tree import DecisionTreeClassifier
+
+    if isinstance(classifier, DecisionTreeClassifier):
+        return CompiledDecisionTree(classifier)
+    if isinstance(classifier, svm.SVC):
+        return CompiledSVC(classifier)
+    raise TypeError(f"Unsupported classifier type: {type(classifier).__name__}")
+
+
+def measure_latency(predict, sample, repeats=2000):
+    """
+    Measure the average latency of a prediction function
+
+    Parameters:
+    predict (callable): Function taking one sample
+    sample (list or np.array): Sample passed to the function
+    repeats (int): Number of calls
+
+    Returns:
+    float: Average latency in microseconds
+    """
+    predict(sample)  # Warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        predict(sample)
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def benchmark_classify_sample(classifier, sample, feature_names, repeats=2000):
+    """
+    Compare per-sample latency of classify_sample with the compiled inference path
+
+    Parameters:
+    classifier: Trained classifier
+    sample (list or np.array): Sample input data to classify
+    feature_names (list): List of feature names for the sample
+    repeats (int): Number of calls for each variant
+
+    Returns:
+    dict: Average latency in microseconds for "dataframe", "compiled" and "compiled_batch" (per sample)
+    """
+    from main import classify_sample
+
+    compiled = compile_classifier(classifier)
+    batch = np.tile(np.asarray(sample, dtype=np.float64), (1000, 1))
+    batch_repeats = max(1, repeats // 100)
+
+    return {
+        "dataframe": measure_latency(lambda s: classify_sample(classifier, s, feature_names), sample, repeats),
+        "compiled": measure_latency(compiled.predict_one, sample, repeats),
+        "compiled_batch": measure_latency(compiled.predict, batch, batch_repeats) / len(batch),
+    }
+
+
+def main():
+    """
+    Micro-benchmark of single-sample inference on the Pima Indians Diabetes Dataset
+    """
+    from main import load_dataset, split_features_target, train_decision_tree, train_svm_classifier
+
+    url_pima = "https://raw.githubusercontent.com/jbrownlee/Datasets/master/pima-indians-diabetes.data.csv"
+    column_names_pima = ["Pregnancies", "Glucose", "BloodPressure", "SkinThickness", "Insulin", "BMI", "DiabetesPedigreeFunction", "Age", "Outcome"]
+    X, y = split_features_target(load_dataset(url_pima, column_names_pima), "Outcome")
+    sample = [6, 148, 72, 35, 0, 33.6, 0.627, 50]
+
+    for name, classifier in (("Decision Tree", train_decision_tree(X, y)), ("SVM", train_svm_classifier(X, y))):
+        compiled = compile_classifier(classifier)
+        agreement = np.mean(compiled.predict(X.to_numpy()) == classifier.predict(X))
+        latency = benchmark_classify_sample(classifier, sample, column_names_pima[:-1])
+        print(f"\n{name}: agreement with sklearn = {agreement:.3f}")
+        print(f"  classify_sample (DataFrame): {latency['dataframe']:.1f} us/sample")
+        print(f"  compiled predict_one:        {latency['compiled']:.1f} us/sample")
+        print(f"  compiled batch predict:      {latency['compiled_batch']:.3f} us/sample")
+
+
+if __name__ == "__main__":
+    main()
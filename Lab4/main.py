@@ -8,25 +8,28 @@ Authors: Henryk Mudlaff and Benedykt Borowski
 """
 
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.model_selection import train_test_split
-from sklearn.tree import DecisionTreeClassifier
-from sklearn import svm
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from dataset_cache import DatasetCache
+from fast_inference import compile_classifier
+from model_registry import ModelRegistry
+from visualization import is_headless, plot_dataset_async
 
-def load_dataset(url, column_names):
+def load_dataset(url, column_names, cache=None):
     """
-    Load a dataset from a given URL
+    Load a dataset from a given URL, using the local dataset cache
+
+    The dataset is downloaded only on the first run, later runs read the cached binary copy.
 
     Parameters:
     url (str): URL to the dataset
     column_names (list): List of column names for the dataset
+    cache (DatasetCache): Cache to use (default cache if None)
 
     Returns:
     DataFrame: Loaded dataset as a pandas DataFrame
     """
-    return pd.read_csv(url, names=column_names)
+    if cache is None:
+        cache = DatasetCache()
+    return cache.get(url, column_names)
 
 def split_features_target(df, target_column):
     """
@@ -44,33 +47,45 @@ def split_features_target(df, target_column):
     y = df[target_column]
     return X, y
 
-def train_decision_tree(X_train, y_train):
+def train_decision_tree(X_train, y_train, registry=None, name=None):
     """
     Train a Decision Tree Classifier
 
     Parameters:
     X_train (DataFrame): Training features
     y_train (Series): Training target values
+    registry (ModelRegistry): If given, reuse a stored model trained on the same data
+    name (str): Model name in the registry
 
     Returns:
     DecisionTreeClassifier: Trained Decision Tree Classifier
     """
+    from sklearn.tree import DecisionTreeClassifier
+
     classifier = DecisionTreeClassifier()
+    if registry is not None:
+        return registry.fit(name or "decision_tree", classifier, X_train, y_train)
     classifier.fit(X_train, y_train)
     return classifier
 
-def train_svm_classifier(X_train, y_train):
+def train_svm_classifier(X_train, y_train, registry=None, name=None):
     """
     Train a Support Vector Machine (SVM) Classifier
 
     Parameters:
     X_train (DataFrame): Training features
     y_train (Series): Training target values
+    registry (ModelRegistry): If given, reuse a stored model trained on the same data
+    name (str): Model name in the registry
 
     Returns:
     SVC: Trained SVM Classifier
     """
+    from sklearn import svm
+
     classifier = svm.SVC()
+    if registry is not None:
+        return registry.fit(name or "svm", classifier, X_train, y_train)
     classifier.fit(X_train, y_train)
     return classifier
 
@@ -86,21 +101,32 @@ def evaluate_classifier(classifier, X_test, y_test):
     Returns:
     None
     """
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
     y_pred = classifier.predict(X_test)
     print("Accuracy Score:", accuracy_score(y_test, y_pred))
     print("Classification Report:\n", classification_report(y_test, y_pred))
     print("Confusion Matrix:\n", confusion_matrix(y_test, y_pred))
 
-def visualize_data(df):
+def visualize_data(df, output_path=None, sample_size=None):
     """
     Visualize the dataset using histograms for each feature
 
+    In headless mode (output_path given, LAB4_HEADLESS set or no display) the histograms are
+    rendered to a file on a background thread and the function returns immediately.
+
     Parameters:
     df (DataFrame): Dataset as a pandas DataFrame
+    output_path (str): Path of the output image for headless mode
+    sample_size (int): If given, plot a random sample of this many rows
 
     Returns:
-    None
+    Future or None: Future of the rendered file in headless mode, otherwise None
     """
+    if output_path is not None or is_headless():
+        return plot_dataset_async(df, output_path or "histograms.png", sample_size=sample_size)
+    import matplotlib.pyplot as plt
+
     df.hist(bins=15, figsize=(15, 10))
     plt.tight_layout()
     plt.show()
@@ -109,14 +135,19 @@ def classify_sample(classifier, sample, feature_names):
     """
     Classify a given sample using the trained classifier
 
+    Compiled classifiers (see fast_inference.compile_classifier) take the raw sample directly,
+    without building a DataFrame.
+
     Parameters:
-    classifier: Trained classifier
+    classifier: Trained classifier or compiled classifier
     sample (list or np.array): Sample input data to classify
     feature_names (list): List of feature names for the sample
 
     Returns:
     int: Predicted class label
     """
+    if hasattr(classifier, "predict_one"):
+        return classifier.predict_one(sample)
     sample_df = pd.DataFrame([sample], columns=feature_names)
     return classifier.predict(sample_df)[0]
 
@@ -124,13 +155,16 @@ def main():
     """
     Main function to execute classification tasks using Decision Tree and SVM
     """
+    from sklearn.model_selection import train_test_split
+
     # Load the first dataset (Pima Indians Diabetes Dataset)
     url_pima = "https://raw.githubusercontent.com/jbrownlee/Datasets/master/pima-indians-diabetes.data.csv"
     column_names_pima = ["Pregnancies", "Glucose", "BloodPressure", "SkinThickness", "Insulin", "BMI", "DiabetesPedigreeFunction", "Age", "Outcome"]
     df_pima = load_dataset(url_pima, column_names_pima)
+    registry = ModelRegistry()
 
     # Visualize the dataset
-    visualize_data(df_pima)
+    plots = [visualize_data(df_pima, "pima_histograms.png" if is_headless() else None)]
 
     # Split dataset into features and target
     target_column = "Outcome"
@@ -139,13 +173,16 @@ def main():
 
     # Train and evaluate Decision Tree Classifier
     print("\nDecision Tree Classifier (Pima Indians Dataset):")
-    decision_tree_classifier = train_decision_tree(X_train, y_train)
+    decision_tree_classifier = train_decision_tree(X_train, y_train, registry, "pima_decision_tree")
     evaluate_classifier(decision_tree_classifier, X_test, y_test)
+    # Compile once after training (or loading from the registry) and reuse it for every sample
+    compiled_decision_tree = compile_classifier(decision_tree_classifier)
 
     # Train and evaluate SVM Classifier
     print("\nSVM Classifier (Pima Indians Dataset):")
-    svm_classifier = train_svm_classifier(X_train, y_train)
+    svm_classifier = train_svm_classifier(X_train, y_train, registry, "pima_svm")
     evaluate_classifier(svm_classifier, X_test, y_test)
+    compiled_svm = compile_classifier(svm_classifier)
 
     # Load the second dataset (Iris Flowers Dataset)
     url_iris = "https://raw.githubusercontent.com/jbrownlee/Datasets/master/iris.csv"
@@ -153,7 +190,7 @@ def main():
     df_iris = load_dataset(url_iris, column_names_iris)
 
     # Visualize the Iris dataset
-    visualize_data(df_iris)
+    plots.append(visualize_data(df_iris, "iris_histograms.png" if is_headless() else None))
 
     # Split Iris dataset into features and target
     target_column_iris = "class"
@@ -162,18 +199,23 @@ def main():
 
     # Train and evaluate Decision Tree Classifier on Iris Dataset
     print("\nDecision Tree Classifier (Iris Dataset):")
-    decision_tree_classifier_iris = train_decision_tree(X_train_iris, y_train_iris)
+    decision_tree_classifier_iris = train_decision_tree(X_train_iris, y_train_iris, registry, "iris_decision_tree")
     evaluate_classifier(decision_tree_classifier_iris, X_test_iris, y_test_iris)
 
     # Train and evaluate SVM Classifier on Iris Dataset
     print("\nSVM Classifier (Iris Dataset):")
-    svm_classifier_iris = train_svm_classifier(X_train_iris, y_train_iris)
+    svm_classifier_iris = train_svm_classifier(X_train_iris, y_train_iris, registry, "iris_svm")
     evaluate_classifier(svm_classifier_iris, X_test_iris, y_test_iris)
 
     # Classify a sample input using both classifiers
     sample = [6, 148, 72, 35, 0, 33.6, 0.627, 50]  # Sample data from Pima Indians dataset
-    print("\nSample Classification using Decision Tree (Pima Indians Dataset):", classify_sample(decision_tree_classifier, sample, column_names_pima[:-1]))
-    print("Sample Classification using SVM (Pima Indians Dataset):", classify_sample(svm_classifier, sample, column_names_pima[:-1]))
+    print("\nSample Classification using Decision Tree (Pima Indians Dataset):", classify_sample(compiled_decision_tree, sample, column_names_pima[:-1]))
+    print("Sample Classification using SVM (Pima Indians Dataset):", classify_sample(compiled_svm, sample, column_names_pima[:-1]))
+
+    # Wait for the histograms rendered in the background
+    for plot in plots:
+        if plot is not None:
+            print("Histograms saved to:", plot.result())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,178 @@
+"""
+Model registry with warm start for the Lab4 classifiers.
+
+Trained models are serialized with joblib together with their feature schema, hyperparameters and a hash
+of the training data. When the same classifier is requested again for unchanged data and hyperparameters,
+it is loaded from disk instead of being retrained. Models are stored uncompressed, so large NumPy arrays
+inside them (e.g. SVC support vectors) are memory mapped on load and shared between worker processes.
+
+Authors: Henryk Mudlaff and Benedykt Borowski
+"""
+
+import hashlib
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+DEFAULT_REGISTRY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_registry")
+REGISTRY_DIR_ENV = "LAB4_MODEL_REGISTRY"
+
+
+def feature_schema(X):
+    """
+    Describe the features of a training set
+
+    Parameters:
+    X (DataFrame or np.array): Training features
+
+    Returns:
+    list: List of [column name, dtype] pairs
+    """
+    if isinstance(X, pd.DataFrame):
+        return [[str(name), str(dtype)] for name, dtype in X.dtypes.items()]
+    X = np.asarray(X)
+    return [[str(i), str(X.dtype)] for i in range(X.shape[1])]
+
+
+def data_hash(X, y):
+    """
+    Compute a hash of training features and targets
+
+    Parameters:
+    X (DataFrame or np.array): Training features
+    y (Series or np.array): Training target values
+
+    Returns:
+    str: SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in (X, y):
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+        else:
+            array = np.ascontiguousarray(part)
+            digest.update(str(array.dtype).encode())
+            digest.update(array.tobytes())
+    digest.update(json.dumps(feature_schema(X)).encode())
+    return digest.hexdigest()
+
+
+def params_hash(estimator):
+    """
+    Compute a hash of the estimator type and hyperparameters
+
+    Parameters:
+    estimator: Unfitted scikit-learn estimator
+
+    Returns:
+    str: SHA-256 hex digest
+    """
+    params = {"type": type(estimator).__name__, "params": estimator.get_params(deep=True)}
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+class ModelRegistry:
+    """
+    Registry of trained models stored on disk.
+
+    Every entry consists of a joblib file with the model and a JSON file with the metadata. The registry
+    directory defaults to ``Lab4/.model_registry`` and can be changed with LAB4_MODEL_REGISTRY.
+    """
+
+    def __init__(self, registry_dir=None, mmap_mode="r"):
+        """
+        Initialize the registry
+
+        Parameters:
+        registry_dir (str): Directory holding the stored models
+        mmap_mode (str): Memory mapping mode for model arrays (None loads them into memory)
+        """
+        self.registry_dir = registry_dir or os.environ.get(REGISTRY_DIR_ENV, DEFAULT_REGISTRY_DIR)
+        self.mmap_mode = mmap_mode
+
+    def _paths(self, name, key):
+        base = os.path.join(self.registry_dir, f"{name}-{key[:16]}")
+        return base + ".joblib", base + ".json"
+
+    def model_key(self, estimator, X, y):
+        """
+        Build the registry key of an estimator trained on the given data
+
+        Parameters:
+        estimator: Unfitted scikit-learn estimator
+        X (DataFrame or np.array): Training features
+        y (Series or np.array): Training target values
+
+        Returns:
+        str: Registry key
+        """
+        return hashlib.sha256((params_hash(estimator) + data_hash(X, y)).encode()).hexdigest()
+
+    def save(self, name, key, model, X):
+        """
+        Store a trained model in the registry
+
+        Parameters:
+        name (str): Model name
+        key (str): Registry key (see model_key)
+        model: Trained model
+        X (DataFrame or np.array): Training features (used for the feature schema)
+        """
+        os.makedirs(self.registry_dir, exist_ok=True)
+        model_path, meta_path = self._paths(name, key)
+        tmp_path = model_path + ".tmp"
+        joblib.dump(model, tmp_path, compress=0)
+        os.replace(tmp_path, model_path)
+
+        meta = {
+            "name": name,
+            "key": key,
+            "type": type(model).__name__,
+            "params": {k: repr(v) for k, v in model.get_params().items()},
+            "features": feature_schema(X),
+        }
+        with open(meta_path, "w") as file:
+            json.dump(meta, file, indent=2)
+
+    def load(self, name, key):
+        """
+        Load a model from the registry
+
+        Parameters:
+        name (str): Model name
+        key (str): Registry key
+
+        Returns:
+        Trained model or None if it is not stored
+        """
+        model_path, meta_path = self._paths(name, key)
+        if not (os.path.exists(model_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, "r") as file:
+            if json.load(file).get("key") != key:
+                return None
+        return joblib.load(model_path, mmap_mode=self.mmap_mode)
+
+    def fit(self, name, estimator, X, y):
+        """
+        Return a trained model, reusing the stored one if data and hyperparameters are unchanged
+
+        Parameters:
+        name (str): Model name
+        estimator: Unfitted scikit-learn estimator
+        X (DataFrame or np.array): Training features
+        y (Series or np.array): Training target values
+
+        Returns:
+        Trained model
+        """
+        key = self.model_key(estimator, X, y)
+        model = self.load(name, key)
+        if model is not None:
+            return model
+        estimator.fit(X, y)
+        self.save(name, key, estimator, X)
+        return estimator
@@ -0,0 +1,327 @@
+"""
+Out-of-core training for the Lab4 classification project.
+
+load_dataset reads the whole CSV into memory and svm.SVC is quadratic in the number of rows, so neither
+scales past a few hundred thousand rows. This module streams a CSV file with pd.read_csv(chunksize=...)
+and trains models that support partial_fit: a linear SVM (SGDClassifier with hinge loss), an approximate
+RBF-kernel SVM (random Fourier features from RBFSampler followed by the same linear SVM) and incremental
+Gaussian naive Bayes. Rows are assigned to the train or test split by a hash of their row number, so no
+shuffled copy of the dataset is needed. The first pass fits the feature scaler and collects the class
+labels, the next passes train, and the last pass accumulates a confusion matrix. Memory use is bounded by
+the chunk size, independent of the number of rows.
+
+Usage:
+    python streaming.py data.csv --target Outcome --model rff --chunk-size 100000 --epochs 3
+
+Authors: Henryk Mudlaff and Benedykt Borowski
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from visualization import DEFAULT_CHUNK_SIZE, iter_chunks
+
+MODELS = ("sgd", "rff", "nb")
+
+
+def test_mask(row_ids, test_fraction=0.2, seed=42):
+    """
+    Assign rows to the test split by hashing their row numbers
+
+    The assignment is deterministic, so every pass over the file sees the same split.
+
+    Parameters:
+    row_ids (np.array): Row numbers in the file
+    test_fraction (float): Expected fraction of test rows
+    seed (int): Seed mixed into the hash
+
+    Returns:
+    np.array: Boolean mask of the test rows
+    """
+    h = (row_ids.astype(np.uint64) + np.uint64(seed)) * np.uint64(0x9E3779B97F4A7C15)
+    h ^= h >> np.uint64(29)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(32)
+    return (h % np.uint64(1 << 20)) < np.uint64(int(test_fraction * (1 << 20)))
+
+
+def iter_rows(source, target_column, chunk_size=DEFAULT_CHUNK_SIZE, column_names=None, test_fraction=0.2, seed=42):
+    """
+    Iterate over all rows of a CSV file in chunks, together with their split assignment
+
+    Parameters:
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    target_column (str): Column name for target variable
+    chunk_size (int): Number of rows per chunk
+    column_names (list): Column names for CSV files without a header
+    test_fraction (float): Expected fraction of test rows
+    seed (int): Seed of the split
+
+    Returns:
+    generator: Triples (X, y, is_test) of float64 feature arrays, label arrays and test masks
+    """
+    offset = 0
+    for chunk in iter_chunks(source, chunk_size, column_names):
+        row_ids = np.arange(offset, offset + len(chunk))
+        offset += len(chunk)
+        X = chunk.drop(columns=[target_column]).to_numpy(dtype=np.float64)
+        yield X, chunk[target_column].to_numpy(), test_mask(row_ids, test_fraction, seed)
+
+
+def iter_split(source, target_column, subset, chunk_size=DEFAULT_CHUNK_SIZE, column_names=None,
+               test_fraction=0.2, seed=42):
+    """
+    Iterate over one split of a CSV file in chunks
+
+    Parameters:
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    target_column (str): Column name for target variable
+    subset (str): "train" or "test"
+    chunk_size (int): Number of rows per chunk
+    column_names (list): Column names for CSV files without a header
+    test_fraction (float): Expected fraction of test rows
+    seed (int): Seed of the split
+
+    Returns:
+    generator: Pairs (X, y) of float64 feature arrays and label arrays
+    """
+    for X, y, is_test in iter_rows(source, target_column, chunk_size, column_names, test_fraction, seed):
+        mask = is_test if subset == "test" else ~is_test
+        if mask.any():
+            yield X[mask], y[mask]
+
+
+class StreamingClassifier:
+    """
+    Classifier trained chunk by chunk with partial_fit.
+
+    Features are standardized with a StandardScaler fitted in a separate first pass, so every training chunk
+    is scaled with the statistics of the whole training split.
+    """
+
+    def __init__(self, model="sgd", n_components=500, gamma=None, alpha=1e-4, seed=42):
+        """
+        Create an untrained streaming classifier
+
+        Parameters:
+        model (str): "sgd" (linear SVM), "rff" (RBF kernel SVM approximated by random Fourier features)
+                     or "nb" (Gaussian naive Bayes)
+        n_components (int): Number of random Fourier features for "rff"
+        gamma (float): RBF kernel coefficient for "rff" (default 1 / number of features, like svm.SVC)
+        alpha (float): Regularization strength of the linear SVM
+        seed (int): Seed of the random features and of the SGD shuffling
+        """
+        if model not in MODELS:
+            raise ValueError(f"Unknown model {model!r}, expected one of {MODELS}")
+        self.model = model
+        self.n_components = n_components
+        self.gamma = gamma
+        self.alpha = alpha
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+        self.scaler = None
+        self.features = None
+        self.estimator = None
+        self.classes_ = None
+
+    def fit_scaler(self, chunks):
+        """
+        First pass: fit the feature scaler on the training rows and collect the class labels of all rows
+
+        Labels are collected from the test rows as well, so a class that only occurs in the test split is
+        still known to the model and to the confusion matrix.
+
+        Parameters:
+        chunks (iterable): Triples (X, y, is_test) from iter_rows
+        """
+        from sklearn.preprocessing import StandardScaler
+
+        self.scaler = StandardScaler()
+        classes = set()
+        for X, y, is_test in chunks:
+            if not is_test.all():
+                self.scaler.partial_fit(X[~is_test])
+            classes.update(np.unique(y).tolist())
+        self.classes_ = np.array(sorted(classes))
+        self._build_estimator(self.scaler.n_features_in_)
+        return self
+
+    def _build_estimator(self, n_features):
+        from sklearn.kernel_approximation import RBFSampler
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.naive_bayes import GaussianNB
+
+        if self.model == "nb":
+            self.estimator = GaussianNB()
+            return
+        if self.model == "rff":
+            gamma = self.gamma if self.gamma is not None else 1.0 / n_features
+            # RBFSampler only needs the number of features to draw its random weights
+            self.features = RBFSampler(gamma=gamma, n_components=self.n_components, random_state=self.seed)
+            self.features.fit(np.zeros((1, n_features)))
+        self.estimator = SGDClassifier(loss="hinge", alpha=self.alpha, random_state=self.seed)
+
+    def transform(self, X):
+        """
+        Scale the features (and map them to random Fourier features for "rff")
+
+        Parameters:
+        X (np.array): 2D array of shape (n_samples, n_features)
+
+        Returns:
+        np.array: Transformed features
+        """
+        X = self.scaler.transform(X)
+        return self.features.transform(X) if self.features is not None else X
+
+    def partial_fit(self, X, y):
+        """
+        Train on one chunk (rows are shuffled within the chunk for SGD)
+
+        Parameters:
+        X (np.array): Training features
+        y (np.array): Training target values
+
+        Returns:
+        StreamingClassifier: self
+        """
+        order = self.rng.permutation(len(y))
+        self.estimator.partial_fit(self.transform(X[order]), y[order], classes=self.classes_)
+        return self
+
+    def predict(self, X):
+        """
+        Predict classes for a batch of samples
+
+        Parameters:
+        X (np.array): 2D array of shape (n_samples, n_features)
+
+        Returns:
+        np.array: Predicted class labels
+        """
+        return self.estimator.predict(self.transform(np.asarray(X, dtype=np.float64)))
+
+
+def train_streaming(source, target_column, model="sgd", chunk_size=DEFAULT_CHUNK_SIZE, column_names=None,
+                    epochs=1, test_fraction=0.2, seed=42, **model_params):
+    """
+    Train a streaming classifier on the train split of a CSV file
+
+    Parameters:
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    target_column (str): Column name for target variable
+    model (str): "sgd", "rff" or "nb"
+    chunk_size (int): Number of rows per chunk
+    column_names (list): Column names for CSV files without a header
+    epochs (int): Number of training passes (naive Bayes needs only one)
+    test_fraction (float): Expected fraction of test rows
+    seed (int): Seed of the split and of the model
+    model_params: Further arguments of StreamingClassifier
+
+    Returns:
+    StreamingClassifier: Trained classifier
+    """
+    split = (chunk_size, column_names, test_fraction, seed)
+    classifier = StreamingClassifier(model, seed=seed, **model_params)
+    classifier.fit_scaler(iter_rows(source, target_column, *split))
+    for _ in range(1 if model == "nb" else epochs):
+        for X, y in iter_split(source, target_column, "train", *split):
+            classifier.partial_fit(X, y)
+    return classifier
+
+
+def evaluate_streaming(classifier, source, target_column, chunk_size=DEFAULT_CHUNK_SIZE, column_names=None,
+                       test_fraction=0.2, seed=42):
+    """
+    Evaluate a classifier on the test split of a CSV file in one streaming pass
+
+    Parameters:
+    classifier: Trained classifier with predict and classes_
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    target_column (str): Column name for target variable
+    chunk_size (int): Number of rows per chunk
+    column_names (list): Column names for CSV files without a header
+    test_fraction (float): Expected fraction of test rows
+    seed (int): Seed of the split
+
+    Returns:
+    tuple: Confusion matrix (rows are true classes, columns predicted classes) and the row labels:
+    classifier.classes_ followed by true labels unknown to the classifier, which get their own rows
+    """
+    classes = classifier.classes_
+    unseen = []
+    matrix = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    for X, y in iter_split(source, target_column, "test", chunk_size, column_names, test_fraction, seed):
+        known = np.isin(y, classes)
+        for label in np.unique(y[~known]).tolist():
+            if label not in unseen:
+                unseen.append(label)
+                matrix = np.vstack([matrix, np.zeros((1, len(classes)), dtype=np.int64)])
+        true = np.empty(len(y), dtype=np.intp)
+        true[known] = np.searchsorted(classes, y[known])
+        true[~known] = [len(classes) + unseen.index(label) for label in y[~known].tolist()]
+        predicted = np.searchsorted(classes, classifier.predict(X))
+        np.add.at(matrix, (true, predicted), 1)
+    return matrix, np.array(classes.tolist() + unseen)
+
+
+def report_from_confusion(matrix, classes):
+    """
+    Print accuracy, per-class precision/recall/F1 and the confusion matrix
+
+    Parameters:
+    matrix (np.array): Confusion matrix from evaluate_streaming (rows of unseen labels have no column)
+    classes (np.array): Row labels in matrix order
+
+    Returns:
+    float: Accuracy
+    """
+    total = matrix.sum()
+    n_predicted = matrix.shape[1]
+    accuracy = np.trace(matrix[:n_predicted]) / total if total else 0.0
+    true_positive = np.zeros(len(classes))
+    true_positive[:n_predicted] = np.diag(matrix[:n_predicted])
+    predicted_totals = np.zeros(len(classes))
+    predicted_totals[:n_predicted] = matrix.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.nan_to_num(true_positive / predicted_totals)
+        recall = np.nan_to_num(true_positive / matrix.sum(axis=1))
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+
+    print("Accuracy Score:", accuracy)
+    print(f"{'class':>16}{'precision':>11}{'recall':>9}{'f1-score':>10}{'support':>10}")
+    for label, p, r, f, support in zip(classes, precision, recall, f1, matrix.sum(axis=1)):
+        print(f"{str(label):>16}{p:>11.2f}{r:>9.2f}{f:>10.2f}{support:>10}")
+    print("Confusion Matrix:\n", matrix)
+    return accuracy
+
+
+def main():
+    """
+    Train and evaluate a streaming classifier on a CSV file given on the command line
+    """
+    parser = argparse.ArgumentParser(description="Out-of-core training of Lab4 classifiers on large CSV files.")
+    parser.add_argument("source", help="Path or URL of the CSV file")
+    parser.add_argument("--target", required=True, help="Name of the target column")
+    parser.add_argument("--columns", nargs="+", help="Column names for CSV files without a header")
+    parser.add_argument("--model", choices=MODELS, default="sgd")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--components", type=int, default=500, help="Random Fourier features for --model rff")
+    parser.add_argument("--test-fraction", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    split = dict(chunk_size=args.chunk_size, column_names=args.columns, test_fraction=args.test_fraction, seed=args.seed)
+    start = time.perf_counter()
+    classifier = train_streaming(args.source, args.target, args.model, epochs=args.epochs,
+                                 n_components=args.components, **split)
+    print(f"Trained {args.model} in {time.perf_counter() - start:.1f} s")
+    matrix, labels = evaluate_streaming(classifier, args.source, args.target, **split)
+    report_from_confusion(matrix, labels)
+
+
+if __name__ == "__main__":
+    main()
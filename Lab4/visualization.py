@@ -0,0 +1,203 @@
+"""
+Headless, non-blocking dataset visualization for the Lab4 classification project.
+
+Histograms are computed with vectorized binning (np.histogram with fixed bin edges) over streamed chunks,
+so a dataset never has to fit in memory: the first pass finds the range of every numeric column, the
+second pass accumulates the bin counts. Alternatively a uniform reservoir sample of fixed size can be used.
+The figures are rendered to files with the Agg backend on a background thread or process, so plotting
+does not block training.
+
+Authors: Henryk Mudlaff and Benedykt Borowski
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+HEADLESS_ENV = "LAB4_HEADLESS"
+DEFAULT_CHUNK_SIZE = 100_000
+
+_executors = {}
+
+
+def is_headless():
+    """
+    Check whether plots should be rendered to files instead of shown on screen
+
+    Returns:
+    bool: True if LAB4_HEADLESS is set or no display is available (X11/Wayland is checked only on Linux
+    and BSD, Windows and macOS always have a display)
+    """
+    if os.environ.get(HEADLESS_ENV, "").lower() in ("1", "true", "yes"):
+        return True
+    if not sys.platform.startswith(("linux", "freebsd", "openbsd", "netbsd")):
+        return False
+    return not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY")
+
+
+def iter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE, column_names=None):
+    """
+    Iterate over a dataset in chunks
+
+    Parameters:
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    chunk_size (int): Number of rows per chunk
+    column_names (list): Column names for CSV files without a header
+
+    Returns:
+    generator: DataFrames with at most chunk_size rows
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_size):
+            yield source.iloc[start:start + chunk_size]
+    else:
+        yield from pd.read_csv(source, names=column_names, chunksize=chunk_size)
+
+
+def streaming_histograms(chunks_factory, bins=15):
+    """
+    Compute histograms of all numeric columns over streamed chunks
+
+    Parameters:
+    chunks_factory (callable): Function returning a new iterator over the chunks (called twice)
+    bins (int): Number of bins per column
+
+    Returns:
+    dict: Column name -> (counts, bin edges)
+    """
+    minimum, maximum = {}, {}
+    for chunk in chunks_factory():
+        numeric = chunk.select_dtypes(include="number")
+        # np.fmin/np.fmax ignore NaN, so a chunk where a column is all NaN does not reset its range
+        for name, low in numeric.min().items():
+            minimum[name] = np.fmin(low, minimum.get(name, np.nan))
+        for name, high in numeric.max().items():
+            maximum[name] = np.fmax(high, maximum.get(name, np.nan))
+    minimum = {name: low for name, low in minimum.items() if not np.isnan(low)}
+
+    edges = {name: np.linspace(minimum[name], maximum[name] if maximum[name] > minimum[name] else minimum[name] + 1, bins + 1)
+             for name in minimum}
+    counts = {name: np.zeros(bins, dtype=np.int64) for name in minimum}
+    for chunk in chunks_factory():
+        for name in counts:
+            values = chunk[name].to_numpy(dtype=np.float64)
+            counts[name] += np.histogram(values[~np.isnan(values)], bins=edges[name])[0]
+    return {name: (counts[name], edges[name]) for name in counts}
+
+
+def reservoir_sample(chunks, size, seed=42):
+    """
+    Draw a uniform random sample of rows from streamed chunks
+
+    Every row gets a random key and the rows with the smallest keys are kept, which is equivalent to a
+    reservoir sample but works on whole chunks at once.
+
+    Parameters:
+    chunks (iterable): Iterable of DataFrames
+    size (int): Number of rows in the sample
+    seed (int): Seed of the random generator
+
+    Returns:
+    DataFrame: Sampled rows
+    """
+    rng = np.random.default_rng(seed)
+    sample, keys = None, np.empty(0)
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk))
+        merged = chunk if sample is None else pd.concat([sample, chunk], ignore_index=True)
+        keys = np.concatenate([keys, chunk_keys])
+        if len(keys) > size:
+            keep = np.argpartition(keys, size)[:size]
+            merged, keys = merged.iloc[keep].reset_index(drop=True), keys[keep]
+        sample = merged
+    return sample if sample is not None else pd.DataFrame()
+
+
+def render_histograms(histograms, output_path, figsize=(15, 10)):
+    """
+    Render precomputed histograms to an image file
+
+    Parameters:
+    histograms (dict): Column name -> (counts, bin edges)
+    output_path (str): Path of the output image
+    figsize (tuple): Figure size in inches
+
+    Returns:
+    str: Path of the output image
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    columns = max(1, math.ceil(math.sqrt(len(histograms))))
+    rows = max(1, math.ceil(len(histograms) / columns))
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    for index, (name, (counts, edges)) in enumerate(histograms.items()):
+        axis = figure.add_subplot(rows, columns, index + 1)
+        axis.stairs(counts, edges, fill=True)
+        axis.set_title(name)
+        axis.grid(True)
+    figure.tight_layout()
+    figure.savefig(output_path)
+    return output_path
+
+
+def plot_dataset(source, output_path, bins=15, sample_size=None, chunk_size=DEFAULT_CHUNK_SIZE, column_names=None):
+    """
+    Compute histograms of a dataset and render them to a file
+
+    Parameters:
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    output_path (str): Path of the output image
+    bins (int): Number of bins per column
+    sample_size (int): If given, use a reservoir sample of this many rows instead of all rows
+    chunk_size (int): Number of rows per chunk
+    column_names (list): Column names for CSV files without a header
+
+    Returns:
+    str: Path of the output image
+    """
+    def chunks_factory():
+        return iter_chunks(source, chunk_size, column_names)
+
+    if sample_size is not None:
+        sample = reservoir_sample(chunks_factory(), sample_size)
+        histograms = streaming_histograms(lambda: iter([sample]), bins)
+    else:
+        histograms = streaming_histograms(chunks_factory, bins)
+    return render_histograms(histograms, output_path)
+
+
+def get_executor(kind="thread"):
+    """
+    Return the shared background executor used for plotting
+
+    Parameters:
+    kind (str): "thread" or "process"
+
+    Returns:
+    Executor: Executor with a single worker
+    """
+    if kind not in _executors:
+        _executors[kind] = ThreadPoolExecutor(max_workers=1) if kind == "thread" else ProcessPoolExecutor(max_workers=1)
+    return _executors[kind]
+
+
+def plot_dataset_async(source, output_path, executor="thread", **kwargs):
+    """
+    Render dataset histograms to a file in the background
+
+    Parameters:
+    source (DataFrame or str): Dataset as a DataFrame or path/URL of a CSV file
+    output_path (str): Path of the output image
+    executor (str): "thread" or "process"
+    **kwargs: Additional arguments for plot_dataset
+
+    Returns:
+    Future: Future resolving to the path of the output image
+    """
+    return get_executor(executor).submit(plot_dataset, source, output_path, **kwargs)
@@ -0,0 +1,266 @@
+"""
+Ewaluacja offline systemu rekomendacji filmów.
+
+Dzieli oceny z ratings.csv na zbiór treningowy i testowy (leave-k-out albo podział czasowy), buduje
+rekomendacje dla wszystkich użytkowników i liczy precision@k, recall@k, NDCG@k oraz pokrycie katalogu.
+Metryki są liczone wektorowo dla wszystkich użytkowników naraz. Każdy backend rekomendacji jest
+uruchamiany na tym samym podziale z pomiarem czasu i szczytowego zużycia pamięci, dzięki czemu każdą
+zmianę wydajnościową w get_recommendations można porównać z bazową jakością rekomendacji.
+
+Uruchomienie:
+    python evaluation.py --split leave-k-out --holdout 3 --k 5
+    python evaluation.py --split time --test-fraction 0.2 --backends vectorized
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from main import get_recommendations, get_recommendations_batch, load_data
+
+RELEVANCE_THRESHOLD = 7
+
+
+# Podział leave-k-out
+def leave_k_out_split(ratings_df, k=3, seed=42):
+    """
+    Przenosi do zbioru testowego k losowych ocen każdego użytkownika, który ma ich więcej niż k.
+
+    Args:
+        ratings_df (DataFrame): DataFrame zawierający oceny użytkowników.
+        k (int): Liczba ocen odkładanych do zbioru testowego dla każdego użytkownika.
+        seed (int): Ziarno generatora liczb losowych.
+
+    Returns:
+        train_df (DataFrame): Oceny treningowe.
+        test_df (DataFrame): Oceny testowe.
+    """
+    rng = np.random.default_rng(seed)
+    shuffled = ratings_df.assign(_los=rng.random(len(ratings_df)))
+    rank = shuffled.groupby('user_id')['_los'].rank(method='first')
+    counts = shuffled.groupby('user_id')['user_id'].transform('size')
+    test_mask = (rank <= k) & (counts > k)
+    return ratings_df[~test_mask], ratings_df[test_mask]
+
+
+# Podział czasowy
+def time_split(ratings_df, test_fraction=0.2):
+    """
+    Przenosi do zbioru testowego najnowsze oceny każdego użytkownika. Plik ratings.csv nie zawiera
+    znaczników czasu, więc za kolejność czasową przyjmowana jest kolejność wierszy w pliku.
+
+    Args:
+        ratings_df (DataFrame): DataFrame zawierający oceny użytkowników.
+        test_fraction (float): Część ocen każdego użytkownika trafiająca do zbioru testowego.
+
+    Returns:
+        train_df (DataFrame): Oceny treningowe.
+        test_df (DataFrame): Oceny testowe.
+    """
+    position = ratings_df.groupby('user_id').cumcount()
+    counts = ratings_df.groupby('user_id')['user_id'].transform('size')
+    n_test = np.floor(counts * test_fraction).astype(int)
+    test_mask = position >= counts - n_test
+    return ratings_df[~test_mask], ratings_df[test_mask]
+
+
+# Macierz treningowa obejmująca wszystkich użytkowników i cały katalog
+def build_train_matrix(train_df, ratings_df):
+    """
+    Tworzy macierz user-item ze zbioru treningowego z wierszami dla wszystkich użytkowników (ID 1..N,
+    jak zakłada get_recommendations) i kolumnami dla wszystkich filmów występujących w ocenach.
+
+    Args:
+        train_df (DataFrame): Oceny treningowe.
+        ratings_df (DataFrame): Wszystkie oceny (wyznaczają zbiór użytkowników i filmów).
+
+    Returns:
+        user_movie_matrix (DataFrame): Macierz user-item z ocenami treningowymi.
+    """
+    users = np.arange(1, ratings_df['user_id'].max() + 1)
+    movies = np.sort(ratings_df['movie_id'].unique())
+    user_movie_matrix = train_df.pivot(index='user_id', columns='movie_id', values='rating')
+    return user_movie_matrix.reindex(index=users, columns=movies).fillna(0)
+
+
+# Backend pętlowy: oryginalna funkcja get_recommendations wywoływana dla każdego użytkownika
+def recommend_loop(user_similarity, user_movie_matrix, n):
+    """
+    Generuje rekomendacje dla wszystkich użytkowników, wywołując get_recommendations osobno dla każdego.
+
+    Args:
+        user_similarity (ndarray): Macierz podobieństwa między użytkownikami.
+        user_movie_matrix (DataFrame): Macierz user-item z ocenami.
+        n (int): Liczba rekomendacji dla każdego użytkownika.
+
+    Returns:
+        recommendations (ndarray): Macierz (liczba użytkowników, n) z ID filmów, uzupełniona wartościami -1.
+    """
+    recommendations = np.full((len(user_movie_matrix), n), -1, dtype=np.int64)
+    for row, user_id in enumerate(user_movie_matrix.index):
+        movie_ids = get_recommendations(user_id, user_similarity, user_movie_matrix, None, n)
+        recommendations[row, :len(movie_ids)] = movie_ids
+    return recommendations
+
+
+BACKENDS = {
+    'loop': recommend_loop,
+    'vectorized': get_recommendations_batch,
+}
+
+
+# Metryki rankingowe liczone dla wszystkich użytkowników naraz
+def ranking_metrics(recommendations, test_df, user_movie_matrix, threshold=RELEVANCE_THRESHOLD):
+    """
+    Liczy precision@k, recall@k, NDCG@k i pokrycie katalogu. Filmy istotne to filmy ze zbioru testowego
+    z oceną co najmniej równą progowi. Precision, recall i NDCG są uśredniane po użytkownikach, którzy
+    mają co najmniej jeden istotny film w zbiorze testowym.
+
+    Args:
+        recommendations (ndarray): Macierz (liczba użytkowników, k) z ID filmów (-1 oznacza brak).
+        test_df (DataFrame): Oceny testowe.
+        user_movie_matrix (DataFrame): Macierz user-item, której wiersze odpowiadają wierszom rekomendacji.
+        threshold (float): Minimalna ocena filmu istotnego.
+
+    Returns:
+        metrics (dict): Wartości metryk i liczba ocenianych użytkowników.
+    """
+    users = user_movie_matrix.index.to_numpy()
+    movies = user_movie_matrix.columns.to_numpy()
+    k = recommendations.shape[1]
+
+    relevant_df = test_df[test_df['rating'] >= threshold]
+    relevant = np.zeros((len(users), len(movies)), dtype=bool)
+    relevant[np.searchsorted(users, relevant_df['user_id']), np.searchsorted(movies, relevant_df['movie_id'])] = True
+
+    valid = recommendations >= 0
+    columns = np.searchsorted(movies, np.where(valid, recommendations, movies[0]))
+    hits = np.take_along_axis(relevant, columns, axis=1) & valid
+
+    n_relevant = relevant.sum(axis=1)
+    evaluated = n_relevant > 0
+    n_hits = hits.sum(axis=1)
+
+    discounts = 1.0 / np.log2(np.arange(2, k + 2))
+    dcg = hits @ discounts
+    idcg = np.concatenate([[0.0], np.cumsum(discounts)])[np.minimum(n_relevant, k)]
+
+    recommended = np.unique(recommendations[valid])
+    return {
+        f'precision@{k}': float((n_hits[evaluated] / k).mean()) if evaluated.any() else 0.0,
+        f'recall@{k}': float((n_hits[evaluated] / n_relevant[evaluated]).mean()) if evaluated.any() else 0.0,
+        f'ndcg@{k}': float((dcg[evaluated] / idcg[evaluated]).mean()) if evaluated.any() else 0.0,
+        'coverage': len(recommended) / len(movies),
+        'users': int(evaluated.sum()),
+    }
+
+
+# Pomiar czasu i pamięci backendu
+def profile_backend(backend, user_similarity, user_movie_matrix, n, repeat=3):
+    """
+    Uruchamia backend kilka razy i mierzy najkrótszy czas działania, a w osobnym przebiegu szczytowe
+    zużycie pamięci (tracemalloc spowalnia program, więc nie jest włączony podczas pomiaru czasu).
+
+    Args:
+        backend (callable): Funkcja (user_similarity, user_movie_matrix, n) -> macierz rekomendacji.
+        user_similarity (ndarray): Macierz podobieństwa między użytkownikami.
+        user_movie_matrix (DataFrame): Macierz user-item z ocenami.
+        n (int): Liczba rekomendacji dla każdego użytkownika.
+        repeat (int): Liczba pomiarów czasu.
+
+    Returns:
+        recommendations (ndarray): Rekomendacje z ostatniego przebiegu.
+        seconds (float): Najkrótszy czas działania w sekundach.
+        peak_bytes (int): Szczytowe zużycie pamięci w bajtach.
+    """
+    seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        recommendations = backend(user_similarity, user_movie_matrix, n)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    backend(user_similarity, user_movie_matrix, n)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return recommendations, seconds, peak_bytes
+
+
+# Porównanie backendów na jednym podziale danych
+def evaluate(ratings_df, split='leave-k-out', k=5, holdout=3, test_fraction=0.2, backends=None, seed=42,
+             threshold=RELEVANCE_THRESHOLD, repeat=3):
+    """
+    Dzieli oceny, buduje macierz treningową i podobieństwo użytkowników, a następnie uruchamia wybrane
+    backendy, licząc dla każdego metryki jakości, czas i pamięć.
+
+    Args:
+        ratings_df (DataFrame): DataFrame zawierający oceny użytkowników.
+        split (str): Rodzaj podziału: 'leave-k-out' albo 'time'.
+        k (int): Długość listy rekomendacji.
+        holdout (int): Liczba odkładanych ocen na użytkownika przy podziale leave-k-out.
+        test_fraction (float): Część ocen w zbiorze testowym przy podziale czasowym.
+        backends (list): Nazwy backendów z BACKENDS (domyślnie wszystkie).
+        seed (int): Ziarno podziału leave-k-out.
+        threshold (float): Minimalna ocena filmu istotnego.
+        repeat (int): Liczba pomiarów czasu.
+
+    Returns:
+        results (DataFrame): Wiersz z metrykami, czasem i pamięcią dla każdego backendu.
+    """
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    if split == 'leave-k-out':
+        train_df, test_df = leave_k_out_split(ratings_df, holdout, seed)
+    elif split == 'time':
+        train_df, test_df = time_split(ratings_df, test_fraction)
+    else:
+        raise ValueError(f"Nieznany podział: {split}")
+
+    user_movie_matrix = build_train_matrix(train_df, ratings_df)
+    user_similarity = cosine_similarity(user_movie_matrix)
+
+    rows = []
+    reference = None
+    for name in backends or list(BACKENDS):
+        recommendations, seconds, peak_bytes = profile_backend(BACKENDS[name], user_similarity,
+                                                               user_movie_matrix, k, repeat)
+        row = {'backend': name}
+        row.update(ranking_metrics(recommendations, test_df, user_movie_matrix, threshold))
+        row['czas_ms'] = seconds * 1000
+        row['pamiec_kb'] = peak_bytes / 1024
+        # Zgodność rekomendacji z pierwszym backendem (wszystkie backendy powinny dawać te same listy)
+        if reference is None:
+            reference = recommendations
+        row['zgodnosc'] = float((recommendations == reference).all(axis=1).mean())
+        rows.append(row)
+    return pd.DataFrame(rows).set_index('backend')
+
+
+def main():
+    """
+    Uruchamia ewaluację z parametrami z linii poleceń i wyświetla tabelę wyników.
+    """
+    parser = argparse.ArgumentParser(description="Ewaluacja offline systemu rekomendacji filmów.")
+    parser.add_argument('--split', choices=['leave-k-out', 'time'], default='leave-k-out')
+    parser.add_argument('--k', type=int, default=5, help="Długość listy rekomendacji")
+    parser.add_argument('--holdout', type=int, default=3, help="Odkładane oceny na użytkownika (leave-k-out)")
+    parser.add_argument('--test-fraction', type=float, default=0.2, help="Część ocen testowych (podział czasowy)")
+    parser.add_argument('--threshold', type=float, default=RELEVANCE_THRESHOLD, help="Minimalna ocena filmu istotnego")
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--repeat', type=int, default=3, help="Liczba pomiarów czasu")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    _, _, ratings_df = load_data()
+    results = evaluate(ratings_df, args.split, args.k, args.holdout, args.test_fraction, args.backends,
+                       args.seed, args.threshold, args.repeat)
+
+    print(f"Podział: {args.split}, k = {args.k}, próg istotności = {args.threshold}")
+    print(results.to_string(float_format=lambda value: f"{value:.4f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
 import pandas as pd
-from sklearn.cluster import KMeans
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 
@@ -48,6 +46,8 @@ def cluster_users(user_movie_matrix, n_clusters=5):
     Returns:
         cluster_labels (Series): Etykiety klastrów dla każdego użytkownika.
     """
+    from sklearn.cluster import KMeans
+
     kmeans = KMeans(n_clusters=n_clusters, random_state=42)
     cluster_labels = kmeans.fit_predict(user_movie_matrix)
     return cluster_labels
@@ -87,6 +87,33 @@ def get_recommendations(user_id, user_similarity, user_movie_matrix, movies_df,
     return recommendations
 
 
+# Rekomendacje dla wszystkich użytkowników naraz
+def get_recommendations_batch(user_similarity, user_movie_matrix, n=5):
+    """
+    Wektorowa wersja get_recommendations dla wszystkich użytkowników jednocześnie, dająca te same
+    rankingi: wynik filmu to suma ocen wszystkich użytkowników poza najbardziej podobnym (czyli zwykle
+    samym użytkownikiem), filmy ocenione przez użytkownika są pomijane, a remisy rozstrzyga kolejność kolumn.
+
+    Args:
+        user_similarity (ndarray): Macierz podobieństwa między użytkownikami.
+        user_movie_matrix (DataFrame): Macierz user-item z ocenami (wiersz i odpowiada użytkownikowi o ID i + 1).
+        n (int): Liczba rekomendacji dla każdego użytkownika.
+
+    Returns:
+        recommendations (ndarray): Macierz (liczba użytkowników, n) z ID filmów; -1 tam, gdzie brakuje kandydatów.
+    """
+    ratings = user_movie_matrix.to_numpy(dtype=np.float64)
+    most_similar = np.argsort(-user_similarity, axis=1)[:, 0]
+    scores = ratings.sum(axis=0)[np.newaxis, :] - ratings[most_similar]
+    candidates = ratings == 0
+    scores = np.where(candidates, scores, -np.inf)
+
+    order = np.argsort(-scores, axis=1, kind='stable')[:, :n]
+    movie_ids = user_movie_matrix.columns.to_numpy()[order]
+    valid = np.take_along_axis(candidates, order, axis=1)
+    return np.where(valid, movie_ids, -1)
+
+
 # Antyrekomendacje na podstawie klastrów
 def get_anti_recommendations(user_id, user_similarity, user_movie_matrix, movies_df, n=5):
     """
@@ -128,6 +155,8 @@ def main():
     Ładuje dane, tworzy macierz user-item, grupuje użytkowników w klastry
     i generuje rekomendacje oraz antyrekomendacje dla użytkownika.
     """
+    from sklearn.metrics.pairwise import cosine_similarity
+
     # Ładowanie danych
     users_df, movies_df, ratings_df = load_data()
 
@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for all projects.
+
+    python -m benchmarks run                  # run every suite and append the results to the history
+    python -m benchmarks run knights --scale 2
+    python -m benchmarks compare              # compare the last run with the previous ones
+    python benchmarks/startup.py              # startup import time of the entry points
+
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
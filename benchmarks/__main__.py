@@ -0,0 +1,98 @@
+"""
+Command line interface of the benchmark suite: ``python -m benchmarks run|compare``.
+
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import argparse
+import sys
+import traceback
+
+from benchmarks.history import HISTORY_PATH, append_run, compare, load_history
+from benchmarks.suites import SUITES
+
+
+def run(args):
+    """
+    Run the selected suites, print their metrics and record them in the history.
+
+    Returns:
+    int: Exit status
+    """
+    results = {}
+    for name in args.suites or list(SUITES):
+        print(f"[{name}]")
+        try:
+            metrics = SUITES[name](args.scale, args.seed)
+        except ImportError as error:
+            print(f"  skipped: {error}")
+            results[name] = {"error": str(error)}
+            continue
+        except Exception as error:
+            traceback.print_exc()
+            results[name] = {"error": repr(error)}
+            continue
+        for record in metrics:
+            print(f"  {record['name']:<44}{record['value']:>16.2f} {record['unit']}")
+        results[name] = metrics
+    if not args.no_save:
+        append_run(results, args.scale, args.seed, args.history)
+    return 0
+
+
+def show_comparison(args):
+    """
+    Compare the last run with the previous ones and flag regressions.
+
+    Returns:
+    int: 1 if any metric regressed, otherwise 0
+    """
+    rows = compare(load_history(args.history), args.baseline, args.threshold)
+    if not rows:
+        print("No runs recorded.")
+        return 0
+    regressed = False
+    print(f"{'metric':<60}{'baseline':>14}{'current':>14}{'change':>9}")
+    for key, baseline, current, change, is_regression in rows:
+        regressed |= is_regression
+        if baseline is None:
+            print(f"{key:<60}{'-':>14}{current:>14.2f}{'new':>9}")
+        else:
+            flag = "  REGRESSION" if is_regression else ""
+            print(f"{key:<60}{baseline:>14.2f}{current:>14.2f}{change:>+9.1%}{flag}")
+    return 1 if regressed else 0
+
+
+def main(argv=None):
+    """
+    Parse the command line and run the chosen command.
+
+    Returns:
+    int: Exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Performance benchmarks of all projects.")
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON history file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmark suites")
+    run_parser.add_argument("suites", nargs="*", metavar="SUITE",
+                            help=f"Suites to run (default: all of {', '.join(SUITES)})")
+    run_parser.add_argument("--scale", type=float, default=1.0, help="Input size multiplier")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--no-save", action="store_true", help="Do not append the run to the history")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare the last run with the previous runs")
+    compare_parser.add_argument("--baseline", type=int, default=5, help="Number of previous runs in the baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Allowed relative slowdown")
+    compare_parser.set_defaults(handler=show_comparison)
+
+    args = parser.parse_args(argv)
+    unknown = set(getattr(args, "suites", [])) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
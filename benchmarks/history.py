@@ -0,0 +1,128 @@
+"""
+JSON history of benchmark runs and regression detection.
+
+The history file is a JSON list of runs. Every run stores its time, git commit, Python version, scale,
+seed and the metrics of every suite. A metric regresses when it is worse than the median of the same
+metric in the previous runs by more than the threshold.
+
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+
+from benchmarks.suites import ROOT
+
+HISTORY_PATH = os.path.join(ROOT, "benchmarks", "history.json")
+
+
+def git_commit():
+    """
+    Return the current git commit of the repository.
+
+    Returns:
+    str or None: Short commit hash, None outside a git repository
+    """
+    try:
+        process = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return process.stdout.strip() or None
+
+
+def load_history(path=HISTORY_PATH):
+    """
+    Load the run history.
+
+    Parameters:
+    path (str): Path of the history file
+
+    Returns:
+    list: Recorded runs (empty if the file does not exist)
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def append_run(results, scale, seed, path=HISTORY_PATH):
+    """
+    Append a run to the history file.
+
+    Parameters:
+    results (dict): Suite name -> list of metrics (or {"error": message} for a skipped suite)
+    scale (float): Scale factor of the run
+    seed (int): Seed of the run
+    path (str): Path of the history file
+
+    Returns:
+    dict: The recorded run
+    """
+    run = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scale": scale,
+        "seed": seed,
+        "suites": results,
+    }
+    history = load_history(path)
+    history.append(run)
+    with open(path, "w") as file:
+        json.dump(history, file, indent=2)
+    return run
+
+
+def run_metrics(run):
+    """
+    Flatten the metrics of a run.
+
+    Parameters:
+    run (dict): Recorded run
+
+    Returns:
+    dict: "suite/metric" -> metric record
+    """
+    flat = {}
+    for suite, metrics in run["suites"].items():
+        if isinstance(metrics, list):
+            for record in metrics:
+                flat[f"{suite}/{record['name']}"] = record
+    return flat
+
+
+def compare(history, baseline_runs=5, threshold=0.1):
+    """
+    Compare the last run with the median of the previous runs made with the same scale and seed.
+
+    Parameters:
+    history (list): Recorded runs
+    baseline_runs (int): Number of previous runs forming the baseline
+    threshold (float): Allowed relative slowdown (0.1 = 10%)
+
+    Returns:
+    list: Tuples (metric, baseline, current, relative change, regressed) for every metric in the last run
+    """
+    if not history:
+        return []
+    current = history[-1]
+    previous = [run for run in history[:-1] if run["scale"] == current["scale"] and run["seed"] == current["seed"]]
+    previous = [run_metrics(run) for run in previous[-baseline_runs:]]
+
+    rows = []
+    for key, record in run_metrics(current).items():
+        values = [metrics[key]["value"] for metrics in previous if key in metrics]
+        if not values:
+            rows.append((key, None, record["value"], None, False))
+            continue
+        baseline = statistics.median(values)
+        change = (record["value"] - baseline) / baseline if baseline else 0.0
+        worse = -change if record["higher_is_better"] else change
+        rows.append((key, baseline, record["value"], change, worse > threshold))
+    return rows
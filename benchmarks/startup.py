@@ -0,0 +1,141 @@
+"""
+Startup-time benchmark for the entry points of all projects.
+
+Every entry point is imported in a fresh interpreter with ``python -X importtime`` and the cumulative import
+time of the entry module is compared against its budget. The script exits with status 1 when any budget is
+exceeded, so it can be used as a check before merging. Entry points whose dependencies are not installed are
+skipped unless --strict is given. The same budgets are enforced by tests/test_startup.py.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeat 5 --json startup.json
+
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (project directory, module, budget in milliseconds). Budgets cover the import of the module itself,
+# without interpreter startup; heavy libraries (TensorFlow, sklearn, scikit-fuzzy, easyAI) must not be
+# imported until they are needed.
+ENTRY_POINTS = [
+    ("Game_Of_Knights", "Main", 50),
+    ("HR_comparison", "main", 50),
+    ("Movie_recommendation", "main", 600),
+    ("Lab4", "main", 900),
+    ("lab5", "task1_csv_classification", 600),
+    ("lab5", "task2_animal_recognition", 300),
+    ("lab5", "task3_clothing_recognition", 300),
+    ("lab5", "task4_data_augmentation", 300),
+    ("lab5", "image_trainer", 300),
+    ("lab5", "inference_export", 300),
+    ("lab6", "main", 600),
+    ("lab7_Black_jack", "main", 150),
+    ("lab7_Black_jack", "strategy", 300),
+]
+
+
+def parse_importtime(stderr, module):
+    """
+    Extract the cumulative import time of a module from ``-X importtime`` output.
+
+    Parameters:
+    stderr (str): Standard error of the interpreter
+    module (str): Name of the top-level module
+
+    Returns:
+    tuple: Cumulative import time of the module in milliseconds and the slowest direct imports
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            entries.append((int(cumulative), name.rstrip()))
+        except ValueError:
+            continue  # header line
+
+    # Imports are listed after their own children: collect direct children until the module line appears
+    total, slowest = None, []
+    children = []
+    for cumulative, name in entries:
+        depth = len(name) - len(name.lstrip())
+        if depth == 3:
+            children.append((cumulative / 1000, name.strip()))
+        elif depth == 1:
+            if name.strip() == module:
+                total, slowest = cumulative / 1000, sorted(children, reverse=True)[:3]
+            children = []
+    return total, slowest
+
+
+def measure(directory, module, repeat=3):
+    """
+    Measure the import time of an entry point.
+
+    Parameters:
+    directory (str): Project directory (working directory of the entry point)
+    module (str): Module name
+    repeat (int): Number of fresh interpreters; the fastest run is reported
+
+    Returns:
+    dict: Import time in milliseconds (None if the import failed), slowest imports and error message
+    """
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                 cwd=os.path.join(ROOT, directory), capture_output=True, text=True)
+        if process.returncode != 0:
+            error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "import failed"
+            return {"time_ms": None, "slowest": [], "error": error}
+        total, slowest = parse_importtime(process.stderr, module)
+        if total is not None and (best is None or total < best["time_ms"]):
+            best = {"time_ms": total, "slowest": slowest, "error": None}
+    return best or {"time_ms": None, "slowest": [], "error": "no importtime output"}
+
+
+def main(argv=None):
+    """
+    Measure all entry points and compare them with their budgets.
+
+    Returns:
+    int: 0 if all budgets are met, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Measure startup import time of every entry point.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per entry point (fastest is reported)")
+    parser.add_argument("--json", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail on entry points whose dependencies are not installed (skipped by default)")
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = False
+    print(f"{'entry point':<48}{'import [ms]':>12}{'budget':>8}  status")
+    for directory, module, budget in ENTRY_POINTS:
+        result = measure(directory, module, args.repeat)
+        name = f"{directory}/{module}.py"
+        if result["time_ms"] is None:
+            status = "ERROR" if args.strict else "SKIP"
+            failed |= args.strict
+            print(f"{name:<48}{'-':>12}{budget:>8}  {status}: {result['error']}")
+        else:
+            over = result["time_ms"] > budget
+            failed |= over
+            slowest = ", ".join(f"{child} {ms:.0f} ms" for ms, child in result["slowest"])
+            print(f"{name:<48}{result['time_ms']:>12.1f}{budget:>8}  {'OVER' if over else 'ok'}  ({slowest})")
+        results.append({"entry_point": name, "budget_ms": budget, **result})
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
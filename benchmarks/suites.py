@@ -0,0 +1,260 @@
+"""
+Benchmark suites for the individual projects.
+
+Every suite takes a scale factor (input size grows linearly with it) and a seed, generates its own
+synthetic data and returns a list of metrics. The projects are flat script directories that all have a
+``main.py``, so their modules are loaded by path under unique names, with the project directory put on
+``sys.path`` for the sibling imports.
+
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_project_module(project, module):
+    """
+    Import a module of a project directory.
+
+    Parameters:
+    project (str): Project directory name (e.g. "Lab4")
+    module (str): Module file name without extension
+
+    Returns:
+    module: Imported module, registered as "<project>.<module>" in sys.modules
+    """
+    directory = os.path.join(ROOT, project)
+    name = f"{project}.{module}"
+    if name in sys.modules:
+        return sys.modules[name]
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(directory, module + ".py"))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[name] = loaded
+    try:
+        spec.loader.exec_module(loaded)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return loaded
+
+
+def metric(name, value, unit, higher_is_better=True):
+    """
+    Create a metric record.
+
+    Parameters:
+    name (str): Metric name
+    value (float): Measured value
+    unit (str): Unit of the value
+    higher_is_better (bool): Direction used when looking for regressions
+
+    Returns:
+    dict: Metric record
+    """
+    return {"name": name, "value": float(value), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def best_time(function, repeat=3):
+    """
+    Run a function several times and return the fastest wall-clock time.
+
+    Parameters:
+    function (callable): Function without arguments
+    repeat (int): Number of runs
+
+    Returns:
+    tuple: Fastest time in seconds and the result of the last run
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_knights(scale, seed):
+    """
+    Negamax search of the Knights game: nodes per second over a set of positions.
+
+    The board and depth are fixed and the number of searched positions grows linearly with the scale, so
+    the amount of work does too. The positions are reached by seeded random play from the start.
+    """
+    import random
+
+    from easyAI import AI_Player, Negamax
+
+    knights = load_project_module("Game_Of_Knights", "Knights")
+
+    class CountingKnights(knights.Knights):
+        nodes = 0
+
+        def make_move(self, pos):
+            CountingKnights.nodes += 1
+            super().make_move(pos)
+
+    side, depth = 8, 7
+    n_positions = max(1, int(round(20 * scale)))
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = CountingKnights([AI_Player(Negamax(depth)), AI_Player(Negamax(depth))], (side, side))
+    positions = []
+    while len(positions) < n_positions:
+        game = start.copy()
+        for _ in range(rng.randrange(12)):
+            game.play_move(rng.choice(game.possible_moves()))
+            if game.is_over():
+                break
+        if not game.is_over():
+            positions.append(game)
+
+    def search():
+        CountingKnights.nodes = 0
+        for game in positions:
+            Negamax(depth)(game)
+
+    elapsed, _ = best_time(search)
+    return [
+        metric(f"negamax_d{depth}_{side}x{side}_nodes_per_sec", CountingKnights.nodes / elapsed, "nodes/s"),
+        metric(f"negamax_d{depth}_{side}x{side}_{n_positions}_positions", elapsed * 1000, "ms", higher_is_better=False),
+    ]
+
+
+def bench_recommendation(scale, seed):
+    """Movie recommendation for a single user on a synthetic rating matrix: latency."""
+    import numpy as np
+    import pandas as pd
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    recommender = load_project_module("Movie_recommendation", "main")
+    rng = np.random.default_rng(seed)
+    n_users, n_movies = int(200 * scale), int(500 * scale)
+    n_ratings = n_users * 20
+    ratings = pd.DataFrame({
+        "user_id": rng.integers(1, n_users + 1, n_ratings),
+        "movie_id": rng.integers(1, n_movies + 1, n_ratings),
+        "rating": rng.integers(1, 11, n_ratings),
+    }).drop_duplicates(["user_id", "movie_id"])
+    # Every user and every movie appears at least once, so user ids are the rows 1..n_users
+    ratings = pd.concat([ratings, pd.DataFrame({"user_id": np.arange(1, n_users + 1), "movie_id": 1, "rating": 5})])
+    ratings = ratings.drop_duplicates(["user_id", "movie_id"])
+    movies = pd.DataFrame({"movie_id": np.arange(1, n_movies + 1),
+                           "title": [f"Movie {i}" for i in range(1, n_movies + 1)]})
+
+    matrix = recommender.create_user_item_matrix(ratings)
+    build, similarity = best_time(lambda: cosine_similarity(matrix))
+    latency, _ = best_time(lambda: recommender.get_recommendations(1, similarity, matrix, movies), repeat=1)
+    return [
+        metric(f"similarity_{n_users}x{n_movies}", build * 1000, "ms", higher_is_better=False),
+        metric(f"recommend_latency_{n_users}x{n_movies}", latency * 1000, "ms", higher_is_better=False),
+    ]
+
+
+def bench_hr(scale, seed):
+    """Fuzzy employee scoring: build time of the control system and evaluations per second."""
+    import numpy as np
+
+    hr = load_project_module("HR_comparison", "main")
+    rng = np.random.default_rng(seed)
+    n = int(200 * scale)
+    inputs = np.column_stack([rng.uniform(0, 100, n), rng.uniform(0, 100, n), rng.uniform(1, 10, n)])
+
+    start = time.perf_counter()
+    hr.build_control_system()
+    build = time.perf_counter() - start
+
+    def score_all():
+        for kompetencje, pull_request, liczba in inputs:
+            hr.evaluate_employee(kompetencje, pull_request, liczba)
+
+    elapsed, _ = best_time(score_all)
+    return [
+        metric("control_system_build", build * 1000, "ms", higher_is_better=False),
+        metric("evaluations_per_sec", n / elapsed, "evals/s"),
+    ]
+
+
+def bench_lab4(scale, seed):
+    """Decision tree and SVM: fit time, batch prediction time and compiled single-sample latency."""
+    import numpy as np
+
+    lab4 = load_project_module("Lab4", "main")
+    fast_inference = load_project_module("Lab4", "fast_inference")
+    rng = np.random.default_rng(seed)
+    n_samples, n_features = int(2000 * scale), 8
+    X = rng.normal(size=(n_samples, n_features))
+    y = (X[:, 0] + 0.5 * X[:, 1] - X[:, 2] + rng.normal(scale=0.5, size=n_samples) > 0).astype(int)
+
+    results = []
+    for name, train in (("decision_tree", lab4.train_decision_tree), ("svm", lab4.train_svm_classifier)):
+        fit, classifier = best_time(lambda: train(X, y))
+        predict, _ = best_time(lambda: classifier.predict(X))
+        compiled = fast_inference.compile_classifier(classifier)
+        latency = fast_inference.measure_latency(compiled.predict_one, X[0])
+        results += [
+            metric(f"{name}_fit_{n_samples}", fit * 1000, "ms", higher_is_better=False),
+            metric(f"{name}_predict_{n_samples}", predict * 1000, "ms", higher_is_better=False),
+            metric(f"{name}_compiled_latency", latency, "us", higher_is_better=False),
+        ]
+    return results
+
+
+def bench_lab6(scale, seed):
+    """Colour detection and tracking on synthetic 1080p frames: frames per second."""
+    color_detector = load_project_module("lab6", "color_detector")
+    frame_sources = load_project_module("lab6", "frame_sources")
+    tracking = load_project_module("lab6", "tracking")
+
+    count = int(60 * scale)
+    frames = list(frame_sources.SyntheticSource(1920, 1080, count, seed=seed))
+    detector = color_detector.ColorDetector(roi_size=None, step=4)
+    tracker = tracking.ColorTracker()
+
+    def detect_all():
+        for frame in frames:
+            detector.detect(frame)
+
+    def track_all():
+        for frame in frames:
+            tracker.process(frame)
+
+    detect, _ = best_time(detect_all)
+    track, _ = best_time(track_all)
+    return [
+        metric("detect_fps_1080p", count / detect, "frames/s"),
+        metric("track_fps_1080p", count / track, "frames/s"),
+    ]
+
+
+def bench_blackjack(scale, seed):
+    """Vectorised Monte Carlo simulation and the exact strategy solver: hands per second and solve time."""
+    simulator = load_project_module("lab7_Black_jack", "simulator")
+    strategy = load_project_module("lab7_Black_jack", "strategy")
+
+    n_hands = int(2_000_000 * scale)
+    policy = simulator.threshold_policy(17)
+    elapsed, _ = best_time(lambda: simulator.simulate(policy, n_hands, seed=seed))
+    solve, _ = best_time(lambda: strategy.StrategySolver().solve())
+    return [
+        metric("simulated_hands_per_sec", n_hands / elapsed, "hands/s"),
+        metric("strategy_solve", solve * 1000, "ms", higher_is_better=False),
+    ]
+
+
+SUITES = {
+    "knights": bench_knights,
+    "recommendation": bench_recommendation,
+    "hr": bench_hr,
+    "lab4": bench_lab4,
+    "lab6": bench_lab6,
+    "blackjack": bench_blackjack,
+}
@@ -0,0 +1,149 @@
+"""
+Shared tf.data input pipeline for the image recognition tasks (Task 2 and Task 3).
+Images are decoded and resized in parallel, cached to disk after decoding, augmented in batches with
+Keras preprocessing layers and prefetched, so training does not wait for the input.
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import hashlib
+import os
+
+from lazy_import import tf
+
+IMAGE_SIZE = (224, 224)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tfdata_cache")
+
+
+def list_image_folder(directory):
+    """
+    List images in a directory with one subfolder per class.
+
+    Args:
+        directory (str): Path to the directory with labelled folders.
+
+    Returns:
+        Tuple: Image paths, integer labels and sorted class names.
+    """
+    class_names = sorted(name for name in os.listdir(directory)
+                         if os.path.isdir(os.path.join(directory, name)))
+    paths, labels = [], []
+    for label, class_name in enumerate(class_names):
+        class_dir = os.path.join(directory, class_name)
+        for file_name in sorted(os.listdir(class_dir)):
+            if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(os.path.join(class_dir, file_name))
+                labels.append(label)
+    return paths, labels, class_names
+
+
+def files_digest(paths, labels):
+    """
+    Compute a digest of a labelled file list including file sizes and modification times.
+    Adding, removing, editing or relabelling an image changes the digest.
+
+    Args:
+        paths (list): Paths to the images.
+        labels (list): Label of every image.
+
+    Returns:
+        str: Short hex digest.
+    """
+    digest = hashlib.sha256()
+    # Entries are hashed in dataset order, because the cache stores the images in that order
+    for path, label in zip(paths, labels):
+        stat = os.stat(path)
+        digest.update(f"{os.path.abspath(path)}\0{label}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def create_augmentation(seed=None):
+    """
+    Create the augmentation model applied to whole batches.
+
+    Args:
+        seed (int): Seed of the random layers (None draws a random seed). Seeded layers keep their own
+            random state, so the augmentation is reproducible without setting the global seed.
+
+    Returns:
+        keras.Sequential: Random rotation, translation, zoom and horizontal flip layers.
+    """
+    return tf.keras.Sequential([
+        tf.keras.layers.RandomRotation(20 / 360, fill_mode='nearest', seed=seed),
+        tf.keras.layers.RandomTranslation(0.2, 0.2, fill_mode='nearest', seed=seed),
+        tf.keras.layers.RandomZoom(0.2, fill_mode='nearest', seed=seed),
+        tf.keras.layers.RandomFlip('horizontal', seed=seed),
+    ], name='augmentation')
+
+
+def decode_image(path, image_size=IMAGE_SIZE):
+    """
+    Read, decode, resize and rescale a single image.
+
+    Args:
+        path (tf.Tensor): Path to the image file.
+        image_size (tuple): Target size (height, width).
+
+    Returns:
+        tf.Tensor: Float image with values in [0, 1].
+    """
+    image = tf.io.decode_image(tf.io.read_file(path), channels=3, expand_animations=False)
+    image = tf.image.resize(image, image_size)
+    return image / 255.0
+
+
+def make_dataset(paths, labels, image_size=IMAGE_SIZE, batch_size=32, augment=True, shuffle=True,
+                 cache=True, cache_name=None):
+    """
+    Build the input pipeline for a list of labelled images.
+
+    Args:
+        paths (list): Paths to the images.
+        labels (list): Label of every image.
+        image_size (tuple): Target size (height, width).
+        batch_size (int): Batch size.
+        augment (bool): Apply random augmentation to every batch.
+        shuffle (bool): Shuffle the images every epoch.
+        cache (bool): Cache the decoded images (disable for a single pass, e.g. inference).
+        cache_name (str): Name of the on-disk cache of decoded images (None caches in memory). The cache file
+            name also includes a digest of the file list, so changed images are never read from a stale cache.
+
+    Returns:
+        tf.data.Dataset: Batched and prefetched dataset of (images, labels).
+    """
+    dataset = tf.data.Dataset.from_tensor_slices((list(paths), tf.cast(labels, tf.float32)))
+    dataset = dataset.map(lambda path, label: (decode_image(path, image_size), label),
+                          num_parallel_calls=tf.data.AUTOTUNE)
+
+    if cache and cache_name is None:
+        dataset = dataset.cache()
+    elif cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        digest = files_digest(paths, labels)
+        dataset = dataset.cache(os.path.join(CACHE_DIR, f"{cache_name}_{image_size[0]}x{image_size[1]}_{digest}"))
+
+    if shuffle:
+        dataset = dataset.shuffle(max(1, len(paths)), reshuffle_each_iteration=True)
+    dataset = dataset.batch(batch_size)
+
+    if augment:
+        augmentation = create_augmentation()
+        dataset = dataset.map(lambda images, batch_labels: (augmentation(images, training=True), batch_labels),
+                              num_parallel_calls=tf.data.AUTOTUNE)
+    return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+def load_images(paths, image_size=IMAGE_SIZE):
+    """
+    Decode a list of images in parallel into a single tensor.
+
+    Args:
+        paths (list): Paths to the images.
+        image_size (tuple): Target size (height, width).
+
+    Returns:
+        tf.Tensor: Images of shape (n, height, width, 3) with values in [0, 1].
+    """
+    dataset = tf.data.Dataset.from_tensor_slices(list(paths))
+    dataset = dataset.map(lambda path: decode_image(path, image_size), num_parallel_calls=tf.data.AUTOTUNE)
+    return next(iter(dataset.batch(len(paths))))
@@ -0,0 +1,207 @@
+"""
+Precomputed MobileNetV2 embedding cache for transfer learning (Task 2 and Task 3).
+The frozen backbone runs only once per image and augmentation variant. Pooled embeddings are stored in a
+memory-mapped float32 file keyed by a hash of the image content, the variant and the image size, so the
+Dense head is trained on cached vectors and a new class only needs embeddings of its own images.
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from data_pipeline import IMAGE_SIZE, create_augmentation, load_images
+from lazy_import import tf
+
+EMBEDDING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache")
+
+_backbones = {}
+
+
+def get_backbone(image_size=IMAGE_SIZE):
+    """
+    Return the frozen MobileNetV2 backbone with global average pooling.
+    The backbone is created once per process and image size and then reused.
+
+    Args:
+        image_size (tuple): Input size (height, width).
+
+    Returns:
+        keras.Model: Frozen backbone returning pooled embeddings.
+    """
+    key = tuple(image_size)
+    if key not in _backbones:
+        backbone = tf.keras.applications.MobileNetV2(weights='imagenet', include_top=False, pooling='avg',
+                                                     input_shape=key + (3,))
+        backbone.trainable = False
+        _backbones[key] = backbone
+    return _backbones[key]
+
+
+def content_hash(path):
+    """
+    Compute the SHA-256 hash of an image file.
+
+    Args:
+        path (str): Path to the image.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Memory-mapped store of backbone embeddings.
+    Embeddings are appended to a raw float32 file, the JSON index maps every key to its row. Rows are numbered
+    from the size of the data file and the index is replaced atomically, so an interrupted write leaves only
+    unreferenced rows at the end of the file and never shifts the rows of existing keys.
+    """
+
+    def __init__(self, directory=EMBEDDING_DIR, image_size=IMAGE_SIZE, seed=42):
+        """
+        Initialize the cache.
+
+        Args:
+            directory (str): Directory holding the embedding file and its index.
+            image_size (tuple): Input size of the backbone (height, width).
+            seed (int): Base seed of the augmentation variants.
+        """
+        self.directory = directory
+        self.image_size = tuple(image_size)
+        self.seed = seed
+        self.data_path = os.path.join(directory, 'embeddings.f32')
+        self.index_path = os.path.join(directory, 'index.json')
+        self.index = {}
+        self.dim = None
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r') as file:
+                meta = json.load(file)
+            self.index, self.dim = meta['index'], meta['dim']
+
+    def key(self, digest, variant):
+        """
+        Build the key of one image variant.
+
+        Args:
+            digest (str): Content hash of the image.
+            variant (int): Augmentation variant (0 is the original image).
+
+        Returns:
+            str: Cache key.
+        """
+        return f"mobilenet_v2:{self.image_size[0]}x{self.image_size[1]}:{self.seed}:{variant}:{digest}"
+
+    def _rows(self):
+        if self.dim is None or not os.path.exists(self.data_path):
+            return 0
+        return os.path.getsize(self.data_path) // (4 * self.dim)
+
+    def _matrix(self):
+        rows = self._rows()
+        if rows == 0:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        return np.memmap(self.data_path, dtype=np.float32, mode='r', shape=(rows, self.dim))
+
+    def _append(self, keys, embeddings):
+        os.makedirs(self.directory, exist_ok=True)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        self.dim = int(embeddings.shape[1])
+        with open(self.data_path, 'ab') as file:
+            # A partial row left by an interrupted write is overwritten by padding to a whole row
+            base = -(-file.tell() // (4 * self.dim))
+            file.truncate(base * 4 * self.dim)
+            file.seek(0, os.SEEK_END)
+            file.write(embeddings.tobytes())
+        for offset, key in enumerate(keys):
+            self.index[key] = base + offset
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'dim': self.dim, 'index': self.index}, file)
+        os.replace(tmp_path, self.index_path)
+
+    def compute(self, images, variant):
+        """
+        Run the frozen backbone on a batch of images.
+
+        Args:
+            images (tf.Tensor): Images with values in [0, 1].
+            variant (int): Augmentation variant (0 is the original image).
+
+        Returns:
+            np.ndarray: Pooled embeddings.
+        """
+        if variant > 0:
+            # Seeded layers make the variant reproducible without reseeding the whole process
+            images = create_augmentation(seed=self.seed + variant)(images, training=True)
+        return get_backbone(self.image_size).predict(images, batch_size=32, verbose=0)
+
+    def embed(self, paths, labels, variants=0):
+        """
+        Return embeddings of all images and their augmentation variants, computing only missing ones.
+
+        Args:
+            paths (list): Paths to the images.
+            labels (list): Label of every image.
+            variants (int): Number of augmented variants per image in addition to the original.
+
+        Returns:
+            Tuple: Embeddings of shape (len(paths) * (variants + 1), dim) and matching labels.
+        """
+        digests = [content_hash(path) for path in paths]
+        images = None
+        for variant in range(variants + 1):
+            # Images with identical content share one key and are computed once
+            missing = {}
+            for i, digest in enumerate(digests):
+                key = self.key(digest, variant)
+                if key not in self.index and key not in missing:
+                    missing[key] = i
+            if not missing:
+                continue
+            if images is None:
+                images = load_images(paths, self.image_size)
+            embeddings = self.compute(tf.gather(images, list(missing.values())), variant)
+            self._append(list(missing), embeddings)
+
+        rows = [self.index[self.key(digest, variant)] for variant in range(variants + 1) for digest in digests]
+        return np.asarray(self._matrix()[rows]), np.tile(np.asarray(labels, dtype=np.float32), variants + 1)
+
+
+def build_head(input_dim, units=1):
+    """
+    Build the trainable classification head placed on top of the pooled embeddings.
+
+    Args:
+        input_dim (int): Size of the embeddings.
+        units (int): 1 for binary classification, otherwise number of classes.
+
+    Returns:
+        keras.Model: Compiled head.
+    """
+    head = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(input_dim,)),
+        tf.keras.layers.Dense(128, activation='relu'),
+        tf.keras.layers.Dense(units, activation='sigmoid' if units == 1 else 'softmax')
+    ])
+    loss = 'binary_crossentropy' if units == 1 else 'sparse_categorical_crossentropy'
+    head.compile(optimizer='adam', loss=loss, metrics=['accuracy'])
+    return head
+
+
+def attach_head(head, image_size=IMAGE_SIZE):
+    """
+    Combine the shared backbone with a trained head into a model working on images.
+
+    Args:
+        head (keras.Model): Trained head.
+        image_size (tuple): Input size (height, width).
+
+    Returns:
+        keras.Model: Model mapping images to predictions.
+    """
+    return tf.keras.Sequential([get_backbone(image_size), head])
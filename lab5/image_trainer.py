@@ -0,0 +1,189 @@
+"""
+Generic image classification trainer shared by Task 2 and Task 3.
+Takes a directory with one subfolder per class, computes MobileNetV2 embeddings through the shared
+embedding cache and trains a Dense head on them. The backbone is loaded once per process and kept in
+memory between jobs, and several heads can be trained in one run over a single embedding pass.
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import argparse
+
+import numpy as np
+
+from data_pipeline import IMAGE_SIZE, list_image_folder
+from embedding_cache import EmbeddingCache, attach_head, build_head, get_backbone
+
+
+class TrainedClassifier:
+    """
+    Trained head together with its class names.
+    """
+
+    def __init__(self, head, class_names, image_size=IMAGE_SIZE):
+        """
+        Initialize the classifier.
+
+        Args:
+            head (keras.Model): Trained head working on embeddings.
+            class_names (list): Name of every class, indexed by label.
+            image_size (tuple): Input size of the backbone (height, width).
+        """
+        self.head = head
+        self.class_names = list(class_names)
+        self.image_size = tuple(image_size)
+        self._model = None
+
+    @property
+    def model(self):
+        """keras.Model: Backbone and head combined into a model working on images."""
+        if self._model is None:
+            self._model = attach_head(self.head, self.image_size)
+        return self._model
+
+    def labels_from_output(self, output):
+        """
+        Convert model output to class indices.
+
+        Args:
+            output (np.ndarray): Output of the head or of the full model.
+
+        Returns:
+            np.ndarray: Predicted class indices.
+        """
+        output = np.asarray(output)
+        if output.shape[-1] == 1:
+            return (output[:, 0] > 0.5).astype(int)
+        return output.argmax(axis=1)
+
+    def predict(self, images):
+        """
+        Predict class names of a batch of images.
+
+        Args:
+            images (tf.Tensor): Images with values in [0, 1].
+
+        Returns:
+            list: Predicted class names.
+        """
+        output = self.model.predict(images, verbose=0)
+        return [self.class_names[i] for i in self.labels_from_output(output)]
+
+
+class ImageClassifierTrainer:
+    """
+    Trainer of classification heads on cached backbone embeddings.
+    """
+
+    def __init__(self, image_size=IMAGE_SIZE, variants=10, epochs=10, batch_size=32, cache=None):
+        """
+        Initialize the trainer and load the backbone.
+
+        Args:
+            image_size (tuple): Input size of the backbone (height, width).
+            variants (int): Number of augmented variants per image.
+            epochs (int): Number of training epochs of every head.
+            batch_size (int): Batch size of head training.
+            cache (EmbeddingCache): Embedding cache (default cache if None).
+        """
+        self.image_size = tuple(image_size)
+        self.variants = variants
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.cache = cache or EmbeddingCache(image_size=self.image_size)
+        get_backbone(self.image_size)
+
+    def fit_head(self, embeddings, labels, class_names, verbose=1):
+        """
+        Train a head on precomputed embeddings.
+
+        Args:
+            embeddings (np.ndarray): Embeddings of the training images.
+            labels (np.ndarray): Label of every embedding.
+            class_names (list): Name of every class, indexed by label.
+            verbose (int): Keras verbosity.
+
+        Returns:
+            TrainedClassifier: Trained classifier.
+        """
+        units = 1 if len(class_names) == 2 else len(class_names)
+        head = build_head(embeddings.shape[1], units)
+        head.fit(embeddings, labels, epochs=self.epochs, batch_size=self.batch_size, shuffle=True, verbose=verbose)
+        return TrainedClassifier(head, class_names, self.image_size)
+
+    def train_files(self, paths, labels, class_names, verbose=1):
+        """
+        Train a classifier on a list of labelled images.
+
+        Args:
+            paths (list): Paths to the images.
+            labels (list): Label of every image.
+            class_names (list): Name of every class, indexed by label.
+            verbose (int): Keras verbosity.
+
+        Returns:
+            TrainedClassifier: Trained classifier.
+        """
+        embeddings, embedding_labels = self.cache.embed(paths, labels, self.variants)
+        return self.fit_head(embeddings, embedding_labels, class_names, verbose)
+
+    def train(self, directory, verbose=1):
+        """
+        Train a classifier on a directory with one subfolder per class.
+
+        Args:
+            directory (str): Path to the directory with labelled folders.
+            verbose (int): Keras verbosity.
+
+        Returns:
+            TrainedClassifier: Trained classifier.
+        """
+        paths, labels, class_names = list_image_folder(directory)
+        return self.train_files(paths, labels, class_names, verbose)
+
+    def train_many(self, directories, verbose=1):
+        """
+        Train one head per directory over a single shared embedding pass.
+
+        Args:
+            directories (list): Paths to directories with labelled folders.
+            verbose (int): Keras verbosity.
+
+        Returns:
+            dict: Directory -> TrainedClassifier.
+        """
+        jobs = [list_image_folder(directory) for directory in directories]
+        all_paths = [path for paths, _, _ in jobs for path in paths]
+        all_labels = [label for _, labels, _ in jobs for label in labels]
+        embeddings, embedding_labels = self.cache.embed(all_paths, all_labels, self.variants)
+
+        # Embeddings are ordered variant by variant, each variant covering all images of all jobs
+        n_images = len(all_paths)
+        classifiers, offset = {}, 0
+        for directory, (paths, _, class_names) in zip(directories, jobs):
+            rows = np.concatenate([np.arange(offset, offset + len(paths)) + variant * n_images
+                                   for variant in range(self.variants + 1)])
+            classifiers[directory] = self.fit_head(embeddings[rows], embedding_labels[rows], class_names, verbose)
+            offset += len(paths)
+        return classifiers
+
+
+def main():
+    """
+    Trains one classifier per given directory and prints its training accuracy.
+    """
+    parser = argparse.ArgumentParser(description="Train image classifiers on labelled folders.")
+    parser.add_argument("directories", nargs="+", help="Directories with one subfolder per class")
+    parser.add_argument("--variants", type=int, default=10, help="Augmented variants per image")
+    parser.add_argument("--epochs", type=int, default=10, help="Training epochs of every head")
+    args = parser.parse_args()
+
+    trainer = ImageClassifierTrainer(variants=args.variants, epochs=args.epochs)
+    for directory, classifier in trainer.train_many(args.directories, verbose=0).items():
+        paths, labels, _ = list_image_folder(directory)
+        embeddings, _ = trainer.cache.embed(paths, labels)
+        predicted = classifier.labels_from_output(classifier.head.predict(embeddings, verbose=0))
+        print(f"{directory}: classes {classifier.class_names}, training accuracy {np.mean(predicted == labels):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Batched, optimized inference for the image classifiers of Task 2 and Task 3.
+A trained classifier is exported as a SavedModel with a fixed tf.function signature and optionally
+converted to a TensorFlow Lite model with post-training float16 or int8 quantization. Prediction runs
+in batches over a whole directory of images and reports throughput in images per second.
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from data_pipeline import IMAGE_EXTENSIONS, IMAGE_SIZE, load_images, make_dataset
+from lazy_import import tf
+
+CLASS_NAMES_FILE = 'class_names.json'
+
+
+def create_exported_module(model, image_size=IMAGE_SIZE):
+    """
+    Wrap the classifier in a tf.Module with a tf.function of fixed input signature.
+
+    Args:
+        model (keras.Model): Model mapping images to predictions.
+        image_size (tuple): Input size (height, width).
+
+    Returns:
+        tf.Module: Module with the model and its serving function.
+    """
+    module = tf.Module()
+    module.model = model
+    module.serve = tf.function(
+        lambda images: {'probabilities': module.model(images, training=False)},
+        input_signature=[tf.TensorSpec([None, image_size[0], image_size[1], 3], tf.float32, name='images')])
+    return module
+
+
+def export_saved_model(classifier, export_dir):
+    """
+    Export a trained classifier as a SavedModel.
+
+    Args:
+        classifier (TrainedClassifier): Trained classifier from image_trainer.
+        export_dir (str): Output directory.
+
+    Returns:
+        str: Path of the exported model.
+    """
+    module = create_exported_module(classifier.model, classifier.image_size)
+    tf.saved_model.save(module, export_dir, signatures={'serving_default': module.serve})
+    with open(os.path.join(export_dir, CLASS_NAMES_FILE), 'w') as file:
+        json.dump(classifier.class_names, file)
+    return export_dir
+
+
+def quantize_saved_model(export_dir, mode='float16', representative_paths=None, image_size=IMAGE_SIZE):
+    """
+    Convert a SavedModel to TensorFlow Lite with post-training quantization.
+
+    Args:
+        export_dir (str): Directory of the exported SavedModel.
+        mode (str): "float16" or "int8" (int8 needs representative images).
+        representative_paths (list): Images used to calibrate int8 quantization.
+        image_size (tuple): Input size (height, width).
+
+    Returns:
+        str: Path of the written .tflite file.
+    """
+    converter = tf.lite.TFLiteConverter.from_saved_model(export_dir)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if mode == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+    elif mode == 'int8':
+        if not representative_paths:
+            raise ValueError("int8 quantization needs representative images")
+        images = load_images(representative_paths, image_size)
+
+        def representative_dataset():
+            for i in range(images.shape[0]):
+                yield [images[i:i + 1]]
+
+        converter.representative_dataset = representative_dataset
+    else:
+        raise ValueError(f"Unknown quantization mode: {mode}")
+
+    tflite_path = os.path.join(export_dir, f'model_{mode}.tflite')
+    with open(tflite_path, 'wb') as file:
+        file.write(converter.convert())
+    return tflite_path
+
+
+def list_images(directory):
+    """
+    List all images in a directory and its subdirectories.
+
+    Args:
+        directory (str): Path to the directory.
+
+    Returns:
+        list: Sorted image paths.
+    """
+    return sorted(os.path.join(root, name) for root, _, files in os.walk(directory)
+                  for name in files if name.lower().endswith(IMAGE_EXTENSIONS))
+
+
+class BatchPredictor:
+    """
+    Batched predictor running an exported SavedModel or a quantized TensorFlow Lite model.
+    """
+
+    def __init__(self, model_path, image_size=IMAGE_SIZE, num_threads=None):
+        """
+        Load the exported model.
+
+        Args:
+            model_path (str): SavedModel directory or .tflite file.
+            image_size (tuple): Input size (height, width).
+            num_threads (int): Number of CPU threads of the TensorFlow Lite interpreter.
+        """
+        self.image_size = tuple(image_size)
+        model_dir = os.path.dirname(model_path) if model_path.endswith('.tflite') else model_path
+        with open(os.path.join(model_dir, CLASS_NAMES_FILE), 'r') as file:
+            self.class_names = json.load(file)
+
+        if model_path.endswith('.tflite'):
+            self.interpreter = tf.lite.Interpreter(model_path=model_path, num_threads=num_threads)
+            self.serve = None
+        else:
+            self.interpreter = None
+            self.serve = tf.saved_model.load(model_path).signatures['serving_default']
+
+    def _predict_tflite(self, images):
+        input_detail = self.interpreter.get_input_details()[0]
+        if tuple(input_detail['shape']) != images.shape:
+            self.interpreter.resize_tensor_input(input_detail['index'], images.shape)
+            self.interpreter.allocate_tensors()
+        self.interpreter.set_tensor(input_detail['index'], images.astype(input_detail['dtype']))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.interpreter.get_output_details()[0]['index'])
+
+    def predict_batch(self, images):
+        """
+        Predict probabilities for one batch of images.
+
+        Args:
+            images (np.ndarray): Images with values in [0, 1].
+
+        Returns:
+            np.ndarray: Model output.
+        """
+        if self.interpreter is not None:
+            return self._predict_tflite(np.asarray(images, dtype=np.float32))
+        return self.serve(images=tf.convert_to_tensor(images, tf.float32))['probabilities'].numpy()
+
+    def predict_directory(self, directory, batch_size=64):
+        """
+        Classify all images in a directory.
+
+        Args:
+            directory (str): Path to the directory.
+            batch_size (int): Number of images per batch.
+
+        Returns:
+            Tuple: List of (path, class name) pairs and throughput in images per second.
+        """
+        paths = list_images(directory)
+        dataset = make_dataset(paths, np.zeros(len(paths)), self.image_size, batch_size, augment=False, shuffle=False,
+                               cache=False)
+
+        labels = []
+        start = time.perf_counter()
+        for images, _ in dataset:
+            output = self.predict_batch(images.numpy())
+            labels.extend((output[:, 0] > 0.5).astype(int) if output.shape[-1] == 1 else output.argmax(axis=1))
+        elapsed = time.perf_counter() - start
+        results = [(path, self.class_names[label]) for path, label in zip(paths, labels)]
+        return results, len(paths) / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    """
+    Trains and exports a classifier, or runs batched prediction with an exported one.
+    """
+    parser = argparse.ArgumentParser(description="Export image classifiers and run batched inference.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help="Train on labelled folders and export the model")
+    export.add_argument('train_dir', help="Directory with one subfolder per class")
+    export.add_argument('export_dir', help="Output directory of the SavedModel")
+    export.add_argument('--quantize', choices=['none', 'float16', 'int8'], default='float16')
+
+    predict = commands.add_parser('predict', help="Classify all images in a directory")
+    predict.add_argument('model', help="SavedModel directory or .tflite file")
+    predict.add_argument('image_dir', help="Directory with images")
+    predict.add_argument('--batch-size', type=int, default=64)
+    predict.add_argument('--threads', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        from image_trainer import ImageClassifierTrainer
+        from data_pipeline import list_image_folder
+
+        classifier = ImageClassifierTrainer().train(args.train_dir, verbose=0)
+        export_saved_model(classifier, args.export_dir)
+        print("SavedModel exported to:", args.export_dir)
+        if args.quantize != 'none':
+            paths, _, _ = list_image_folder(args.train_dir)
+            print("Quantized model:", quantize_saved_model(args.export_dir, args.quantize, paths[:100]))
+    else:
+        predictor = BatchPredictor(args.model, num_threads=args.threads)
+        results, images_per_second = predictor.predict_directory(args.image_dir, args.batch_size)
+        for path, label in results:
+            print(f"{path}: {label}")
+        print(f"Classified {len(results)} images at {images_per_second:.1f} images/sec")
+
+
+if __name__ == "__main__":
+    main()
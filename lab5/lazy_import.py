@@ -0,0 +1,33 @@
+"""
+Lazy TensorFlow import shared by the lab5 modules.
+Importing TensorFlow takes seconds, so the modules use the ``tf`` proxy defined here instead of importing it
+at the top: TensorFlow is imported on the first attribute access (e.g. ``tf.data``) and cached afterwards,
+so importing a module or running its command line help stays fast.
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    Proxy of a module that is imported on the first attribute access.
+    """
+
+    def __init__(self, name):
+        """
+        Initialize the proxy.
+
+        Args:
+            name (str): Full name of the module.
+        """
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+
+tf = LazyModule('tensorflow')
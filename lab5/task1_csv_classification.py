@@ -3,13 +3,32 @@ Task 1: Data Classification (CSV-based)
 Authors: Henryk Mudlaff, Benedykt Borowski
 """
 
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
-import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, confusion_matrix
+
+from lazy_import import tf
+
+BASE_BATCH_SIZE = 8
+BASE_LEARNING_RATE = 0.001
+
+# Configurations compared by the benchmark
+BENCHMARK_CONFIGS = [
+    {"name": "baseline", "batch_size": 8, "epochs": 50},
+    {"name": "threads", "batch_size": 8, "epochs": 50, "intra_op_threads": 1, "inter_op_threads": 1},
+    {"name": "xla", "batch_size": 8, "epochs": 50, "jit_compile": True},
+    {"name": "batch64", "batch_size": 64, "epochs": 50, "jit_compile": True},
+    {"name": "batch64_early_stopping", "batch_size": 64, "epochs": 200, "jit_compile": True, "early_stopping": True},
+    {"name": "batch64_mixed_bfloat16", "batch_size": 64, "epochs": 50, "jit_compile": True,
+     "mixed_precision": "mixed_bfloat16"},
+    {"name": "batch64_mixed_float16", "batch_size": 64, "epochs": 50, "jit_compile": True,
+     "mixed_precision": "mixed_float16"},
+]
+MIXED_PRECISION_POLICIES = ("mixed_float16", "mixed_bfloat16")
 
 
 def load_and_prepare_data(file_path):
@@ -22,6 +41,8 @@ def load_and_prepare_data(file_path):
     Returns:
         Tuple: Split dataset into training and testing features and targets.
     """
+    from sklearn.model_selection import train_test_split
+
     df = pd.read_csv(file_path)
     features = df.iloc[:, :-1].values  # All columns except the last
     target = df.iloc[:, -1].values  # Last column
@@ -29,33 +50,196 @@ def load_and_prepare_data(file_path):
     return train_test_split(features, target, test_size=0.2, random_state=42)
 
 
-def create_model(input_dim):
+def configure_threads(intra_op_threads=None, inter_op_threads=None):
+    """
+    Set the number of TensorFlow CPU threads. Must be called before TensorFlow executes any operation.
+
+    Args:
+        intra_op_threads (int): Threads used inside a single operation (None keeps the default).
+        inter_op_threads (int): Threads used to run independent operations (None keeps the default).
+    """
+    if intra_op_threads is not None:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    if inter_op_threads is not None:
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+
+
+def configure_precision(policy=None):
+    """
+    Set the global Keras dtype policy. Must be called before the model is created.
+    Mixed precision computes in float16/bfloat16 and keeps the weights in float32. On CPUs without native
+    bfloat16/float16 support (AVX512-BF16, AMX) it is usually slower than float32, which the benchmark shows.
+
+    Args:
+        policy (str): "mixed_float16", "mixed_bfloat16" or None for float32.
+    """
+    tf.keras.mixed_precision.set_global_policy(policy or "float32")
+
+
+def scaled_learning_rate(batch_size):
+    """
+    Scale the learning rate linearly with the batch size.
+
+    Args:
+        batch_size (int): Training batch size.
+
+    Returns:
+        float: Learning rate for the Adam optimizer.
+    """
+    return BASE_LEARNING_RATE * batch_size / BASE_BATCH_SIZE
+
+
+def create_model(input_dim, learning_rate=BASE_LEARNING_RATE, jit_compile=False):
     """
     Create a neural network model for binary classification.
 
     Args:
         input_dim (int): Number of input features.
+        learning_rate (float): Learning rate of the Adam optimizer.
+        jit_compile (bool): Compile the training step with XLA.
 
     Returns:
         keras.Model: Compiled neural network model.
     """
-    model = Sequential([
-        Dense(16, activation='relu', input_dim=input_dim),
-        Dense(8, activation='relu'),
-        Dense(1, activation='sigmoid')
+    model = tf.keras.models.Sequential([
+        tf.keras.layers.Dense(16, activation='relu', input_dim=input_dim),
+        tf.keras.layers.Dense(8, activation='relu'),
+        # Float32 output keeps the loss numerically stable under mixed precision
+        tf.keras.layers.Dense(1, activation='sigmoid', dtype='float32')
     ])
-    model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=learning_rate), loss='binary_crossentropy',
+                  metrics=['accuracy'], jit_compile=jit_compile)
     return model
 
 
+class EpochTimer:
+    """
+    Records the duration of every epoch (attached to Keras with a LambdaCallback).
+    """
+
+    def __init__(self):
+        self.epoch_times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.epoch_times.append(time.perf_counter() - self._start)
+
+
+def train_model(X_train, y_train, batch_size=BASE_BATCH_SIZE, epochs=50, jit_compile=False, early_stopping=False,
+                scale_learning_rate=True, seed=42):
+    """
+    Create and train the model with the given training configuration.
+
+    Args:
+        X_train (np.ndarray): Training features.
+        y_train (np.ndarray): Training targets.
+        batch_size (int): Training batch size.
+        epochs (int): Maximum number of epochs.
+        jit_compile (bool): Compile the training step with XLA.
+        early_stopping (bool): Stop when the validation loss stops improving.
+        scale_learning_rate (bool): Scale the learning rate linearly with the batch size.
+        seed (int): Random seed.
+
+    Returns:
+        Tuple: Trained model and list of epoch durations in seconds.
+    """
+    tf.keras.utils.set_random_seed(seed)
+    learning_rate = scaled_learning_rate(batch_size) if scale_learning_rate else BASE_LEARNING_RATE
+    model = create_model(X_train.shape[1], learning_rate, jit_compile)
+
+    timer = EpochTimer()
+    callbacks = [tf.keras.callbacks.LambdaCallback(on_epoch_begin=timer.on_epoch_begin,
+                                                   on_epoch_end=timer.on_epoch_end)]
+    validation_split = 0.0
+    if early_stopping:
+        validation_split = 0.2
+        callbacks.append(tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True))
+    model.fit(X_train, y_train, epochs=epochs, batch_size=batch_size, validation_split=validation_split,
+              callbacks=callbacks, verbose=0)
+    return model, timer.epoch_times
+
+
+def run_config(file_path, config):
+    """
+    Train and evaluate one benchmark configuration (runs in a fresh process, so thread settings apply).
+
+    Args:
+        file_path (str): Path to the CSV file.
+        config (dict): Training configuration.
+
+    Returns:
+        dict: Configuration name, number of epochs, mean epoch time and test accuracy.
+    """
+    from sklearn.metrics import accuracy_score
+
+    configure_threads(config.get("intra_op_threads"), config.get("inter_op_threads"))
+    configure_precision(config.get("mixed_precision"))
+    X_train, X_test, y_train, y_test = load_and_prepare_data(file_path)
+    model, epoch_times = train_model(X_train, y_train, config["batch_size"], config["epochs"],
+                                     config.get("jit_compile", False), config.get("early_stopping", False))
+    predictions = (model.predict(X_test, verbose=0) > 0.5).astype("int32")
+    return {
+        "name": config["name"],
+        "epochs": len(epoch_times),
+        # The first epoch includes graph tracing and compilation
+        "epoch_time": float(np.mean(epoch_times[1:] if len(epoch_times) > 1 else epoch_times)),
+        "total_time": float(np.sum(epoch_times)),
+        "accuracy": accuracy_score(y_test, predictions),
+    }
+
+
+def benchmark(file_path, configs=BENCHMARK_CONFIGS):
+    """
+    Compare epoch time and final accuracy of training configurations.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        configs (list): Training configurations.
+
+    Returns:
+        list: Result of every configuration.
+    """
+    results = []
+    for config in configs:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(run_config, file_path, config).result())
+    print(f"{'configuration':<26}{'epochs':>8}{'epoch [ms]':>12}{'total [s]':>11}{'accuracy':>10}")
+    for result in results:
+        print(f"{result['name']:<26}{result['epochs']:>8}{result['epoch_time'] * 1000:>12.1f}"
+              f"{result['total_time']:>11.2f}{result['accuracy']:>10.3f}")
+    return results
+
+
 def main():
     """
     Main function for Task 1: Train and evaluate the model using CSV data.
     """
+    parser = argparse.ArgumentParser(description="Task 1: CSV classification with a Dense network.")
+    parser.add_argument("--batch-size", type=int, default=BASE_BATCH_SIZE)
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--intra-op-threads", type=int, default=None)
+    parser.add_argument("--inter-op-threads", type=int, default=None)
+    parser.add_argument("--xla", action="store_true", help="Compile the model with XLA")
+    parser.add_argument("--early-stopping", action="store_true")
+    parser.add_argument("--mixed-precision", choices=MIXED_PRECISION_POLICIES, default=None,
+                        help="Train with a mixed precision policy (float32 output layer)")
+    parser.add_argument("--benchmark", action="store_true", help="Compare training configurations")
+    args = parser.parse_args()
+
     file_path = "seeds_dataset.csv"
+    if args.benchmark:
+        benchmark(file_path)
+        return
+
+    from sklearn.metrics import accuracy_score, confusion_matrix
+
+    configure_threads(args.intra_op_threads, args.inter_op_threads)
+    configure_precision(args.mixed_precision)
     X_train, X_test, y_train, y_test = load_and_prepare_data(file_path)
-    model = create_model(X_train.shape[1])
-    model.fit(X_train, y_train, epochs=50, batch_size=8, verbose=0)
+    model, _ = train_model(X_train, y_train, args.batch_size, args.epochs, args.xla, args.early_stopping)
     predictions = (model.predict(X_test) > 0.5).astype("int32")
     print("Accuracy:", accuracy_score(y_test, predictions))
     print("Confusion Matrix:\n", confusion_matrix(y_test, predictions))
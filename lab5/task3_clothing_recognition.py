@@ -1,88 +1,51 @@
 """
 Task 3: Clothing Recognition
-Uses the same structure as Task 2 with augmentation and pre-trained MobileNetV2 for recognizing jackets and trousers.
+Uses the same shared image trainer as Task 2 (pre-trained MobileNetV2 with cached embeddings of augmented
+images) for recognizing jackets and trousers.
 Includes proper prediction outputs for jacket and trousers images.
 """
 
-import tensorflow as tf
-from tensorflow.keras.applications import MobileNetV2
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense, GlobalAveragePooling2D
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
-from tensorflow.keras.preprocessing.image import load_img, img_to_array
+from data_pipeline import load_images
+from image_trainer import ImageClassifierTrainer
 
-# Data augmentation for training
-clothing_datagen = ImageDataGenerator(
-    rescale=1. / 255,
-    rotation_range=20,
-    width_shift_range=0.2,
-    height_shift_range=0.2,
-    shear_range=0.2,
-    zoom_range=0.2,
-    horizontal_flip=True,
-    fill_mode='nearest'
-)
+CLASS_NAMES = ['Trousers', 'Jacket']
 
 
-# Load and preprocess images
-def preprocess_clothing_data():
+# Training images and labels
+def get_training_files():
     """
-    Prepares the dataset with data augmentation for jacket and trousers classification.
-    Returns augmented training generator and validation data.
+    Returns paths of the training images and their labels for jacket and trousers classification.
     """
     train_data = {
         'trousers': ['jacket.png'],
         'jacket': ['trausers.png']
     }
 
-    X_train, y_train = [], []
+    paths, labels = [], []
     for label, images in train_data.items():
         for img in images:
-            image = tf.keras.preprocessing.image.load_img(img, target_size=(224, 224))
-            array = tf.keras.preprocessing.image.img_to_array(image)
-            X_train.append(array)
-            y_train.append(1 if label == 'jacket' else 0)
+            paths.append(img)
+            labels.append(1 if label == 'jacket' else 0)
+    return paths, labels
 
-    X_train = tf.convert_to_tensor(X_train, dtype=tf.float32) / 255.0
-    y_train = tf.convert_to_tensor(y_train, dtype=tf.float32)
 
-    return clothing_datagen.flow(X_train, y_train, batch_size=2), X_train, y_train
-
-
-# Build and train the model
-def build_clothing_model():
+def main_clothing(trainer=None):
     """
-    Builds and trains the MobileNetV2-based CNN for clothing recognition.
-    """
-    base_model = MobileNetV2(weights='imagenet', include_top=False, input_shape=(224, 224, 3))
-    base_model.trainable = False
-
-    model = Sequential([
-        base_model,
-        GlobalAveragePooling2D(),
-        Dense(128, activation='relu'),
-        Dense(1, activation='sigmoid')
-    ])
+    Trains the clothing classifier and predicts the classes of the training images.
 
-    model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
-    return model
-
-
-def main_clothing():
-    train_gen, X_train, y_train = preprocess_clothing_data()
-    model = build_clothing_model()
-    model.fit(train_gen, epochs=10)
+    Args:
+        trainer (ImageClassifierTrainer): Shared trainer (a new one is created if None).
+    """
+    trainer = trainer or ImageClassifierTrainer(batch_size=2)
+    paths, labels = get_training_files()
+    classifier = trainer.train_files(paths, labels, CLASS_NAMES)
     print("Training completed successfully!")
 
     # Predictions
-    jacket_img = X_train[0]
-    trousers_img = X_train[1]
-
-    jacket_pred = model.predict(tf.expand_dims(jacket_img, axis=0))
-    trousers_pred = model.predict(tf.expand_dims(trousers_img, axis=0))
+    jacket_pred, trousers_pred = classifier.predict(load_images(paths))
 
-    print("Jacket image prediction:", "Jacket" if jacket_pred > 0.5 else "Trousers")
-    print("Trousers image prediction:", "Jacket" if trousers_pred > 0.5 else "Trousers")
+    print("Jacket image prediction:", jacket_pred)
+    print("Trousers image prediction:", trousers_pred)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 """
 Task 4: Enhanced Data Augmentation
 This script demonstrates data augmentation by displaying and saving augmented images in real-time.
+With --input-dir it works as a headless bulk augmentation tool: augmentations are generated in a process
+pool with deterministic seeds and written as sharded NPZ or TFRecord files, with an optional preview grid.
 """
 
+import argparse
 import os
-import tensorflow as tf
-from tensorflow.keras.preprocessing.image import ImageDataGenerator, load_img, img_to_array
-import matplotlib.pyplot as plt
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from lazy_import import tf
 
 # Directory to save augmented images
 OUTPUT_DIR = "augmented_images"
@@ -25,8 +31,8 @@ def load_and_preprocess_image(image_path):
     Returns:
         numpy.ndarray: Preprocessed image.
     """
-    img = load_img(image_path, target_size=(128, 128))
-    img_array = img_to_array(img)
+    img = tf.keras.preprocessing.image.load_img(image_path, target_size=(128, 128))
+    img_array = tf.keras.preprocessing.image.img_to_array(img)
     img_array = img_array.reshape((1,) + img_array.shape)  # Add batch dimension
     return img_array
 
@@ -39,7 +45,7 @@ def create_datagen():
     Returns:
         ImageDataGenerator: Configured data augmentation generator.
     """
-    return ImageDataGenerator(
+    return tf.keras.preprocessing.image.ImageDataGenerator(
         rotation_range=40,
         width_shift_range=0.2,
         height_shift_range=0.2,
@@ -59,6 +65,8 @@ def generate_augmented_images(image_path, num_images=5):
         image_path (str): Path to the input image.
         num_images (int): Number of augmented images to generate.
     """
+    import matplotlib.pyplot as plt
+
     img_array = load_and_preprocess_image(image_path)
     datagen = create_datagen()
 
@@ -76,13 +84,160 @@ def generate_augmented_images(image_path, num_images=5):
             break
 
 
+# Deterministic augmentation of a single image (runs in a worker process)
+def augment_image(image_path, count, seed=0, image_size=(128, 128)):
+    """
+    Generate augmented versions of an image with reproducible random transforms.
+
+    Args:
+        image_path (str): Path to the input image.
+        count (int): Number of augmented images to generate.
+        seed (int): Base seed, combined with the file name so every image has its own seed sequence.
+        image_size (tuple): Target size (height, width).
+
+    Returns:
+        numpy.ndarray: Augmented images as uint8 array of shape (count, height, width, 3).
+    """
+    image = tf.keras.preprocessing.image.load_img(image_path, target_size=image_size)
+    image = tf.keras.preprocessing.image.img_to_array(image)
+    datagen = create_datagen()
+    image_seed = zlib.crc32(os.path.basename(image_path).encode()) + seed * 1_000_003
+    augmented = np.empty((count,) + image.shape, dtype=np.uint8)
+    for i in range(count):
+        augmented[i] = np.clip(datagen.random_transform(image, seed=(image_seed + i) % 2 ** 32), 0, 255)
+    return augmented
+
+
+def write_shards(images, sources, output_dir, prefix, shard_size=1000, output_format="npz"):
+    """
+    Write augmented images as shard files.
+
+    Args:
+        images (numpy.ndarray): Augmented images (uint8).
+        sources (list): Name of the source image of every augmented image, stored with every record.
+        output_dir (str): Output directory.
+        prefix (str): File name prefix of the shards.
+        shard_size (int): Maximum number of images per shard.
+        output_format (str): "npz" or "tfrecord".
+
+    Returns:
+        list: Paths of the written shards.
+    """
+    paths = []
+    for part, start in enumerate(range(0, len(images), shard_size)):
+        shard = images[start:start + shard_size]
+        shard_sources = sources[start:start + shard_size]
+        if output_format == "npz":
+            path = os.path.join(output_dir, f"{prefix}-{part:03d}.npz")
+            np.savez(path, images=shard, source=np.array(shard_sources))
+        else:
+            path = os.path.join(output_dir, f"{prefix}-{part:03d}.tfrecord")
+            with tf.io.TFRecordWriter(path) as writer:
+                for image, source in zip(shard, shard_sources):
+                    feature = {
+                        "image": tf.train.Feature(bytes_list=tf.train.BytesList(value=[tf.io.encode_png(image).numpy()])),
+                        "source": tf.train.Feature(bytes_list=tf.train.BytesList(value=[source.encode()])),
+                    }
+                    writer.write(tf.train.Example(features=tf.train.Features(feature=feature)).SerializeToString())
+        paths.append(path)
+    return paths
+
+
+def augment_and_write(job):
+    """
+    Worker job: augment a batch of images and write them into common shards.
+
+    Args:
+        job (tuple): (job index, image paths, count, seed, output dir, shard size, output format).
+
+    Returns:
+        list: Paths of the written shards.
+    """
+    index, image_paths, count, seed, output_dir, shard_size, output_format = job
+    images = np.concatenate([augment_image(image_path, count, seed) for image_path in image_paths])
+    sources = [os.path.basename(image_path) for image_path in image_paths for _ in range(count)]
+    # The prefix is the job index, so file names never clash (e.g. cat.jpg and cat.png)
+    return write_shards(images, sources, output_dir, f"aug-{index:05d}", shard_size, output_format)
+
+
+def bulk_augment(input_dir, output_dir, count, seed=0, workers=None, shard_size=1000, output_format="npz"):
+    """
+    Generate augmentations of all images in a folder in a process pool.
+    Every job augments as many images as fit into one shard, so shards are full except the last one of a job.
+
+    Args:
+        input_dir (str): Folder with input images.
+        output_dir (str): Folder for the shard files.
+        count (int): Number of augmented images per input image.
+        seed (int): Base seed of the augmentations.
+        workers (int): Number of worker processes (default: number of CPUs).
+        shard_size (int): Maximum number of images per shard.
+        output_format (str): "npz" or "tfrecord".
+
+    Returns:
+        list: Paths of the written shards.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    images = sorted(name for name in os.listdir(input_dir)
+                    if name.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")))
+    per_job = max(1, shard_size // count)
+    jobs = [(index, [os.path.join(input_dir, name) for name in images[start:start + per_job]], count, seed,
+             output_dir, shard_size, output_format)
+            for index, start in enumerate(range(0, len(images), per_job))]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [path for paths in executor.map(augment_and_write, jobs) for path in paths]
+
+
+def save_preview_grid(shard_path, output_path, columns=5, rows=2):
+    """
+    Save a grid of augmented images from an NPZ shard without opening a window.
+
+    Args:
+        shard_path (str): Path to the NPZ shard.
+        output_path (str): Path of the output image.
+        columns (int): Number of columns of the grid.
+        rows (int): Number of rows of the grid.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    images = np.load(shard_path)["images"][:columns * rows]
+    figure = Figure(figsize=(2 * columns, 2 * rows))
+    FigureCanvasAgg(figure)
+    for i, image in enumerate(images):
+        axis = figure.add_subplot(rows, columns, i + 1)
+        axis.imshow(image)
+        axis.axis('off')
+    figure.savefig(output_path)
+
+
 # Main function
 def main():
     """
-    Main function to demonstrate data augmentation.
+    Main function to demonstrate data augmentation or run the bulk augmentation tool.
     """
-    image_path = "image.png"  # Update with your image file path
-    generate_augmented_images(image_path, num_images=5)
+    parser = argparse.ArgumentParser(description="Data augmentation demo and bulk augmentation tool.")
+    parser.add_argument("--input-dir", help="Folder with images for headless bulk augmentation")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Folder for the shard files")
+    parser.add_argument("--count", type=int, default=100, help="Augmented images per input image")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed of the augmentations")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--shard-size", type=int, default=1000, help="Maximum images per shard")
+    parser.add_argument("--format", choices=["npz", "tfrecord"], default="npz", help="Shard file format")
+    parser.add_argument("--preview", help="Save a preview grid of the first shard to this file (npz only)")
+    args = parser.parse_args()
+
+    if args.input_dir is None:
+        image_path = "image.png"  # Update with your image file path
+        generate_augmented_images(image_path, num_images=5)
+        return
+
+    shards = bulk_augment(args.input_dir, args.output_dir, args.count, args.seed, args.workers,
+                          args.shard_size, args.format)
+    print(f"Written {len(shards)} shards to {args.output_dir}")
+    if args.preview and shards and args.format == "npz":
+        save_preview_grid(shards[0], args.preview)
+        print("Preview grid saved to:", args.preview)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+"""
+Moduł: Wektorowe rozpoznawanie kolorów w obszarze obrazu
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+
+Opis:
+Zamiast pojedynczego piksela ze środka obrazu klasyfikowany jest cały obszar zainteresowania (ROI) lub cała
+ramka. Obraz jest konwertowany do przestrzeni HSV, a każdy piksel przypisywany do jednego z kolorów
+(czerwony, zielony, niebieski) przez tablicę odcień -> indeks koloru. Liczby pikseli (np.bincount) tworzą
+histogram kolorów, z którego wybierany jest kolor dominujący. Dla koloru dominującego można wygenerować maskę
+(cv2.inRange).
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+NO_COLOR = "Brak dominujacego koloru"
+COLOR_NAMES = ["Czerwony", "Zielony", "Niebieski"]
+
+# Zakresy HSV (OpenCV: H 0-179) - czerwony leży na obu końcach skali odcienia
+HUE_RANGES = {
+    "Czerwony": [(0, 10), (170, 179)],
+    "Zielony": [(35, 85)],
+    "Niebieski": [(100, 130)],
+}
+
+
+class ColorDetector:
+    """
+    Klasa rozpoznająca dominujący kolor w obszarze obrazu na podstawie histogramu kolorów HSV.
+    """
+
+    def __init__(self, roi_size=(64, 64), step=1, min_saturation=70, min_value=50, min_fraction=0.2):
+        """
+        Inicjalizuje detektor.
+
+        Args:
+            roi_size (tuple): rozmiar (szerokość, wysokość) obszaru wokół środka obrazu, None oznacza całą ramkę
+            step (int): co który piksel w wierszu i kolumnie jest analizowany (1 - wszystkie)
+            min_saturation (int): minimalne nasycenie piksela uznawanego za kolorowy
+            min_value (int): minimalna jasność piksela uznawanego za kolorowy
+            min_fraction (float): minimalny udział koloru w obszarze, aby uznać go za dominujący
+        """
+        self.roi_size = roi_size
+        self.step = max(1, int(step))
+        self.min_fraction = min_fraction
+        self.bounds = {
+            name: [(np.array([low, min_saturation, min_value], dtype=np.uint8),
+                    np.array([high, 255, 255], dtype=np.uint8)) for low, high in ranges]
+            for name, ranges in HUE_RANGES.items()
+        }
+
+        # Tablica odcień -> indeks koloru (0 - brak koloru) do klasyfikacji wszystkich pikseli naraz
+        self.hue_lut = np.zeros(180, dtype=np.uint8)
+        for index, name in enumerate(COLOR_NAMES, start=1):
+            for low, high in HUE_RANGES[name]:
+                self.hue_lut[low:high + 1] = index
+        self.min_saturation = min_saturation
+        self.min_value = min_value
+
+    def roi_bounds(self, frame):
+        """
+        Wyznacza prostokąt analizowanego obszaru.
+
+        Args:
+            frame (np.ndarray): ramka obrazu
+
+        Returns:
+            tuple: (x1, y1, x2, y2)
+        """
+        height, width = frame.shape[:2]
+        if self.roi_size is None:
+            return 0, 0, width, height
+        roi_w, roi_h = min(self.roi_size[0], width), min(self.roi_size[1], height)
+        x1, y1 = (width - roi_w) // 2, (height - roi_h) // 2
+        return x1, y1, x1 + roi_w, y1 + roi_h
+
+    def to_hsv(self, frame):
+        """
+        Wycina obszar zainteresowania i konwertuje go do HSV.
+
+        Args:
+            frame (np.ndarray): ramka obrazu w formacie BGR
+
+        Returns:
+            np.ndarray: obszar w przestrzeni HSV
+        """
+        x1, y1, x2, y2 = self.roi_bounds(frame)
+        roi = frame[y1:y2:self.step, x1:x2:self.step]
+        return cv2.cvtColor(np.ascontiguousarray(roi), cv2.COLOR_BGR2HSV)
+
+    def color_mask(self, hsv, name):
+        """
+        Tworzy maskę pikseli danego koloru.
+
+        Args:
+            hsv (np.ndarray): obraz w przestrzeni HSV
+            name (str): nazwa koloru
+
+        Returns:
+            np.ndarray: maska (255 dla pikseli danego koloru)
+        """
+        ranges = self.bounds[name]
+        mask = cv2.inRange(hsv, *ranges[0])
+        for low, high in ranges[1:]:
+            mask = cv2.bitwise_or(mask, cv2.inRange(hsv, low, high))
+        return mask
+
+    def classify_pixels(self, hsv):
+        """
+        Przypisuje każdemu pikselowi indeks koloru (0 - brak, 1 - czerwony, 2 - zielony, 3 - niebieski).
+
+        Args:
+            hsv (np.ndarray): obraz w przestrzeni HSV
+
+        Returns:
+            np.ndarray: mapa indeksów kolorów
+        """
+        colored = (hsv[..., 1] >= self.min_saturation) & (hsv[..., 2] >= self.min_value)
+        return np.where(colored, self.hue_lut[hsv[..., 0]], 0).astype(np.uint8)
+
+    def hsv_histogram(self, hsv):
+        """
+        Oblicza histogram kolorów obrazu HSV jednym przejściem po pikselach.
+
+        Args:
+            hsv (np.ndarray): obraz w przestrzeni HSV
+
+        Returns:
+            dict: nazwa koloru -> udział pikseli tego koloru (0-1)
+        """
+        indices = self.classify_pixels(hsv)
+        counts = np.bincount(indices.ravel(), minlength=len(COLOR_NAMES) + 1)
+        return {name: float(counts[index]) / indices.size for index, name in enumerate(COLOR_NAMES, start=1)}
+
+    def histogram(self, frame):
+        """
+        Oblicza histogram kolorów w obszarze zainteresowania.
+
+        Args:
+            frame (np.ndarray): ramka obrazu w formacie BGR
+
+        Returns:
+            dict: nazwa koloru -> udział pikseli tego koloru (0-1)
+        """
+        return self.hsv_histogram(self.to_hsv(frame))
+
+    def dominant_color(self, fractions):
+        """
+        Wybiera kolor dominujący z histogramu.
+
+        Args:
+            fractions (dict): nazwa koloru -> udział pikseli tego koloru
+
+        Returns:
+            str: nazwa dominującego koloru
+        """
+        name = max(fractions, key=fractions.get)
+        return name if fractions[name] >= self.min_fraction else NO_COLOR
+
+    def detect(self, frame):
+        """
+        Rozpoznaje dominujący kolor w obszarze zainteresowania.
+
+        Args:
+            frame (np.ndarray): ramka obrazu w formacie BGR
+
+        Returns:
+            tuple: nazwa dominującego koloru oraz histogram kolorów
+        """
+        fractions = self.histogram(frame)
+        return self.dominant_color(fractions), fractions
+
+    def dominant_mask(self, frame):
+        """
+        Tworzy maskę dominującego koloru dla obszaru zainteresowania.
+
+        Args:
+            frame (np.ndarray): ramka obrazu w formacie BGR
+
+        Returns:
+            tuple: nazwa dominującego koloru oraz maska (None, jeśli brak dominującego koloru)
+        """
+        hsv = self.to_hsv(frame)
+        name = self.dominant_color(self.hsv_histogram(hsv))
+        if name == NO_COLOR:
+            return name, None
+        return name, self.color_mask(hsv, name)
+
+
+def measure_frame_cost(detector, frame, repeats=100):
+    """
+    Mierzy średni czas analizy jednej ramki.
+
+    Args:
+        detector (ColorDetector): detektor kolorów
+        frame (np.ndarray): ramka obrazu
+        repeats (int): liczba powtórzeń
+
+    Returns:
+        float: średni czas w milisekundach
+    """
+    detector.detect(frame)  # Rozgrzewka
+    start = time.perf_counter()
+    for _ in range(repeats):
+        detector.detect(frame)
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    """
+    Pomiar kosztu analizy syntetycznej ramki 1080p dla różnych ustawień detektora.
+    """
+    rng = np.random.default_rng(42)
+    frame = rng.integers(0, 256, size=(1080, 1920, 3), dtype=np.uint8)
+    budget_ms = 1000 / 60
+
+    for label, detector in (("ROI 64x64", ColorDetector()),
+                            ("cala ramka", ColorDetector(roi_size=None)),
+                            ("cala ramka, co 2. piksel", ColorDetector(roi_size=None, step=2))):
+        cost = measure_frame_cost(detector, frame)
+        status = "OK" if cost <= budget_ms else "za wolno"
+        print(f"{label}: {cost:.2f} ms/ramka ({1000 / cost:.0f} fps) - {status} dla 60 fps")
+
+
+if __name__ == "__main__":
+    main()
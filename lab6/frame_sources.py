@@ -0,0 +1,229 @@
+"""
+Moduł: Źródła ramek i wyjścia wyników dla rozpoznawania kolorów
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+
+Opis:
+Wspólny interfejs źródeł ramek (kamerka, plik wideo, katalog obrazów, generator syntetyczny) oraz wyjść
+(okno podglądu, plik wideo z naniesionymi wynikami, plik JSON Lines z wykryciami). Pozwala uruchamiać
+program i mierzyć jego wydajność na serwerach bez kamery i bez ekranu.
+"""
+
+import json
+import os
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class FrameSource:
+    """
+    Bazowa klasa źródła ramek. Metoda read zwraca (ret, frame) tak jak cv2.VideoCapture.read.
+    """
+
+    def isOpened(self):
+        """Zwraca True, jeśli źródło jest gotowe do odczytu."""
+        return True
+
+    def read(self):
+        """Zwraca kolejną ramkę jako (ret, frame)."""
+        raise NotImplementedError
+
+    def release(self):
+        """Zwalnia zasoby źródła."""
+
+    def __iter__(self):
+        while True:
+            ret, frame = self.read()
+            if not ret:
+                return
+            yield frame
+
+
+class CaptureSource(FrameSource):
+    """
+    Źródło korzystające z cv2.VideoCapture (kamerka lub plik wideo).
+    """
+
+    def __init__(self, device):
+        """
+        Args:
+            device (int or str): numer kamerki lub ścieżka do pliku wideo
+        """
+        self.capture = cv2.VideoCapture(device)
+
+    def isOpened(self):
+        return self.capture.isOpened()
+
+    def read(self):
+        return self.capture.read()
+
+    def release(self):
+        self.capture.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """
+    Źródło zwracające kolejne obrazy z katalogu (w kolejności alfabetycznej).
+    """
+
+    def __init__(self, directory, loop=False):
+        """
+        Args:
+            directory (str): ścieżka do katalogu z obrazami
+            loop (bool): po ostatnim obrazie zacząć od początku
+        """
+        self.paths = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                            if name.lower().endswith(IMAGE_EXTENSIONS))
+        self.loop = loop
+        self.index = 0
+
+    def isOpened(self):
+        return bool(self.paths)
+
+    def read(self):
+        if self.index >= len(self.paths):
+            if not self.loop or not self.paths:
+                return False, None
+            self.index = 0
+        frame = cv2.imread(self.paths[self.index])
+        self.index += 1
+        return frame is not None, frame
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generator syntetycznych ramek: szum tła i przesuwające się prostokąty w kolorach czerwonym, zielonym i niebieskim.
+    """
+
+    def __init__(self, width=1920, height=1080, count=300, seed=42):
+        """
+        Args:
+            width (int): szerokość ramki
+            height (int): wysokość ramki
+            count (int): liczba ramek (None - bez końca)
+            seed (int): ziarno generatora liczb losowych
+        """
+        rng = np.random.default_rng(seed)
+        self.background = rng.integers(0, 80, size=(height, width, 3), dtype=np.uint8)
+        self.width, self.height = width, height
+        self.count = count
+        self.index = 0
+
+    def read(self):
+        if self.count is not None and self.index >= self.count:
+            return False, None
+        frame = self.background.copy()
+        size = min(self.width, self.height) // 4
+        for k, color in enumerate([(0, 0, 255), (0, 255, 0), (255, 0, 0)]):
+            x = (self.index * (k + 3) * 7 + k * self.width // 3) % max(1, self.width - size)
+            y = (self.index * (k + 2) * 5 + k * self.height // 3) % max(1, self.height - size)
+            frame[y:y + size, x:x + size] = color
+        self.index += 1
+        return True, frame
+
+
+def open_source(spec):
+    """
+    Tworzy źródło ramek na podstawie opisu.
+
+    Args:
+        spec (str): "webcam" lub "webcam:N", "synthetic" lub "synthetic:SZERxWYS:LICZBA",
+            ścieżka do katalogu z obrazami albo ścieżka do pliku wideo
+
+    Returns:
+        FrameSource: źródło ramek
+    """
+    if spec.startswith("webcam"):
+        _, _, index = spec.partition(":")
+        return CaptureSource(int(index or 0))
+    if spec.startswith("synthetic"):
+        parts = spec.split(":")
+        width, height = map(int, parts[1].split("x")) if len(parts) > 1 else (1920, 1080)
+        count = int(parts[2]) if len(parts) > 2 else 300
+        return SyntheticSource(width, height, count)
+    if os.path.isdir(spec):
+        return ImageDirectorySource(spec)
+    return CaptureSource(spec)
+
+
+class DisplaySink:
+    """
+    Wyjście wyświetlające ramki w oknie OpenCV.
+    """
+
+    def __init__(self, title="Rozpoznawanie Kolorow"):
+        self.title = title
+
+    def write(self, frame, detection):
+        """
+        Wyświetla ramkę.
+
+        Returns:
+            bool: False, jeśli użytkownik nacisnął 'q'
+        """
+        cv2.imshow(self.title, frame)
+        return not (cv2.waitKey(1) & 0xFF == ord('q'))
+
+    def close(self):
+        cv2.destroyAllWindows()
+
+
+class VideoSink:
+    """
+    Wyjście zapisujące ramki z naniesionymi wynikami do pliku wideo.
+    """
+
+    def __init__(self, path, fps=30.0, codec="mp4v"):
+        self.path = path
+        self.fps = fps
+        self.fourcc = cv2.VideoWriter_fourcc(*codec)
+        self.writer = None
+
+    def write(self, frame, detection):
+        if self.writer is None:
+            height, width = frame.shape[:2]
+            self.writer = cv2.VideoWriter(self.path, self.fourcc, self.fps, (width, height))
+        self.writer.write(frame)
+        return True
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.release()
+
+
+class JsonSink:
+    """
+    Wyjście zapisujące wykrycia do pliku JSON Lines (jedna linia na ramkę).
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "w")
+        self.index = 0
+
+    def write(self, frame, detection):
+        json.dump({"frame": self.index, **detection}, self.file)
+        self.file.write("\n")
+        self.index += 1
+        return True
+
+    def close(self):
+        self.file.close()
+
+
+def open_sink(output):
+    """
+    Tworzy wyjście na podstawie ścieżki.
+
+    Args:
+        output (str): None - okno podglądu, *.json/*.jsonl - wykrycia w JSON, inne - plik wideo
+
+    Returns:
+        Wyjście z metodami write(frame, detection) i close()
+    """
+    if output is None:
+        return DisplaySink()
+    if output.endswith((".json", ".jsonl")):
+        return JsonSink(output)
+    return VideoSink(output)
@@ -12,30 +12,14 @@ Wykorzystane biblioteki:
 - NumPy: do pracy z macierzami obrazu
 """
 
-import cv2
-import numpy as np
+import argparse
 
+import cv2
 
-def get_dominant_color(b, g, r):
-    """
-    Funkcja rozpoznaje dominujący kolor na podstawie wartości kanałów RGB.
-
-    Args:
-        b (int): wartość kanału niebieskiego (Blue)
-        g (int): wartość kanału zielonego (Green)
-        r (int): wartość kanału czerwonego (Red)
-
-    Returns:
-        str: nazwa dominującego koloru (czerwony, zielony, niebieski lub brak dominującego koloru)
-    """
-    if r > g and r > b:
-        return "Czerwony"
-    elif g > r and g > b:
-        return "Zielony"
-    elif b > r and b > g:
-        return "Niebieski"
-    else:
-        return "Brak dominujacego koloru"
+from color_detector import ColorDetector
+from frame_sources import open_sink, open_source
+from pipeline import FramePipeline
+from tracking import ColorTracker, draw_tracks, snapshot_tracks
 
 
 def draw_crosshair(frame, x, y):
@@ -55,54 +39,166 @@ def draw_crosshair(frame, x, y):
     cv2.line(frame, (x, y - 20), (x, y + 20), color, thickness)
 
 
-def main():
+def draw_roi(frame, detector):
     """
-    Główna funkcja programu. Obsługuje kamerę, analizuje kolor w środku obrazu i wyświetla wynik.
+    Funkcja rysuje prostokąt analizowanego obszaru.
+
+    Args:
+        frame (np.ndarray): ramka obrazu z kamerki
+        detector (ColorDetector): detektor kolorów
     """
-    # Uruchomienie kamerki
-    cap = cv2.VideoCapture(0)
+    x1, y1, x2, y2 = detector.roi_bounds(frame)
+    cv2.rectangle(frame, (x1, y1), (x2 - 1, y2 - 1), (0, 255, 255), 1)
 
-    if not cap.isOpened():
-        print("Nie można uzyskać dostępu do kamerki.")
-        return
 
+def annotate_frame(frame, color_name, detector, stats_text=None):
+    """
+    Funkcja nanosi na ramkę nazwę rozpoznanego koloru, celownik, analizowany obszar i statystyki potoku.
+
+    Args:
+        frame (np.ndarray): ramka obrazu z kamerki
+        color_name (str): nazwa rozpoznanego koloru
+        detector (ColorDetector): detektor kolorów
+        stats_text (str): opis opóźnień i liczby klatek na sekundę (opcjonalnie)
+    """
+    height, width, _ = frame.shape
+    center_x, center_y = width // 2, height // 2
+
+    # Wyświetlenie informacji o rozpoznanym kolorze
+    cv2.putText(
+        frame,
+        f"Kolor: {color_name}",
+        (10, 30),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1,
+        (255, 255, 255),
+        2,
+    )
+
+    if stats_text:
+        cv2.putText(frame, stats_text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 255, 255), 1)
+
+    # Rysowanie celownika i analizowanego obszaru
+    draw_crosshair(frame, center_x, center_y)
+    draw_roi(frame, detector)
+
+
+def detect_frame(detector, frame):
+    """
+    Funkcja analizuje ramkę i zwraca wykrycie w postaci słownika (do zapisu w JSON).
+
+    Args:
+        detector (ColorDetector): detektor kolorów
+        frame (np.ndarray): ramka obrazu
+
+    Returns:
+        dict: nazwa dominującego koloru i udziały poszczególnych kolorów
+    """
+    color_name, fractions = detector.detect(frame)
+    return {"color": color_name, "fractions": {name: round(value, 4) for name, value in fractions.items()}}
+
+
+def benchmark(source, detector):
+    """
+    Funkcja przetwarza wszystkie ramki ze źródła tak szybko, jak to możliwe, i wypisuje liczbę klatek na sekundę.
+
+    Args:
+        source (FrameSource): źródło ramek
+        detector (ColorDetector): detektor kolorów
+
+    Returns:
+        dict: liczba ramek, FPS całego przetwarzania (odczyt + analiza) i FPS samej analizy
+    """
+    frames, read_time, detect_time = 0, 0.0, 0.0
+    tick = cv2.getTickFrequency()
     while True:
-        ret, frame = cap.read()  # Pobranie ramki z kamerki
+        start = cv2.getTickCount()
+        ret, frame = source.read()
+        read_end = cv2.getTickCount()
         if not ret:
-            print("Nie udało się odczytać obrazu z kamerki.")
             break
+        detector.detect(frame)
+        detect_time += (cv2.getTickCount() - read_end) / tick
+        read_time += (read_end - start) / tick
+        frames += 1
 
-        height, width, _ = frame.shape
-        center_x, center_y = width // 2, height // 2
-
-        # Pobranie wartości RGB z punktu na środku obrazu
-        b, g, r = frame[center_y, center_x]
-        color_name = get_dominant_color(b, g, r)
+    result = {
+        "frames": frames,
+        "fps": frames / (read_time + detect_time) if frames else 0.0,
+        "detect_fps": frames / detect_time if detect_time else 0.0,
+    }
+    print(f"Ramki: {frames}, odczyt + analiza: {result['fps']:.1f} fps, sama analiza: {result['detect_fps']:.1f} fps")
+    return result
 
-        # Wyświetlenie informacji o rozpoznanym kolorze
-        cv2.putText(
-            frame,
-            f"Kolor: {color_name}",
-            (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (255, 255, 255),
-            2,
-        )
 
-        # Rysowanie celownika
-        draw_crosshair(frame, center_x, center_y)
+def main(argv=None):
+    """
+    Główna funkcja programu. Obsługuje źródło ramek (domyślnie kamerkę), analizuje kolor w obszarze wokół
+    środka obrazu i wyświetla wynik lub zapisuje go do pliku.
+    Przechwytywanie i analiza działają w osobnych wątkach, wątek główny tylko wyświetla lub zapisuje wyniki.
+    """
+    parser = argparse.ArgumentParser(description="Rozpoznawanie kolorów z kamerki, pliku wideo lub katalogu obrazów.")
+    parser.add_argument("--source", default="webcam",
+                        help="webcam[:N], plik wideo, katalog z obrazami lub synthetic[:SZERxWYS:LICZBA]")
+    parser.add_argument("--output", default=None,
+                        help="tryb bez ekranu: plik wideo z wynikami lub plik .jsonl z wykryciami")
+    parser.add_argument("--roi", type=int, default=64, help="rozmiar analizowanego obszaru (0 - cała ramka)")
+    parser.add_argument("--benchmark", action="store_true", help="zmierz liczbę klatek na sekundę dla źródła")
+    parser.add_argument("--track", action="store_true", help="śledź wiele kolorowych obiektów z wygładzaniem koloru")
+    args = parser.parse_args(argv)
+
+    detector = ColorDetector(roi_size=(args.roi, args.roi) if args.roi > 0 else None)
+
+    # Uruchomienie źródła ramek (domyślnie kamerki)
+    source = open_source(args.source)
+
+    if not source.isOpened():
+        print("Nie można uzyskać dostępu do źródła obrazu.")
+        return
 
-        # Wyświetlenie obrazu
-        cv2.imshow("Rozpoznawanie Kolorow", frame)
+    if args.benchmark:
+        benchmark(source, detector)
+        source.release()
+        return
 
-        # Wyjście z programu po wciśnięciu klawisza 'q'
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+    # Na żywo (kamerka) odrzucamy ramki, z plików przetwarzamy wszystkie po kolei
+    live = args.source.startswith("webcam")
+    sink = open_sink(args.output)
+    tracker = ColorTracker() if args.track else None
+
+    def process(frame):
+        detection = detect_frame(detector, frame)
+        if tracker is not None:
+            # Kopia stanu powstaje w wątku roboczym, zanim tracker zmieni obiekty przy następnej ramce
+            detection["objects"] = snapshot_tracks(tracker.process(frame))
+        return detection
+
+    # Tracker wymaga ramek w kolejności, więc korzysta z jednego wątku roboczego
+    workers = 2 if live and tracker is None else 1
+    pipeline = FramePipeline(source.read, process, workers=workers, drop_frames=live).start()
+
+    while not pipeline.is_finished():
+        item = pipeline.get_result(timeout=0.1)
+        if item is None:
+            continue
+        frame, detection = item
+
+        annotate_frame(frame, detection["color"], detector, pipeline.report())
+        if tracker is not None:
+            draw_tracks(frame, detection["objects"])
+
+        # Wyświetlenie lub zapis obrazu, wyjście z programu po wciśnięciu klawisza 'q'
+        if not sink.write(frame, detection):
             break
 
+    if live and pipeline.finished.is_set():
+        print("Nie udało się odczytać obrazu z kamerki.")
+
     # Zwolnienie zasobów
-    cap.release()
-    cv2.destroyAllWindows()
+    pipeline.stop()
+    print(pipeline.report())
+    source.release()
+    sink.close()
 
 
 if __name__ == "__main__":
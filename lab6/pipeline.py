@@ -0,0 +1,239 @@
+"""
+Moduł: Wielowątkowy potok przechwytywania, analizy i wyświetlania obrazu
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+
+Opis:
+Wątek przechwytywania zapisuje ramki do ograniczonego bufora cyklicznego, wątki robocze analizują je
+(rozpoznawanie koloru), a wątek główny wyświetla wyniki. Gdy analiza nie nadąża, najstarsze ramki są
+odrzucane, dzięki czemu opóźnienie nie rośnie. Dla każdego etapu mierzone są opóźnienia i liczba klatek na sekundę.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class RingBuffer:
+    """
+    Ograniczony bufor cykliczny bezpieczny wątkowo. Przy zapełnieniu nadpisuje najstarszy element.
+    """
+
+    def __init__(self, capacity):
+        """
+        Inicjalizuje bufor.
+
+        Args:
+            capacity (int): maksymalna liczba elementów
+        """
+        self.items = deque(maxlen=capacity)
+        self.condition = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item, block=False, timeout=None):
+        """
+        Dodaje element. Jeśli bufor jest pełny, odrzuca najstarszy element albo (block=True) czeka na miejsce.
+
+        Args:
+            item: dodawany element
+            block (bool): czekać na wolne miejsce zamiast odrzucać elementy
+            timeout (float): maksymalny czas oczekiwania przy block=True
+
+        Returns:
+            bool: False, jeśli element nie został dodany z powodu przekroczenia czasu oczekiwania
+        """
+        with self.condition:
+            if block:
+                self.condition.wait_for(lambda: len(self.items) < self.items.maxlen, timeout)
+                if len(self.items) == self.items.maxlen:
+                    return False
+            elif len(self.items) == self.items.maxlen:
+                self.dropped += 1
+            self.items.append(item)
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout=None):
+        """
+        Pobiera najstarszy element, czekając na niego maksymalnie timeout sekund.
+
+        Args:
+            timeout (float): maksymalny czas oczekiwania (None - bez limitu)
+
+        Returns:
+            Element lub None, jeśli bufor pozostał pusty.
+        """
+        with self.condition:
+            if not self.items:
+                self.condition.wait(timeout)
+            if not self.items:
+                return None
+            item = self.items.popleft()
+            self.condition.notify_all()
+            return item
+
+    def __len__(self):
+        with self.condition:
+            return len(self.items)
+
+    def wake_all(self):
+        """Budzi wszystkie wątki czekające na element (używane przy zatrzymywaniu potoku)."""
+        with self.condition:
+            self.condition.notify_all()
+
+
+class StageStats:
+    """
+    Statystyki jednego etapu potoku: liczba ramek, średnie opóźnienie i liczba klatek na sekundę.
+    """
+
+    def __init__(self, window=120):
+        """
+        Inicjalizuje statystyki.
+
+        Args:
+            window (int): liczba ostatnich pomiarów uwzględnianych w średnich
+        """
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=window)
+        self.timestamps = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, latency):
+        """
+        Zapisuje pomiar opóźnienia jednej ramki.
+
+        Args:
+            latency (float): opóźnienie w sekundach
+        """
+        with self.lock:
+            self.count += 1
+            self.latencies.append(latency)
+            self.timestamps.append(time.perf_counter())
+
+    def latency_ms(self):
+        """Zwraca średnie opóźnienie w milisekundach."""
+        with self.lock:
+            return sum(self.latencies) / len(self.latencies) * 1000 if self.latencies else 0.0
+
+    def fps(self):
+        """Zwraca liczbę klatek na sekundę z ostatnich pomiarów."""
+        with self.lock:
+            if len(self.timestamps) < 2:
+                return 0.0
+            return (len(self.timestamps) - 1) / (self.timestamps[-1] - self.timestamps[0])
+
+
+class FramePipeline:
+    """
+    Potok: wątek przechwytywania -> bufor -> wątki robocze -> bufor wyników -> konsument.
+    """
+
+    def __init__(self, read_frame, process_frame, workers=2, buffer_size=2, drop_frames=True):
+        """
+        Inicjalizuje potok.
+
+        Args:
+            read_frame (callable): funkcja zwracająca (ret, frame), np. cap.read
+            process_frame (callable): funkcja analizująca ramkę i zwracająca wynik
+            workers (int): liczba wątków roboczych
+            buffer_size (int): pojemność buforów ramek i wyników
+            drop_frames (bool): odrzucać ramki, gdy analiza nie nadąża (False - np. dla plików wideo,
+                wtedy przy jednym wątku roboczym przetwarzana jest każda ramka w kolejności)
+        """
+        self.drop_frames = drop_frames
+        self.read_frame = read_frame
+        self.process_frame = process_frame
+        self.frames = RingBuffer(buffer_size)
+        self.results = RingBuffer(buffer_size)
+        self.stats = {"capture": StageStats(), "process": StageStats(), "display": StageStats()}
+        self.running = False
+        self.finished = threading.Event()
+        self.threads = [threading.Thread(target=self._capture_loop, name="capture", daemon=True)]
+        self.threads += [threading.Thread(target=self._process_loop, name=f"process-{i}", daemon=True)
+                         for i in range(workers)]
+        self.last_sequence = -1
+
+    def start(self):
+        """Uruchamia wątki przechwytywania i analizy."""
+        self.running = True
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """Zatrzymuje potok i czeka na zakończenie wątków."""
+        self.running = False
+        self.frames.wake_all()
+        self.results.wake_all()
+        for thread in self.threads:
+            thread.join(timeout=1.0)
+
+    def _capture_loop(self):
+        sequence = 0
+        while self.running:
+            start = time.perf_counter()
+            ret, frame = self.read_frame()
+            if not ret:
+                self.finished.set()
+                break
+            captured = time.perf_counter()
+            self.stats["capture"].record(captured - start)
+            item = (sequence, captured, frame)
+            while not self.frames.put(item, block=not self.drop_frames, timeout=0.1):
+                if not self.running:
+                    return
+            sequence += 1
+        self.frames.wake_all()
+
+    def _process_loop(self):
+        while self.running:
+            item = self.frames.get(timeout=0.1)
+            if item is None:
+                # Źródło mogło się wyczerpać tuż po upływie czasu oczekiwania - kończymy dopiero przy pustym buforze
+                if self.finished.is_set() and not len(self.frames):
+                    break
+                continue
+            sequence, captured, frame = item
+            start = time.perf_counter()
+            result = self.process_frame(frame)
+            self.stats["process"].record(time.perf_counter() - start)
+            item = (sequence, captured, frame, result)
+            while not self.results.put(item, block=not self.drop_frames, timeout=0.1):
+                if not self.running:
+                    return
+
+    def get_result(self, timeout=0.1):
+        """
+        Pobiera kolejny wynik dla konsumenta. Wyniki starsze niż ostatnio zwrócony są pomijane.
+
+        Args:
+            timeout (float): maksymalny czas oczekiwania w sekundach
+
+        Returns:
+            tuple: (ramka, wynik) lub None, jeśli brak nowego wyniku
+        """
+        item = self.results.get(timeout)
+        while item is not None and item[0] <= self.last_sequence:
+            item = self.results.get(0)
+        if item is None:
+            return None
+        sequence, captured, frame, result = item
+        self.last_sequence = sequence
+        self.stats["display"].record(time.perf_counter() - captured)
+        return frame, result
+
+    def is_finished(self):
+        """Zwraca True, jeśli źródło ramek się wyczerpało, wątki skończyły pracę i wszystkie wyniki zostały pobrane."""
+        return (self.finished.is_set() and not any(thread.is_alive() for thread in self.threads)
+                and not self.results.items)
+
+    def report(self):
+        """
+        Zwraca opis statystyk wszystkich etapów.
+
+        Returns:
+            str: opóźnienia (ms) i liczba klatek na sekundę dla etapów oraz liczba odrzuconych ramek
+        """
+        parts = [f"{name}: {stats.latency_ms():.1f} ms, {stats.fps():.1f} fps" for name, stats in self.stats.items()]
+        dropped = self.frames.dropped + self.results.dropped
+        return " | ".join(parts) + f" | odrzucone: {dropped}"
@@ -0,0 +1,228 @@
+"""
+Moduł: Śledzenie wielu kolorowych obiektów z wygładzaniem w czasie
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+
+Opis:
+Każda ramka jest dzielona na kolorowe plamy (maski HSV + składowe spójne), a plamy są przypisywane do
+śledzonych obiektów przez przyrostowy tracker centroidów. Kolor każdego obiektu jest wygładzany głosowaniem
+w przesuwanym oknie ostatnich ramek, dzięki czemu wynik nie migocze. Bufory masek są alokowane raz i
+używane ponownie, więc liczba alokacji na ramkę pozostaje stała.
+"""
+
+from collections import Counter, deque
+
+import cv2
+import numpy as np
+
+from color_detector import COLOR_NAMES, ColorDetector
+
+
+class BlobSegmenter:
+    """
+    Klasa dzieląca ramkę na kolorowe plamy z użyciem wstępnie zaalokowanych buforów.
+    """
+
+    def __init__(self, detector=None, min_area=400, step=2):
+        """
+        Inicjalizuje segmentację.
+
+        Args:
+            detector (ColorDetector): detektor z zakresami kolorów (domyślny, jeśli None)
+            min_area (int): minimalna powierzchnia plamy w pikselach (po zmniejszeniu obrazu)
+            step (int): współczynnik zmniejszenia obrazu przed segmentacją
+        """
+        self.detector = detector or ColorDetector(roi_size=None)
+        self.min_area = min_area
+        self.step = max(1, int(step))
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        self.shape = None
+
+    def _allocate(self, shape):
+        height, width = shape[0] // self.step, shape[1] // self.step
+        self.shape = shape
+        self.small = np.empty((height, width, 3), dtype=np.uint8)
+        self.hsv = np.empty((height, width, 3), dtype=np.uint8)
+        self.mask = np.empty((height, width), dtype=np.uint8)
+        self.part = np.empty((height, width), dtype=np.uint8)
+        self.labels = np.empty((height, width), dtype=np.int32)
+
+    def segment(self, frame):
+        """
+        Znajduje kolorowe plamy w ramce.
+
+        Args:
+            frame (np.ndarray): ramka obrazu w formacie BGR
+
+        Returns:
+            list: krotki (kolor, centroid (x, y), prostokąt (x, y, w, h), powierzchnia) we współrzędnych ramki
+        """
+        if self.shape != frame.shape:
+            self._allocate(frame.shape)
+        cv2.resize(frame, (self.small.shape[1], self.small.shape[0]), dst=self.small, interpolation=cv2.INTER_NEAREST)
+        cv2.cvtColor(self.small, cv2.COLOR_BGR2HSV, dst=self.hsv)
+
+        blobs = []
+        for name in COLOR_NAMES:
+            ranges = self.detector.bounds[name]
+            cv2.inRange(self.hsv, ranges[0][0], ranges[0][1], dst=self.mask)
+            for low, high in ranges[1:]:
+                cv2.inRange(self.hsv, low, high, dst=self.part)
+                cv2.bitwise_or(self.mask, self.part, dst=self.mask)
+            cv2.morphologyEx(self.mask, cv2.MORPH_OPEN, self.kernel, dst=self.mask)
+
+            count, _, stats, centroids = cv2.connectedComponentsWithStats(self.mask, labels=self.labels, connectivity=8)
+            for index in range(1, count):
+                area = stats[index, cv2.CC_STAT_AREA]
+                if area < self.min_area:
+                    continue
+                x, y, w, h = stats[index, :4] * self.step
+                cx, cy = centroids[index] * self.step
+                blobs.append((name, (float(cx), float(cy)), (int(x), int(y), int(w), int(h)), int(area) * self.step ** 2))
+        return blobs
+
+
+class TrackedObject:
+    """
+    Śledzony obiekt: identyfikator, położenie i historia kolorów w przesuwanym oknie.
+    """
+
+    def __init__(self, object_id, blob, window):
+        """
+        Args:
+            object_id (int): identyfikator obiektu
+            blob (tuple): pierwsza przypisana plama
+            window (int): długość okna wygładzania koloru
+        """
+        self.object_id = object_id
+        self.history = deque(maxlen=window)
+        self.missing = 0
+        self.update(blob)
+
+    def update(self, blob):
+        """Aktualizuje obiekt na podstawie przypisanej plamy."""
+        color, self.centroid, self.bbox, self.area = blob
+        self.history.append(color)
+        self.missing = 0
+
+    @property
+    def color(self):
+        """str: kolor wygładzony głosowaniem większościowym w oknie."""
+        return Counter(self.history).most_common(1)[0][0]
+
+
+class CentroidTracker:
+    """
+    Przyrostowy tracker centroidów: plamy są przypisywane do najbliższych obiektów z poprzedniej ramki.
+    """
+
+    def __init__(self, max_distance=120, max_missing=10, window=15):
+        """
+        Inicjalizuje tracker.
+
+        Args:
+            max_distance (float): maksymalna odległość centroidów (w pikselach) przy przypisaniu
+            max_missing (int): liczba ramek bez przypisania, po której obiekt jest usuwany
+            window (int): długość okna wygładzania koloru
+        """
+        self.max_distance = max_distance
+        self.max_missing = max_missing
+        self.window = window
+        self.objects = {}
+        self.next_id = 0
+
+    def update(self, blobs):
+        """
+        Aktualizuje śledzone obiekty na podstawie plam z nowej ramki.
+
+        Args:
+            blobs (list): plamy zwrócone przez BlobSegmenter.segment
+
+        Returns:
+            list: aktualnie widoczne obiekty (TrackedObject)
+        """
+        ids = list(self.objects)
+        matched_ids, matched_blobs = set(), set()
+        if ids and blobs:
+            previous = np.array([self.objects[i].centroid for i in ids])
+            current = np.array([blob[1] for blob in blobs])
+            distances = np.linalg.norm(previous[:, np.newaxis, :] - current[np.newaxis, :, :], axis=2)
+
+            # Przypisanie zachłanne: najpierw pary o najmniejszej odległości
+            for flat in np.argsort(distances, axis=None):
+                row, col = divmod(int(flat), len(blobs))
+                if distances[row, col] > self.max_distance:
+                    break
+                if ids[row] in matched_ids or col in matched_blobs:
+                    continue
+                self.objects[ids[row]].update(blobs[col])
+                matched_ids.add(ids[row])
+                matched_blobs.add(col)
+
+        for object_id in ids:
+            if object_id not in matched_ids:
+                self.objects[object_id].missing += 1
+                if self.objects[object_id].missing > self.max_missing:
+                    del self.objects[object_id]
+
+        for col, blob in enumerate(blobs):
+            if col not in matched_blobs:
+                self.objects[self.next_id] = TrackedObject(self.next_id, blob, self.window)
+                self.next_id += 1
+
+        return [obj for obj in self.objects.values() if obj.missing == 0]
+
+
+class ColorTracker:
+    """
+    Połączenie segmentacji i śledzenia: dla każdej ramki zwraca śledzone obiekty z wygładzonym kolorem.
+    """
+
+    def __init__(self, segmenter=None, tracker=None):
+        """
+        Args:
+            segmenter (BlobSegmenter): segmentacja plam (domyślna, jeśli None)
+            tracker (CentroidTracker): tracker centroidów (domyślny, jeśli None)
+        """
+        self.segmenter = segmenter or BlobSegmenter()
+        self.tracker = tracker or CentroidTracker()
+
+    def process(self, frame):
+        """
+        Analizuje ramkę.
+
+        Args:
+            frame (np.ndarray): ramka obrazu w formacie BGR
+
+        Returns:
+            list: widoczne obiekty (TrackedObject)
+        """
+        return self.tracker.update(self.segmenter.segment(frame))
+
+
+def snapshot_tracks(objects):
+    """
+    Funkcja kopiuje stan śledzonych obiektów do zwykłych słowników. Obiekty zwrócone przez
+    ColorTracker.process są modyfikowane przy kolejnej ramce, więc inny wątek może korzystać tylko z kopii.
+
+    Args:
+        objects (list): obiekty zwrócone przez ColorTracker.process
+
+    Returns:
+        list: słowniki z kluczami "id", "color" i "bbox"
+    """
+    return [{"id": obj.object_id, "color": obj.color, "bbox": obj.bbox} for obj in objects]
+
+
+def draw_tracks(frame, tracks):
+    """
+    Funkcja rysuje prostokąty, identyfikatory i wygładzone kolory śledzonych obiektów.
+
+    Args:
+        frame (np.ndarray): ramka obrazu
+        tracks (list): słowniki zwrócone przez snapshot_tracks
+    """
+    for track in tracks:
+        x, y, w, h = track["bbox"]
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 255), 2)
+        cv2.putText(frame, f"#{track['id']} {track['color']}", (x, max(15, y - 5)),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
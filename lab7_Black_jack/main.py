@@ -8,22 +8,38 @@ Zawiera interfejs graficzny oraz system logowania decyzji podejmowanych przez AI
 Autorzy: Henryk Mudlaff, Benedykt Borowski
 """
 
+import queue
 import random
-import numpy as np
+import threading
+import time
+from collections import deque
+
 import tkinter as tk
 from tkinter import messagebox
 
+LOG_LINES = 200       # maksymalna liczba linii w logu akcji AI
+POLL_INTERVAL = 50    # co ile milisekund GUI odbiera wyniki z wątku AI
+BATCH_INTERVAL = 0.1  # co ile sekund wątek AI wysyła podsumowanie rozegranych rąk
+
 class Blackjack:
     """
     Klasa reprezentująca grę w Blackjacka.
     Obsługuje rozdawanie kart, obliczanie wartości ręki oraz zasady gry.
     """
-    def __init__(self):
-        """Inicjalizuje nową grę w Blackjacka."""
+    def __init__(self, shoe=None):
+        """
+        Inicjalizuje nową grę w Blackjacka.
+
+        Args:
+            shoe (Shoe): skończony but z taliami (jeśli None, karty losowane są z nieskończonej talii)
+        """
+        self.shoe = shoe
         self.reset()
 
     def reset(self):
         """Resetuje stan gry, rozdając nowe karty dla gracza i krupiera."""
+        if self.shoe is not None and self.shoe.needs_shuffle:
+            self.shoe.shuffle()
         self.player_hand = [self.draw_card(), self.draw_card()]
         self.dealer_hand = [self.draw_card(), self.draw_card()]
         self.done = False
@@ -31,7 +47,7 @@ class Blackjack:
 
     def draw_card(self):
         """Losuje jedną kartę, przy czym as ('A') jest reprezentowany jako wartość 1."""
-        card = random.randint(1, 10)
+        card = self.shoe.draw() if self.shoe is not None else random.randint(1, 10)
         return 'A' if card == 1 else card
 
     def get_hand_value(self, hand):
@@ -43,10 +59,24 @@ class Blackjack:
             value = sum(values)
         return value
 
+    def get_hand_info(self, hand):
+        """Zwraca wartość ręki oraz informację, czy ręka jest miękka (as liczony jako 11)."""
+        value = self.get_hand_value(hand)
+        soft = 'A' in hand and sum(1 if card == 'A' else card for card in hand) + 10 == value
+        return value, soft
+
     def get_state(self):
-        """Zwraca aktualny stan gry w postaci wartości ręki gracza i pierwszej karty krupiera."""
+        """
+        Zwraca aktualny stan gry w postaci wartości ręki gracza i pierwszej karty krupiera.
+        """
         return (self.get_hand_value(self.player_hand), self.dealer_hand[0])
 
+    def get_count(self):
+        """
+        Zwraca true count buta (0 przy nieskończonej talii, w której liczenie kart nic nie daje).
+        """
+        return self.shoe.true_count if self.shoe is not None else 0.0
+
     def step(self, action):
         """
         Wykonuje ruch gracza zgodnie z podaną akcją.
@@ -83,7 +113,15 @@ class BlackjackGUI:
         """Inicjalizuje interfejs graficzny gry."""
         self.window = tk.Tk()
         self.window.title("Blackjack Game")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
         self.env = None
+        self.ai = None
+        self.results = queue.Queue()
+        self.stop_event = threading.Event()
+        self.worker = None
+        self.poll_id = None
+        self.log = deque(maxlen=LOG_LINES)
+        self.stats = {"hands": 0, "wins": 0, "pushes": 0, "losses": 0}
 
         self.mode_frame = tk.Frame(self.window)
         self.mode_frame.pack(pady=10)
@@ -109,6 +147,9 @@ class BlackjackGUI:
         self.log_text = tk.Text(self.window, height=20, width=60)
         self.log_text.pack()
 
+        self.stats_label = tk.Label(self.window, text="")
+        self.stats_label.pack()
+
         self.hit_button = tk.Button(self.window, text="Hit", command=self.hit)
         self.hit_button.pack()
 
@@ -117,8 +158,135 @@ class BlackjackGUI:
 
         self.reset_game()
 
+    def reset_game(self):
+        """Rozpoczyna nowe rozdanie w trybie User vs AI i odblokowuje przyciski akcji."""
+        self.env = Blackjack()
+        self.hit_button.config(state=tk.NORMAL)
+        self.stand_button.config(state=tk.NORMAL)
+        self.update_display()
+
+    def update_display(self):
+        """Odświeża karty gracza i krupiera (druga karta krupiera jest zakryta do końca tury gracza)."""
+        if self.env is None:
+            return
+        dealer = self.env.dealer_hand if self.env.done else [self.env.dealer_hand[0], '?']
+        self.dealer_cards.config(text=" ".join(str(card) for card in dealer))
+        self.player_cards.config(
+            text=" ".join(str(card) for card in self.env.player_hand)
+            + f"  ({self.env.get_hand_value(self.env.player_hand)})")
+
+    def user_vs_ai(self):
+        """Zatrzymuje tryb AI vs AI i rozpoczyna grę użytkownika z krupierem."""
+        self.stop_ai()
+        self.reset_game()
+
+    def ai_vs_ai(self):
+        """Włącza lub wyłącza tryb AI vs AI, w którym ręce są rozgrywane w osobnym wątku."""
+        if self.worker is not None and self.worker.is_alive():
+            self.stop_ai()
+            return
+        if self.ai is None:
+            from strategy import StrategyAI
+            self.ai = StrategyAI()
+        self.hit_button.config(state=tk.DISABLED)
+        self.stand_button.config(state=tk.DISABLED)
+        self.ai_vs_ai_button.config(text="Stop AI")
+        # Pozostałości po poprzednim przebiegu nie mogą trafić do nowego
+        self.drain_results()
+        self.stop_event.clear()
+        self.worker = threading.Thread(target=self.play_hands, args=(self.ai, self.stop_event), daemon=True)
+        self.worker.start()
+        self.poll_id = self.window.after(POLL_INTERVAL, self.poll_results)
+
+    def stop_ai(self):
+        """Zatrzymuje wątek AI, anuluje odpytywanie kolejki i dolicza ostatnie wyniki zatrzymanego przebiegu."""
+        self.stop_event.set()
+        if self.poll_id is not None:
+            self.window.after_cancel(self.poll_id)
+            self.poll_id = None
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+            self.show_results(self.drain_results())
+        self.ai_vs_ai_button.config(text="AI vs AI")
+
+    def play_hands(self, ai, stop_event):
+        """
+        Pętla wątku AI: rozgrywa ręce bez przerwy i co BATCH_INTERVAL wysyła do kolejki podsumowanie
+        (liczby wyników, log ostatniej ręki i ostatnią rękę do wyświetlenia).
+        """
+        env = Blackjack()
+        batch = {"hands": 0, "wins": 0, "pushes": 0, "losses": 0}
+        deadline = time.perf_counter() + BATCH_INTERVAL
+        while not stop_event.is_set():
+            env.reset()
+            actions = []
+            reward = 0
+            while not env.done:
+                action = ai.choose_action(env)
+                actions.append("Hit" if action == 1 else "Stand")
+                _, reward, _ = env.step(action)
+            batch["hands"] += 1
+            batch["wins" if reward > 0 else "pushes" if reward == 0 else "losses"] += 1
+
+            if time.perf_counter() >= deadline:
+                value = env.get_hand_value(env.player_hand)
+                batch["log"] = (f"Gracz {env.player_hand} ({value}) vs krupier {env.dealer_hand}: "
+                                f"{', '.join(actions)} -> {reward:+d}")
+                batch["last"] = (list(env.player_hand), list(env.dealer_hand))
+                self.results.put(batch)
+                batch = {"hands": 0, "wins": 0, "pushes": 0, "losses": 0}
+                deadline = time.perf_counter() + BATCH_INTERVAL
+
+    def drain_results(self):
+        """
+        Odbiera wszystkie podsumowania z kolejki.
+
+        Returns:
+            list: odebrane podsumowania
+        """
+        batches = []
+        while True:
+            try:
+                batches.append(self.results.get_nowait())
+            except queue.Empty:
+                return batches
+
+    def poll_results(self):
+        """Odbiera podsumowania z kolejki (w wątku GUI), odświeża widok i planuje kolejne odpytanie."""
+        self.poll_id = None
+        self.show_results(self.drain_results())
+        if self.worker is not None:
+            self.poll_id = self.window.after(POLL_INTERVAL, self.poll_results)
+
+    def show_results(self, batches):
+        """Dolicza podsumowania do statystyk i odświeża widok."""
+        for batch in batches:
+            for key in self.stats:
+                self.stats[key] += batch[key]
+            self.log.append(batch["log"])
+
+        if batches:
+            last = batches[-1]["last"]
+            self.player_cards.config(text=" ".join(str(card) for card in last[0]))
+            self.dealer_cards.config(text=" ".join(str(card) for card in last[1]))
+            self.log_text.delete("1.0", tk.END)
+            self.log_text.insert(tk.END, "\n".join(self.log))
+            self.log_text.see(tk.END)
+            hands = self.stats["hands"]
+            ev = (self.stats["wins"] - self.stats["losses"]) / hands
+            self.stats_label.config(text=f"Ręce: {hands}, wygrane: {self.stats['wins']}, remisy: "
+                                         f"{self.stats['pushes']}, przegrane: {self.stats['losses']}, EV: {ev:+.4f}")
+
+    def close(self):
+        """Zatrzymuje wątek AI i zamyka okno."""
+        self.stop_ai()
+        self.window.destroy()
+
     def hit(self):
         """Obsługuje akcję 'Hit', dodając kartę do ręki gracza."""
+        if self.env.done:
+            return
         self.env.player_hand.append(self.env.draw_card())
         if self.env.get_hand_value(self.env.player_hand) > 21:
             self.end_game("Player busts! You lose.")
@@ -126,6 +294,8 @@ class BlackjackGUI:
 
     def stand(self):
         """Obsługuje akcję 'Stand', kończąc turę gracza i przechodząc do krupiera."""
+        if self.env.done:
+            return
         self.env.done = True
         while self.env.get_hand_value(self.env.dealer_hand) < 17:
             self.env.dealer_hand.append(self.env.draw_card())
@@ -146,6 +316,9 @@ class BlackjackGUI:
 
     def end_game(self, message):
         """Wyświetla komunikat końcowy i blokuje przyciski akcji."""
+        self.env.done = True
+        self.hit_button.config(state=tk.DISABLED)
+        self.stand_button.config(state=tk.DISABLED)
         self.update_display()
         messagebox.showinfo("Game Over", message)
 
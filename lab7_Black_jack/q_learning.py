@@ -0,0 +1,220 @@
+"""
+Moduł: Wektorowy trener Q-learning dla AI Blackjacka
+
+Opis:
+Tysiące gier Blackjack toczą się równolegle w jednym środowisku opartym na tablicach NumPy (ten sam
+interfejs stan/nagroda/koniec co Blackjack.step). Tablica Q jest aktualizowana wektorowo (uśrednione
+aktualizacje TD dla powtarzających się par stan-akcja), polityka jest zapisywana w punktach kontrolnych,
+a zbieżność jest raportowana względem optymalnej strategii z solvera.
+
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import os
+import time
+
+import numpy as np
+
+from simulator import ACTION_HIT, UNIFORM_CARD_PROBS, card_lookup, hand_value, play_dealer, simulate
+from strategy import StrategySolver
+
+Q_SHAPE = (22, 2, 11, 2)
+
+
+class BatchedBlackjack:
+    """
+    Wiele niezależnych gier Blackjack prowadzonych jednocześnie w tablicach NumPy.
+    """
+
+    def __init__(self, n_envs, seed=None, card_probs=UNIFORM_CARD_PROBS):
+        """
+        Args:
+            n_envs (int): liczba równoległych gier
+            seed (int): ziarno generatora liczb losowych
+            card_probs (np.ndarray): prawdopodobieństwa kart 1..10
+        """
+        self.n_envs = n_envs
+        self.rng = np.random.default_rng(seed)
+        self.lookup = card_lookup(card_probs)
+        self.player_hard = np.zeros(n_envs, dtype=np.int16)
+        self.player_ace = np.zeros(n_envs, dtype=bool)
+        self.upcard = np.zeros(n_envs, dtype=np.uint8)
+        self.reset(np.arange(n_envs))
+
+    def draw(self, size):
+        """Losuje size kart."""
+        return self.lookup[self.rng.integers(0, len(self.lookup), size=size, dtype=np.uint16)]
+
+    def reset(self, indices):
+        """
+        Rozdaje nowe karty w wybranych grach.
+
+        Args:
+            indices (np.ndarray): indeksy gier
+        """
+        cards = self.draw((3, len(indices)))
+        self.player_hard[indices] = cards[0].astype(np.int16) + cards[1]
+        self.player_ace[indices] = (cards[0] == 1) | (cards[1] == 1)
+        self.upcard[indices] = cards[2]
+
+    def get_state(self):
+        """
+        Zwraca stany wszystkich gier.
+
+        Returns:
+            tuple: (wartości rąk, flagi rąk miękkich, karty krupiera)
+        """
+        value, soft = hand_value(self.player_hard, self.player_ace)
+        return np.minimum(value, 21), soft.astype(np.intp), self.upcard.astype(np.intp)
+
+    def step(self, actions):
+        """
+        Wykonuje akcje we wszystkich grach. Zakończone gry są od razu rozdawane od nowa.
+
+        Args:
+            actions (np.ndarray): akcje (0 - stand, 1 - hit)
+
+        Returns:
+            tuple: (nowe stany, nagrody, flagi zakończenia) - stany zakończonych gier są stanami nowego rozdania
+        """
+        rewards = np.zeros(self.n_envs, dtype=np.float64)
+        done = np.zeros(self.n_envs, dtype=bool)
+
+        hit = np.flatnonzero(actions == ACTION_HIT)
+        card = self.draw(hit.size)
+        self.player_hard[hit] += card
+        self.player_ace[hit] |= card == 1
+        bust = hit[self.player_hard[hit] > 21]
+        rewards[bust] = -1.0
+        done[bust] = True
+
+        stand = np.flatnonzero(actions != ACTION_HIT)
+        if stand.size:
+            player_value, _ = hand_value(self.player_hard[stand], self.player_ace[stand])
+            dealer_value = play_dealer(self.upcard[stand], np.ones(stand.size, dtype=bool), self.draw)
+            result = np.sign(player_value - dealer_value).astype(np.float64)
+            result[dealer_value > 21] = 1.0
+            rewards[stand] = result
+            done[stand] = True
+
+        self.reset(np.flatnonzero(done))
+        return self.get_state(), rewards, done
+
+
+class QLearningTrainer:
+    """
+    Trener tablicy Q z wektorowymi aktualizacjami TD.
+    """
+
+    def __init__(self, n_envs=4096, alpha=0.05, epsilon=1.0, epsilon_min=0.05, epsilon_decay=0.999, seed=42):
+        """
+        Args:
+            n_envs (int): liczba równoległych gier
+            alpha (float): współczynnik uczenia
+            epsilon (float): początkowe prawdopodobieństwo losowej akcji
+            epsilon_min (float): minimalne prawdopodobieństwo losowej akcji
+            epsilon_decay (float): mnożnik epsilon po każdym kroku
+            seed (int): ziarno generatora liczb losowych
+        """
+        self.env = BatchedBlackjack(n_envs, seed)
+        self.rng = np.random.default_rng(seed + 1 if seed is not None else None)
+        self.q = np.zeros(Q_SHAPE)
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.epsilon_min = epsilon_min
+        self.epsilon_decay = epsilon_decay
+        self.steps = 0
+        self.hands = 0
+
+    def policy(self):
+        """Zwraca zachłanną politykę jako tabelę strategii (22, 2, 11)."""
+        return self.q.argmax(axis=3).astype(np.uint8)
+
+    def train_step(self):
+        """Wykonuje jeden krok we wszystkich grach i aktualizuje tablicę Q."""
+        total, soft, upcard = self.env.get_state()
+        greedy = self.q[total, soft, upcard].argmax(axis=1)
+        explore = self.rng.random(self.env.n_envs) < self.epsilon
+        actions = np.where(explore, self.rng.integers(0, 2, self.env.n_envs), greedy)
+
+        (next_total, next_soft, next_upcard), rewards, done = self.env.step(actions)
+        next_value = self.q[next_total, next_soft, next_upcard].max(axis=1)
+        targets = rewards + np.where(done, 0.0, next_value)
+
+        # Uśrednienie błędów TD dla tych samych par stan-akcja w jednym kroku
+        flat = np.ravel_multi_index((total, soft, upcard, actions), Q_SHAPE)
+        errors = targets - self.q.ravel()[flat]
+        sums = np.bincount(flat, weights=errors, minlength=self.q.size)
+        counts = np.bincount(flat, minlength=self.q.size)
+        updated = counts > 0
+        self.q.ravel()[updated] += self.alpha * sums[updated] / counts[updated]
+
+        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+        self.steps += 1
+        self.hands += int(done.sum())
+
+    def save(self, path):
+        """Zapisuje punkt kontrolny (tablica Q, polityka i stan treningu)."""
+        np.savez(path, q=self.q, policy=self.policy(), epsilon=self.epsilon, steps=self.steps, hands=self.hands)
+
+    def load(self, path):
+        """Wczytuje punkt kontrolny."""
+        data = np.load(path)
+        self.q = data["q"].copy()
+        self.epsilon = float(data["epsilon"])
+        self.steps = int(data["steps"])
+        self.hands = int(data["hands"])
+
+
+def policy_agreement(policy, optimal_policy):
+    """
+    Oblicza zgodność polityki z optymalną strategią na stanach osiągalnych w grze.
+
+    Args:
+        policy (np.ndarray): oceniana tabela strategii
+        optimal_policy (np.ndarray): optymalna tabela strategii
+
+    Returns:
+        float: odsetek zgodnych decyzji
+    """
+    mask = np.zeros((22, 2, 11), dtype=bool)
+    mask[4:21, 0, 1:] = True   # ręce twarde 4-20
+    mask[13:21, 1, 1:] = True  # ręce miękkie 13-20
+    return float((policy[mask] == optimal_policy[mask]).mean())
+
+
+def train(steps=3000, checkpoint="q_policy.npz", report_every=500, eval_hands=1_000_000, **kwargs):
+    """
+    Trenuje AI i raportuje zbieżność względem optymalnej strategii.
+
+    Args:
+        steps (int): liczba kroków treningu (każdy krok to jedna akcja w każdej z gier)
+        checkpoint (str): ścieżka punktu kontrolnego (wznawia trening, jeśli plik istnieje)
+        report_every (int): co ile kroków raportować postęp i zapisywać punkt kontrolny
+        eval_hands (int): liczba rąk do oceny wartości oczekiwanej polityki
+        **kwargs: dodatkowe argumenty QLearningTrainer
+
+    Returns:
+        QLearningTrainer: wytrenowany trener
+    """
+    trainer = QLearningTrainer(**kwargs)
+    if checkpoint and os.path.exists(checkpoint):
+        trainer.load(checkpoint)
+    optimal = StrategySolver().solve()
+
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        trainer.train_step()
+        if step % report_every == 0 or step == steps:
+            policy = trainer.policy()
+            ev = simulate(policy, eval_hands, seed=step)["ev"]
+            print(f"krok {trainer.steps}: {trainer.hands} rąk, {time.perf_counter() - start:.1f} s, "
+                  f"zgodność z optymalną strategią {policy_agreement(policy, optimal.policy):.1%}, "
+                  f"EV {ev:+.4f} (optymalne {optimal.ev_game:+.4f}), epsilon {trainer.epsilon:.3f}")
+            if checkpoint:
+                trainer.save(checkpoint)
+    return trainer
+
+
+if __name__ == "__main__":
+    train()
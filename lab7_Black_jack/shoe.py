@@ -0,0 +1,108 @@
+"""
+Moduł: Skończony but z wieloma taliami i liczeniem kart
+
+Opis:
+But z N taliami jest przechowywany jako tablica liczności 10 rang (as, 2..9, karty o wartości 10), więc
+losowanie karty ma stały koszt niezależny od liczby talii. Po przekroczeniu zadanej penetracji but jest
+tasowany od nowa. Liczenie kart systemem Hi-Lo (running count i true count) jest aktualizowane przy
+każdej dobranej karcie. Metoda deal pozwala szybko rozdawać wiele kart naraz na potrzeby symulacji.
+
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import numpy as np
+
+# Liczba kart każdej rangi w jednej talii: as, 2..9 oraz 10, walet, dama, król
+DECK_COUNTS = np.array([4, 4, 4, 4, 4, 4, 4, 4, 4, 16], dtype=np.int32)
+# Wartości Hi-Lo: 2-6 -> +1, 7-9 -> 0, 10 i as -> -1
+HI_LO = np.array([-1, 1, 1, 1, 1, 1, 0, 0, 0, -1], dtype=np.int32)
+
+
+class Shoe:
+    """
+    But z N taliami z licznikiem Hi-Lo.
+    """
+
+    def __init__(self, n_decks=6, penetration=0.75, seed=None):
+        """
+        Args:
+            n_decks (int): liczba talii w bucie
+            penetration (float): część buta rozdawana przed ponownym tasowaniem
+            seed (int): ziarno generatora liczb losowych
+        """
+        self.n_decks = n_decks
+        self.penetration = penetration
+        self.rng = np.random.default_rng(seed)
+        self.size = int(DECK_COUNTS.sum()) * n_decks
+        self.shuffle()
+
+    def shuffle(self):
+        """Przywraca pełny but i zeruje licznik."""
+        self.counts = DECK_COUNTS * self.n_decks
+        self.remaining = self.size
+        self.running_count = 0
+
+    @property
+    def needs_shuffle(self):
+        """bool: czy rozdano już część buta wyznaczoną przez penetrację."""
+        return self.remaining <= self.size * (1.0 - self.penetration)
+
+    @property
+    def decks_remaining(self):
+        """float: liczba talii pozostałych w bucie."""
+        return self.remaining / DECK_COUNTS.sum()
+
+    @property
+    def true_count(self):
+        """float: running count podzielony przez liczbę pozostałych talii."""
+        return self.running_count / max(self.decks_remaining, 0.5)
+
+    def draw(self):
+        """
+        Dobiera jedną kartę (po wyczerpaniu buta jest on tasowany).
+
+        Returns:
+            int: wartość karty (1 - as, 10 - karty o wartości 10)
+        """
+        if self.remaining == 0:
+            self.shuffle()
+        position = int(self.rng.integers(self.remaining))
+        rank = 0
+        while position >= self.counts[rank]:
+            position -= self.counts[rank]
+            rank += 1
+        self.counts[rank] -= 1
+        self.remaining -= 1
+        self.running_count += int(HI_LO[rank])
+        return rank + 1
+
+    def deal(self, n):
+        """
+        Rozdaje n kart naraz w losowej kolejności.
+
+        Args:
+            n (int): liczba kart (nie większa niż liczba kart w bucie)
+
+        Returns:
+            np.ndarray: wartości kart (1 - as, 10 - karty o wartości 10)
+        """
+        if n > self.remaining:
+            raise ValueError(f"W bucie pozostało {self.remaining} kart, żądano {n}")
+        drawn = self.rng.multivariate_hypergeometric(self.counts, n)
+        self.counts = self.counts - drawn
+        self.remaining -= n
+        self.running_count += int(drawn @ HI_LO)
+        cards = np.repeat(np.arange(1, 11, dtype=np.uint8), drawn)
+        return self.rng.permutation(cards)
+
+    def card_probs(self):
+        """
+        Zwraca prawdopodobieństwa kart 1..10 dla bieżącego składu buta (np. dla StrategySolver).
+        Wyczerpany but jest najpierw tasowany, tak jak w draw, bo następna karta pochodzi z nowego buta.
+
+        Returns:
+            np.ndarray: prawdopodobieństwa kart
+        """
+        if self.remaining == 0:
+            self.shuffle()
+        return self.counts / self.remaining
@@ -0,0 +1,236 @@
+"""
+Moduł: Dokładny solver optymalnej strategii Blackjacka (programowanie dynamiczne)
+
+Opis:
+Dla każdego stanu (suma gracza, ręka miękka, karta krupiera) obliczane są dokładne wartości oczekiwane
+akcji "stand" i "hit". Rozkłady końcowej sumy krupiera są liczone raz dla każdej karty krupiera
+(rekurencja z pamięcią) i przechowywane, a wartości stanów gracza liczone są rekurencyjnie z pamięcią.
+Prawdopodobieństwa kart odpowiadają Blackjack.draw_card. Wynikiem jest pełna tabela strategii,
+z której AI korzysta w czasie O(1), bez symulacji w trakcie gry.
+
+Autorzy: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import numpy as np
+
+from simulator import ACTION_HIT, ACTION_STAND, UNIFORM_CARD_PROBS
+
+DEALER_OUTCOMES = 6  # sumy 17, 18, 19, 20, 21 oraz przekroczenie 21
+
+
+def hand_state(hard, has_ace):
+    """
+    Zamienia sumę twardą i flagę asa na (wartość ręki, ręka miękka).
+
+    Args:
+        hard (int): suma kart z asami liczonymi jako 1
+        has_ace (bool): czy ręka zawiera asa
+
+    Returns:
+        tuple: wartość ręki i flaga ręki miękkiej
+    """
+    soft = has_ace and hard <= 11
+    return hard + 10 * soft, soft
+
+
+class StrategyTable:
+    """
+    Tabela strategii z wartościami oczekiwanymi akcji, indeksowana [suma gracza, ręka miękka, karta krupiera].
+    """
+
+    def __init__(self, policy, ev_stand, ev_hit, ev_game=None):
+        """
+        Args:
+            policy (np.ndarray): akcje (22, 2, 11)
+            ev_stand (np.ndarray): wartości oczekiwane akcji "stand"
+            ev_hit (np.ndarray): wartości oczekiwane akcji "hit"
+            ev_game (float): wartość oczekiwana całej gry przy optymalnej strategii
+        """
+        self.policy = policy
+        self.ev_stand = ev_stand
+        self.ev_hit = ev_hit
+        self.ev_game = ev_game
+
+    def action(self, total, soft, upcard):
+        """
+        Zwraca optymalną akcję dla stanu.
+
+        Args:
+            total (int): wartość ręki gracza
+            soft (bool): czy ręka jest miękka
+            upcard (int or str): odkryta karta krupiera ('A' lub 1 oznacza asa)
+
+        Returns:
+            int: 0 - stand, 1 - hit
+        """
+        if total > 21:
+            return ACTION_STAND
+        upcard = 1 if upcard == 'A' else upcard
+        return int(self.policy[total, int(soft), upcard])
+
+    def save(self, path):
+        """Zapisuje tabelę do pliku .npz."""
+        np.savez(path, policy=self.policy, ev_stand=self.ev_stand, ev_hit=self.ev_hit,
+                 ev_game=np.nan if self.ev_game is None else self.ev_game)
+
+    @classmethod
+    def load(cls, path):
+        """Wczytuje tabelę z pliku .npz."""
+        data = np.load(path)
+        ev_game = float(data["ev_game"])
+        return cls(data["policy"], data["ev_stand"], data["ev_hit"], None if np.isnan(ev_game) else ev_game)
+
+
+class StrategySolver:
+    """
+    Solver wartości oczekiwanych metodą programowania dynamicznego.
+    """
+
+    def __init__(self, card_probs=UNIFORM_CARD_PROBS):
+        """
+        Args:
+            card_probs (np.ndarray): prawdopodobieństwa kart 1 (as) .. 10
+        """
+        self.card_probs = [float(p) for p in card_probs]
+        self._dealer_memo = {}
+        self._dealer_final = {}
+        self._value_memo = {}
+
+    def _dealer_from(self, hard, has_ace):
+        key = (hard, has_ace)
+        if key not in self._dealer_memo:
+            value, _ = hand_state(hard, has_ace)
+            distribution = np.zeros(DEALER_OUTCOMES)
+            if value > 21:
+                distribution[-1] = 1.0
+            elif value >= 17:
+                distribution[value - 17] = 1.0
+            else:
+                for card, p in enumerate(self.card_probs, start=1):
+                    distribution += p * self._dealer_from(hard + card, has_ace or card == 1)
+            self._dealer_memo[key] = distribution
+        return self._dealer_memo[key]
+
+    def dealer_distribution(self, upcard):
+        """
+        Zwraca rozkład końcowej sumy krupiera dla odkrytej karty (liczony raz i przechowywany).
+
+        Args:
+            upcard (int): karta krupiera (1 - as)
+
+        Returns:
+            np.ndarray: prawdopodobieństwa sum 17, 18, 19, 20, 21 i przekroczenia 21
+        """
+        if upcard not in self._dealer_final:
+            self._dealer_final[upcard] = self._dealer_from(upcard, upcard == 1)
+        return self._dealer_final[upcard]
+
+    def stand_ev(self, total, upcard):
+        """
+        Wartość oczekiwana akcji "stand" (zasady jak w Blackjack.step: remis przy równych sumach).
+
+        Args:
+            total (int): wartość ręki gracza (<= 21)
+            upcard (int): karta krupiera (1 - as)
+
+        Returns:
+            float: wartość oczekiwana
+        """
+        distribution = self.dealer_distribution(upcard)
+        bust = distribution[-1]
+        if total < 17:
+            return bust - (1.0 - bust)
+        below = distribution[:total - 17].sum()
+        above = distribution[total - 16:-1].sum()
+        return bust + below - above
+
+    def _value(self, hard, has_ace, upcard):
+        """Wartość oczekiwana stanu przy optymalnej grze oraz wartości obu akcji."""
+        key = (hard, has_ace, upcard)
+        if key not in self._value_memo:
+            total, _ = hand_state(hard, has_ace)
+            stand = self.stand_ev(total, upcard)
+            hit = 0.0
+            for card, p in enumerate(self.card_probs, start=1):
+                if hard + card > 21:
+                    hit -= p
+                else:
+                    hit += p * self._value(hard + card, has_ace or card == 1, upcard)[0]
+            self._value_memo[key] = (max(stand, hit), stand, hit)
+        return self._value_memo[key]
+
+    def solve(self):
+        """
+        Oblicza pełną tabelę strategii.
+
+        Returns:
+            StrategyTable: optymalna strategia z wartościami oczekiwanymi akcji
+        """
+        policy = np.zeros((22, 2, 11), dtype=np.uint8)
+        ev_stand = np.full((22, 2, 11), np.nan)
+        ev_hit = np.full((22, 2, 11), np.nan)
+        for upcard in range(1, 11):
+            for hard in range(2, 22):
+                for has_ace in (False, True):
+                    total, soft = hand_state(hard, has_ace)
+                    _, stand, hit = self._value(hard, has_ace, upcard)
+                    ev_stand[total, int(soft), upcard] = stand
+                    ev_hit[total, int(soft), upcard] = hit
+                    policy[total, int(soft), upcard] = ACTION_HIT if hit > stand else ACTION_STAND
+
+        # Wartość całej gry: średnia po dwóch kartach gracza i odkrytej karcie krupiera
+        ev_game = 0.0
+        for first, p1 in enumerate(self.card_probs, start=1):
+            for second, p2 in enumerate(self.card_probs, start=1):
+                for upcard, p3 in enumerate(self.card_probs, start=1):
+                    ev_game += p1 * p2 * p3 * self._value(first + second, first == 1 or second == 1, upcard)[0]
+        return StrategyTable(policy, ev_stand, ev_hit, ev_game)
+
+
+class StrategyAI:
+    """
+    AI grające według gotowej tabeli strategii (decyzja w czasie O(1)).
+    """
+
+    def __init__(self, table=None):
+        """
+        Args:
+            table (StrategyTable): tabela strategii (jeśli None, jest obliczana solverem)
+        """
+        self.table = table or StrategySolver().solve()
+
+    def choose_action(self, env):
+        """
+        Wybiera akcję dla bieżącego stanu gry.
+
+        Args:
+            env (Blackjack): środowisko gry
+
+        Returns:
+            int: 0 - stand, 1 - hit
+        """
+        total, soft = env.get_hand_info(env.player_hand)
+        return self.table.action(total, soft, env.dealer_hand[0])
+
+
+def main():
+    """
+    Oblicza optymalną strategię, wypisuje ją i zapisuje do pliku strategy.npz.
+    """
+    import time
+
+    start = time.perf_counter()
+    table = StrategySolver().solve()
+    print(f"Strategia obliczona w {(time.perf_counter() - start) * 1000:.1f} ms, EV gry = {table.ev_game:+.4f}")
+
+    upcards = ['A'] + [str(card) for card in range(2, 11)]
+    for soft, name in ((0, "Twarde"), (1, "Miękkie")):
+        print(f"\n{name} ręce (H - hit, S - stand), karta krupiera: " + " ".join(f"{u:>2}" for u in upcards))
+        for total in range(12 if soft else 4, 22):
+            row = ["H" if table.policy[total, soft, up] == ACTION_HIT else "S" for up in [1] + list(range(2, 11))]
+            print(f"{total:>2}: " + " ".join(f"{a:>2}" for a in row))
+    table.save("strategy.npz")
+
+
+if __name__ == "__main__":
+    main()
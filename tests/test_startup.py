@@ -0,0 +1,56 @@
+"""
+Startup-time budgets of the project entry points (see benchmarks/startup.py).
+
+Authors: Henryk Mudlaff, Benedykt Borowski
+"""
+
+import pytest
+
+from benchmarks.startup import ENTRY_POINTS, measure, parse_importtime
+
+# Third-party modules imported at startup by each project; entry points without them are skipped
+REQUIREMENTS = {
+    "Game_Of_Knights": [],
+    "HR_comparison": [],
+    "Movie_recommendation": ["numpy", "pandas"],
+    "Lab4": ["numpy", "pandas"],
+    "lab5": ["numpy", "pandas"],
+    "lab6": ["numpy", "cv2"],
+    "lab7_Black_jack": ["numpy", "tkinter"],
+}
+
+# Captured ``python -X importtime -c "import entry"`` output (entry imports json and random)
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       412 |        412 | encodings.utf_8
+import time:       230 |        230 |         _json
+import time:       633 |        863 |       json.scanner
+import time:       560 |      10480 |     json.decoder
+import time:       628 |        628 |     json.encoder
+import time:       337 |      11445 |   json
+import time:       489 |        489 |     warnings
+import time:       282 |        282 |     math
+import time:       167 |        167 |     _random
+import time:       584 |       2042 |   random
+import time:      1624 |      15110 | entry
+"""
+
+
+def test_parse_importtime_reports_entry_module_and_direct_children():
+    total, slowest = parse_importtime(IMPORTTIME_SAMPLE, "entry")
+    assert total == pytest.approx(15.110)
+    assert slowest == [(11.445, "json"), (2.042, "random")]
+
+
+def test_parse_importtime_ignores_other_top_level_modules():
+    assert parse_importtime(IMPORTTIME_SAMPLE, "missing") == (None, [])
+
+
+@pytest.mark.parametrize("directory, module, budget", ENTRY_POINTS,
+                         ids=[f"{directory}/{module}" for directory, module, _ in ENTRY_POINTS])
+def test_entry_point_import_time_within_budget(directory, module, budget):
+    for requirement in REQUIREMENTS[directory]:
+        pytest.importorskip(requirement)
+    result = measure(directory, module)
+    assert result["error"] is None, result["error"]
+    assert result["time_ms"] <= budget, f"{directory}/{module} imports in {result['time_ms']:.0f} ms: {result['slowest']}"